@@ -1,5 +1,4 @@
 import streamlit as st
-import time
 import logging
 from datetime import datetime
 from config import (
@@ -232,12 +231,13 @@ def main():
         
         # Analiz Paneli sekmesi
         with tabs[0]:
-            render_dashboard(
+            follow_dashboard = render_dashboard(
                 symbol=selected_symbol,
                 interval=selected_interval,
                 data_limit=data_limit,
                 selected_indicators=selected_indicators,
-                binance_api=binance_api
+                binance_api=binance_api,
+                live=auto_refresh
             )
         
         # Piyasa Genel Bakış sekmesi
@@ -251,20 +251,16 @@ def main():
                 interval=selected_interval
             )
         
-        # Otomatik yenileme
-        if auto_refresh:
+        # Otomatik yenileme: panel WebSocket akışından gelen mumlarla yerinde güncellenir
+        if auto_refresh and follow_dashboard is not None:
             refresh_seconds = {
+                "1 saniye": 1,
+                "5 saniye": 5,
                 "10 saniye": 10,
-                "30 saniye": 30,
-                "1 dakika": 60,
-                "5 dakika": 300
+                "30 saniye": 30
             }
             
-            seconds = refresh_seconds.get(refresh_interval, 30)
-            
-            st.caption(f"Sayfa {seconds} saniyede bir otomatik olarak yenilenecek.")
-            time.sleep(seconds)
-            st.experimental_rerun()
+            follow_dashboard(refresh_seconds.get(refresh_interval, 1))
     
     except Exception as e:
         logger.error(f"Uygulama çalıştırılırken hata oluştu: {e}")
@@ -0,0 +1,452 @@
+import logging
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+# Loglama ayarları
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+# SignalBatch içinde tutulan ham indikatör değerleri (add_all_indicators sütun adlarıyla)
+SIGNAL_VALUE_COLUMNS = (
+    'close', 'rsi', 'macd', 'macd_diff', 'bb_high', 'bb_low', 'bb_pct', 'ema_9', 'ema_21',
+    'stoch_k', 'stoch_d', 'vwap', 'vwema_5', 'vwema_20', 'bullish_fvg_count', 'bearish_fvg_count'
+)
+
+# SignalBatch içinde tutulan sinyal kodları (-2..2 arası; genel sinyal toplamdır)
+SIGNAL_CODE_COLUMNS = (
+    'rsi_signal', 'macd_signal', 'bb_signal', 'ema_cross_signal', 'stoch_signal', 'vwap_signal',
+    'vwema_cross_signal', 'bullish_bos', 'bearish_bos', 'fvg_signal', 'bos_signal',
+    'fvg_bos_combo_signal', 'overall_signal', 'strong_buy_signal', 'strong_sell_signal'
+)
+
+
+def _ema(frame, periods):
+    """``ta`` kütüphanesindeki EMA ile aynı: ewm(span, min_periods=span, adjust=False)."""
+    return frame.ewm(span=periods, min_periods=periods, adjust=False).mean()
+
+
+def _cross_signal(fast, slow):
+    """Son mum için altın/ölüm çaprazı sinyali (1, -1, 0)."""
+    now_fast, now_slow = fast[-1], slow[-1]
+    prev_fast, prev_slow = fast[-2], slow[-2]
+    return np.where(
+        (now_fast < now_slow) & (prev_fast >= prev_slow), -1,
+        np.where((now_fast > now_slow) & (prev_fast <= prev_slow), 1, 0)
+    )
+
+
+class SignalBatch:
+    """
+    Birden fazla sembolün son mum sinyalleri için sütun tabanlı sonuç.
+
+    Her alan sembollerle aynı sırada tek bir NumPy dizisidir: ham indikatör değerleri float64,
+    sinyal kodları int8 olarak tutulur. Sembol başına sözlük veya biçimlendirilmiş metin üretilmez;
+    görüntüleme biçimi yalnızca arayüzde, gösterilen satırlar için uygulanır.
+    """
+
+    __slots__ = ('symbols', 'values', 'codes')
+
+    def __init__(self, symbols, values, codes):
+        """
+        Args:
+            symbols (list): Sembol listesi
+            values (dict): ``SIGNAL_VALUE_COLUMNS`` -> numpy.ndarray (float64)
+            codes (dict): ``SIGNAL_CODE_COLUMNS`` -> numpy.ndarray (int8)
+        """
+        self.symbols = list(symbols)
+        self.values = values
+        self.codes = codes
+
+    def __len__(self):
+        return len(self.symbols)
+
+    @classmethod
+    def empty(cls):
+        return cls(
+            [],
+            {column: np.empty(0, dtype=np.float64) for column in SIGNAL_VALUE_COLUMNS},
+            {column: np.empty(0, dtype=np.int8) for column in SIGNAL_CODE_COLUMNS}
+        )
+
+    @classmethod
+    def from_last_rows(cls, last_rows):
+        """
+        ``compute_last_rows`` çıktısından (veya indikatörlü DataFrame satırlarından) sonuç oluşturur.
+
+        Eksik indikatör sütunları NaN değer ve 0 sinyal olarak alınır.
+
+        Args:
+            last_rows (pandas.DataFrame): Sembol indeksli indikatör satırları
+        """
+        count = len(last_rows)
+        values = {
+            column: (last_rows[column].to_numpy(dtype=np.float64) if column in last_rows
+                     else np.full(count, np.nan))
+            for column in SIGNAL_VALUE_COLUMNS
+        }
+
+        codes = {}
+        for column in SIGNAL_CODE_COLUMNS:
+            if column in last_rows:
+                codes[column] = last_rows[column].fillna(0).to_numpy().astype(np.int8)
+            else:
+                codes[column] = np.zeros(count, dtype=np.int8)
+
+        if 'vwap_signal' not in last_rows:
+            # get_signals ile aynı kural: kapanış VWAP'ın üzerindeyse 1, altındaysa -1
+            codes['vwap_signal'] = np.nan_to_num(np.sign(values['close'] - values['vwap'])).astype(np.int8)
+
+        return cls(last_rows.index, values, codes)
+
+    @classmethod
+    def concat(cls, batches):
+        """Birden fazla sonucu tek bir sonuçta birleştirir."""
+        batches = [batch for batch in batches if len(batch)]
+        if not batches:
+            return cls.empty()
+        if len(batches) == 1:
+            return batches[0]
+        return cls(
+            [symbol for batch in batches for symbol in batch.symbols],
+            {column: np.concatenate([batch.values[column] for batch in batches]) for column in SIGNAL_VALUE_COLUMNS},
+            {column: np.concatenate([batch.codes[column] for batch in batches]) for column in SIGNAL_CODE_COLUMNS}
+        )
+
+    def to_frame(self):
+        """
+        Sonucu sembol indeksli DataFrame olarak döndürür (sütunlar kopyalanmadan eklenir).
+
+        Returns:
+            pandas.DataFrame: ``SIGNAL_VALUE_COLUMNS`` ve ``SIGNAL_CODE_COLUMNS`` sütunları
+        """
+        return pd.DataFrame(
+            {**self.values, **self.codes},
+            index=pd.Index(self.symbols, name='symbol')
+        )
+
+    def to_signal_dicts(self):
+        """
+        Her sembol için ``get_signals`` formatında sinyal sözlüğü üretir.
+
+        Sözlükler doğrudan tipli sütunlardan kurulur: sinyal kodları int, FVG sayıları tam sayı
+        olarak kalır. Yalnızca eski formatı bekleyen çağıranlar içindir; tablo oluşturmak için
+        ``to_frame`` kullanın.
+
+        Returns:
+            dict: Sembol -> sinyal sözlüğü
+        """
+        values = {column: array.tolist() for column, array in self.values.items()}
+        codes = {column: array.tolist() for column, array in self.codes.items()}
+        return {
+            symbol: _signal_dict(
+                {column: column_values[i] for column, column_values in values.items()},
+                {column: column_codes[i] for column, column_codes in codes.items()}
+            )
+            for i, symbol in enumerate(self.symbols)
+        }
+
+
+def _count(value):
+    """FVG sayısını tam sayıya çevirir (NaN olduğu gibi kalır)."""
+    return value if np.isnan(value) else int(value)
+
+
+def _signal_dict(value, code):
+    """Tek sembolün değer ve kodlarından ``get_signals`` formatında sözlük oluşturur."""
+    combo = code['fvg_bos_combo_signal']
+    if combo == 2:
+        combo_value = "Bullish FVG + Bullish BOS"
+    elif combo == -2:
+        combo_value = "Bearish FVG + Bearish BOS"
+    else:
+        combo_value = "Kombo sinyal yok"
+
+    return {
+        'rsi': {'value': value['rsi'], 'signal': code['rsi_signal']},
+        'macd': {'value': value['macd'], 'signal': code['macd_signal']},
+        'bollinger': {
+            'value': f"Üst: {value['bb_high']:.2f}, Alt: {value['bb_low']:.2f}",
+            'signal': code['bb_signal']
+        },
+        'ema_cross': {
+            'value': f"EMA9: {value['ema_9']:.2f}, EMA21: {value['ema_21']:.2f}",
+            'signal': code['ema_cross_signal']
+        },
+        'stochastic': {
+            'value': f"K: {value['stoch_k']:.2f}, D: {value['stoch_d']:.2f}",
+            'signal': code['stoch_signal']
+        },
+        'vwap': {'value': value['vwap'], 'signal': code['vwap_signal']},
+        'vwema_cross': {
+            'value': f"VWEMA5: {value['vwema_5']:.2f}, VWEMA20: {value['vwema_20']:.2f}",
+            'signal': code['vwema_cross_signal']
+        },
+        'overall': {'value': code['overall_signal'], 'signal': code['overall_signal']},
+        'fvg': {
+            'value': f"Bullish: {_count(value['bullish_fvg_count'])}, Bearish: {_count(value['bearish_fvg_count'])}",
+            'signal': code['fvg_signal']
+        },
+        'bos': {
+            'value': f"Bullish: {'Evet' if code['bullish_bos'] else 'Hayır'}, "
+                     f"Bearish: {'Evet' if code['bearish_bos'] else 'Hayır'}",
+            'signal': code['bos_signal']
+        },
+        'fvg_bos_combo': {'value': combo_value, 'signal': combo},
+    }
+
+
+class BatchIndicators:
+    """
+    Birden fazla sembolün indikatörlerini (sembol × mum) matrisleri üzerinde tek seferde hesaplar.
+
+    Her sembol için ayrı ``TechnicalIndicators`` nesnesi oluşturmak yerine, kapanış/yüksek/düşük/hacim
+    matrisleri eksen boyunca vektörel işlemlerle işlenir. Sonuç, ``add_all_indicators()`` çıktısının
+    son satırıyla aynı sütunları içerir; sinyaller ``SignalBatch`` olarak sütun tabanlı döndürülür.
+
+    Tüm sembollerin mum sayısı aynı olmalıdır; farklı uzunluktaki veriler için
+    ``from_frames`` sembolleri uzunluklarına göre gruplar.
+    """
+
+    def __init__(self, symbols, open, high, low, close, volume):
+        """
+        Args:
+            symbols (list): Sembol listesi (matris satırlarıyla aynı sırada)
+            open (numpy.ndarray): (sembol × mum) açılış fiyatları
+            high (numpy.ndarray): (sembol × mum) en yüksek fiyatlar
+            low (numpy.ndarray): (sembol × mum) en düşük fiyatlar
+            close (numpy.ndarray): (sembol × mum) kapanış fiyatları
+            volume (numpy.ndarray): (sembol × mum) hacimler
+        """
+        self.symbols = list(symbols)
+        self.open = np.asarray(open, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        self.volume = np.asarray(volume, dtype=np.float64)
+
+        if self.close.ndim != 2 or self.close.shape[0] != len(self.symbols):
+            raise ValueError("Fiyat matrisleri (sembol × mum) boyutunda olmalıdır")
+
+    @classmethod
+    def from_frames(cls, frames):
+        """
+        ``get_klines`` DataFrame'lerinden, mum sayısına göre gruplanmış motorlar oluşturur.
+
+        Args:
+            frames (dict): Sembol -> OHLCV DataFrame
+
+        Returns:
+            list: Her mum uzunluğu için bir ``BatchIndicators``
+        """
+        groups = defaultdict(list)
+        for symbol, df in frames.items():
+            if df is not None and len(df) >= 2:
+                groups[len(df)].append(symbol)
+
+        engines = []
+        for symbols in groups.values():
+            matrices = {
+                column: np.vstack([frames[s][column].to_numpy(dtype=np.float64) for s in symbols])
+                for column in PRICE_COLUMNS
+            }
+            engines.append(cls(symbols, **matrices))
+
+        return engines
+
+    def compute_last_rows(self):
+        """
+        Tüm indikatörleri hesaplar ve her sembolün son satırını döndürür.
+
+        Returns:
+            pandas.DataFrame: Sembol indeksli, ``add_all_indicators()`` son satırıyla aynı sütunlar
+        """
+        # Zaman ekseni satırlarda, semboller sütunlarda: pandas rolling/ewm her sütunu tek geçişte işler
+        high = pd.DataFrame(self.high.T)
+        low = pd.DataFrame(self.low.T)
+        close = pd.DataFrame(self.close.T)
+        volume = pd.DataFrame(self.volume.T)
+
+        last = {}
+        last['open'] = self.open[:, -1]
+        last['high'] = self.high[:, -1]
+        last['low'] = self.low[:, -1]
+        last['close'] = self.close[:, -1]
+        last['volume'] = self.volume[:, -1]
+
+        # RSI (Wilder)
+        diff = close.diff(1)
+        up = diff.where(diff > 0, 0.0)
+        down = -diff.where(diff < 0, 0.0)
+        ema_up = up.ewm(alpha=1 / 14, min_periods=14, adjust=False).mean().to_numpy()[-1]
+        ema_down = down.ewm(alpha=1 / 14, min_periods=14, adjust=False).mean().to_numpy()[-1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            last['rsi'] = np.where(ema_down == 0, 100, 100 - (100 / (1 + ema_up / ema_down)))
+
+        # MACD
+        macd = _ema(close, 12) - _ema(close, 26)
+        macd_signal = _ema(macd, 9)
+        last['macd'] = macd.to_numpy()[-1]
+        macd_signal_value = macd_signal.to_numpy()[-1]
+        last['macd_diff'] = last['macd'] - macd_signal_value
+
+        # Bollinger Bands
+        bb_mid = close.rolling(20, min_periods=20).mean().to_numpy()[-1]
+        bb_std = close.rolling(20, min_periods=20).std(ddof=0).to_numpy()[-1]
+        last['bb_high'] = bb_mid + 2 * bb_std
+        last['bb_mid'] = bb_mid
+        last['bb_low'] = bb_mid - 2 * bb_std
+        with np.errstate(divide='ignore', invalid='ignore'):
+            last['bb_width'] = (last['bb_high'] - last['bb_low']) / bb_mid * 100
+            last['bb_pct'] = (last['close'] - last['bb_low']) / (last['bb_high'] - last['bb_low'])
+
+        # EMA
+        emas = {period: _ema(close, period).to_numpy()[-2:] for period in (9, 21, 50)}
+        for period, values in emas.items():
+            last[f'ema_{period}'] = values[-1]
+
+        # Stochastic
+        smin = low.rolling(14, min_periods=14).min()
+        smax = high.rolling(14, min_periods=14).max()
+        stoch_k = 100 * (close - smin) / (smax - smin)
+        stoch_d = stoch_k.rolling(3, min_periods=3).mean()
+        last['stoch_k'] = stoch_k.to_numpy()[-1]
+        last['stoch_d'] = stoch_d.to_numpy()[-1]
+
+        # VWAP
+        typical_price = (high + low + close) / 3.0
+        total_pv = (typical_price * volume).rolling(14, min_periods=14).sum()
+        total_volume = volume.rolling(14, min_periods=14).sum()
+        last['vwap'] = (total_pv / total_volume).to_numpy()[-1]
+
+        # VWEMA (calculate_vwemas ile aynı tohumlama ve özyineleme)
+        vw_price = ((high + low + close) / 3 * volume).to_numpy()
+        vwemas = {}
+        for period in (5, 20):
+            seed = vw_price[:period].sum(axis=0) / self.volume.T[:period].sum(axis=0)
+            if vw_price.shape[0] > period:
+                seeded = np.vstack([seed, vw_price[period:]])
+                smoothed = pd.DataFrame(seeded).ewm(alpha=2 / (period + 1), adjust=False).mean().to_numpy()
+                values = np.vstack([np.tile(seed, (period, 1)), smoothed[1:]])
+            else:
+                values = np.tile(seed, (vw_price.shape[0], 1))
+            vwemas[period] = values[-2:]
+            last[f'vwema_{period}'] = values[-1]
+
+        # FVG: son 6 mumdaki boşluklar (bayrak orta muma yazılır, son mumun bayrağı her zaman False)
+        bullish_flags = np.zeros(self.close.shape, dtype=bool)
+        bearish_flags = np.zeros(self.close.shape, dtype=bool)
+        bullish_flags[:, 1:-1] = self.high[:, :-2] < self.low[:, 2:]
+        bearish_flags[:, 1:-1] = self.low[:, :-2] > self.high[:, 2:]
+        last['bullish_fvg_count'] = bullish_flags[:, -6:].sum(axis=1)
+        last['bearish_fvg_count'] = bearish_flags[:, -6:].sum(axis=1)
+
+        # BOS: son mum önceki 10 mumun en yüksek/en düşük değerini kırıyor mu
+        if self.close.shape[1] > 10:
+            last['bullish_bos'] = self.high[:, -1] > self.high[:, -11:-1].max(axis=1)
+            last['bearish_bos'] = self.low[:, -1] < self.low[:, -11:-1].min(axis=1)
+        else:
+            last['bullish_bos'] = np.zeros(len(self.symbols), dtype=bool)
+            last['bearish_bos'] = np.zeros(len(self.symbols), dtype=bool)
+
+        # Sinyal sütunları (add_signal_columns ile aynı kurallar)
+        rsi = last['rsi']
+        last['rsi_signal'] = np.where(rsi > 70, -1, np.where(rsi < 30, 1, 0))
+
+        last['macd_signal_value'] = macd_signal_value
+        last['macd_signal'] = np.where(
+            last['macd'] < macd_signal_value, -1, np.where(last['macd'] > macd_signal_value, 1, 0)
+        )
+
+        last['bb_signal'] = np.where(
+            last['close'] > last['bb_high'], -1, np.where(last['close'] < last['bb_low'], 1, 0)
+        )
+
+        last['ema_cross_signal'] = _cross_signal(emas[9], emas[21])
+
+        k, d = last['stoch_k'], last['stoch_d']
+        last['stoch_signal'] = np.where(
+            (k > 80) & (d > 80) & (k < d), -1, np.where((k < 20) & (d < 20) & (k > d), 1, 0)
+        )
+
+        last['vwema_cross_signal'] = _cross_signal(vwemas[5], vwemas[20])
+
+        bullish_count, bearish_count = last['bullish_fvg_count'], last['bearish_fvg_count']
+        last['fvg_signal'] = np.where(
+            bearish_count > bullish_count, -1, np.where(bullish_count > bearish_count, 1, 0)
+        )
+
+        last['bos_signal'] = np.where(last['bearish_bos'], -1, np.where(last['bullish_bos'], 1, 0))
+
+        last['fvg_bos_combo_signal'] = np.where(
+            (bearish_count > 0) & last['bearish_bos'], -2,
+            np.where((bullish_count > 0) & last['bullish_bos'], 2, 0)
+        )
+
+        last['overall_signal'] = (
+            last['rsi_signal'] +
+            last['macd_signal'] +
+            last['bb_signal'] +
+            last['ema_cross_signal'] +
+            last['stoch_signal'] +
+            last['vwema_cross_signal'] +
+            last['fvg_signal'] +
+            last['bos_signal'] +
+            last['fvg_bos_combo_signal']
+        )
+
+        last['strong_buy_signal'] = (last['overall_signal'] >= 3).astype(int)
+        last['strong_sell_signal'] = (last['overall_signal'] <= -3).astype(int)
+
+        return pd.DataFrame(last, index=pd.Index(self.symbols, name='symbol'))
+
+    def get_signal_batch(self):
+        """
+        Tüm semboller için son mum sinyallerini hesaplar.
+
+        Returns:
+            SignalBatch: Sütun tabanlı sinyal sonucu (hata durumunda boş)
+        """
+        try:
+            return SignalBatch.from_last_rows(self.compute_last_rows())
+        except Exception as e:
+            logger.error(f"Toplu sinyaller hesaplanırken hata oluştu: {e}")
+            return SignalBatch.empty()
+
+    def get_signals(self):
+        """
+        Her sembol için ``get_signals`` ile aynı sinyal sözlüğünü döndürür.
+
+        Returns:
+            dict: Sembol -> sinyal sözlüğü
+        """
+        return self.get_signal_batch().to_signal_dicts()
+
+
+def compute_signal_batch(frames):
+    """
+    Birden fazla sembolün kline verilerinden son mum sinyallerini sütun tabanlı olarak hesaplar.
+
+    Args:
+        frames (dict): Sembol -> ``get_klines`` DataFrame'i
+
+    Returns:
+        SignalBatch: Tüm sembollerin sinyalleri
+    """
+    return SignalBatch.concat(engine.get_signal_batch() for engine in BatchIndicators.from_frames(frames))
+
+
+def get_batch_signals(frames):
+    """
+    Birden fazla sembolün kline verilerinden son mum sinyallerini toplu olarak hesaplar.
+
+    Args:
+        frames (dict): Sembol -> ``get_klines`` DataFrame'i
+
+    Returns:
+        dict: Sembol -> ``get_signals`` formatında sinyal sözlüğü
+    """
+    return compute_signal_batch(frames).to_signal_dicts()
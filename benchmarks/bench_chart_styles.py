@@ -0,0 +1,78 @@
+"""
+Grafik stil dizileri (hacim ve MACD histogram renkleri) için mikro kıyaslama.
+
+Önceki satır satır yöntem (``iterrows`` ve liste üreteci) ile ``utils.candle_styles``
+5.000 ve 50.000 mum üzerinde karşılaştırılır. Depo kök dizininden çalıştırın:
+
+    python benchmarks/bench_chart_styles.py
+"""
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import candle_styles  # noqa: E402
+
+SIZES = (5_000, 50_000)
+REPEAT = 3
+
+
+def make_frame(count):
+    """MACD sütunlarını içeren örnek mum verisi üretir."""
+    rng = np.random.default_rng(0)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.01, count))
+    open_ = np.r_[close[0], close[:-1]]
+    macd = rng.normal(0, 1, count)
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2023-01-01', periods=count, freq='min'),
+        'open': open_,
+        'close': close,
+        'macd': macd,
+        'macd_signal': macd + rng.normal(0, 0.5, count),
+    })
+
+
+def styles_before(df):
+    """Önceki ``create_candlestick_chart`` döngüleri."""
+    volume_colors = ['green' if row['close'] >= row['open'] else 'red' for _, row in df.iterrows()]
+    histogram_colors = ['green' if val >= 0 else 'red' for val in df['macd'] - df['macd_signal']]
+    histogram = df['macd'] - df['macd_signal']
+    return volume_colors, histogram, histogram_colors
+
+
+def styles_after(df):
+    styles = candle_styles(df, df)
+    return styles['direction'], styles['macd_hist'], styles['macd_hist_direction']
+
+
+def to_colors(direction):
+    """Yön kodlarını grafikteki renk skalasıyla aynı şekilde renk adlarına çevirir."""
+    return np.where(direction == 1, 'green', 'red').tolist()
+
+
+def main():
+    for count in SIZES:
+        df = make_frame(count)
+
+        before = styles_before(df)
+        after = styles_after(df)
+        if (to_colors(after[0]) != before[0] or to_colors(after[2]) != before[2]
+                or not np.array_equal(after[1], before[1].to_numpy())):
+            raise SystemExit("Çıktılar farklı!")
+
+        results = {}
+        for name, function in (("önce", styles_before), ("sonra", styles_after)):
+            number = 1 if name == "önce" else 20
+            seconds = min(timeit.repeat(lambda: function(df), number=number, repeat=REPEAT)) / number
+            results[name] = seconds
+            print(f"{count:>6} mum {name:>6}: {seconds * 1e3:9.2f} ms")
+
+        print(f"{count:>6} mum hızlanma: {results['önce'] / results['sonra']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
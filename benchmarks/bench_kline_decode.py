@@ -0,0 +1,82 @@
+"""
+Kline çözme maliyeti için mikro kıyaslama (1000 mum başına).
+
+Önceki yöntem (string listesinden DataFrame + ``pd.to_numeric``) ile ``kline_decoder``
+karşılaştırılır. Depo kök dizininden çalıştırın:
+
+    python benchmarks/bench_kline_decode.py
+"""
+import json
+import os
+import random
+import sys
+import timeit
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kline_decoder import decode_klines, columns_to_dataframe  # noqa: E402
+
+CANDLES = 1000
+REPEAT = 200
+
+
+def make_payload(count):
+    """Binance ``/api/v3/klines`` biçiminde örnek yanıt gövdesi üretir."""
+    rows = []
+    price = 100.0
+    step = 60_000
+    for i in range(count):
+        open_time = 1_700_000_000_000 + i * step
+        open_price = price
+        price *= 1 + random.uniform(-0.01, 0.01)
+        rows.append([
+            open_time, f"{open_price:.8f}", f"{max(open_price, price) * 1.003:.8f}",
+            f"{min(open_price, price) * 0.997:.8f}", f"{price:.8f}", f"{random.uniform(1, 1000):.8f}",
+            open_time + step - 1, f"{random.uniform(1, 1e5):.8f}", random.randint(1, 1000),
+            f"{random.uniform(1, 500):.8f}", f"{random.uniform(1, 5e4):.8f}", "0"
+        ])
+    return json.dumps(rows, separators=(',', ':')).encode()
+
+
+def decode_before(payload):
+    """Önceki ``get_klines`` dönüşümü."""
+    klines = json.loads(payload)
+    df = pd.DataFrame(klines, columns=[
+        'timestamp', 'open', 'high', 'low', 'close', 'volume',
+        'close_time', 'quote_asset_volume', 'number_of_trades',
+        'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
+    ])
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    df['close_time'] = pd.to_datetime(df['close_time'], unit='ms')
+    numeric_columns = ['open', 'high', 'low', 'close', 'volume',
+                       'quote_asset_volume', 'taker_buy_base_asset_volume',
+                       'taker_buy_quote_asset_volume']
+    df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric)
+    return df
+
+
+def decode_after(payload):
+    return columns_to_dataframe(decode_klines(payload))
+
+
+def main():
+    payload = make_payload(CANDLES)
+
+    before = decode_before(payload)
+    after = decode_after(payload)
+    if not after.equals(before.drop(columns='ignore')):
+        raise SystemExit("Çıktılar farklı!")
+
+    results = {}
+    for name, function in (("önce", decode_before), ("sonra", decode_after)):
+        seconds = min(timeit.repeat(lambda: function(payload), number=REPEAT, repeat=3)) / REPEAT
+        results[name] = seconds
+        print(f"{name:>6}: {seconds * 1e6:8.0f} µs / {CANDLES} mum")
+
+    print(f"hızlanma: {results['önce'] / results['sonra']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,27 +3,397 @@ import numpy as np
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
 import logging
+import random
 import time
-from config import BINANCE_API_KEY, BINANCE_API_SECRET
+import threading
+from collections import OrderedDict
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from config import (
+    BINANCE_API_KEY, BINANCE_API_SECRET, BINANCE_API_URL,
+    REQUEST_WEIGHT_LIMIT, REQUEST_MAX_RETRIES, REQUEST_BACKOFF_BASE, KLINE_FETCH_WORKERS,
+    KLINE_STORE_PATH, KLINE_STORE_MAX_CANDLES, HTTP_TIMEOUT, HTTP_POOL_SIZE, RESPONSE_CACHE_MAX_ENTRIES
+)
+from kline_store import KlineStore, INTERVAL_MS, MAX_KLINES_PER_REQUEST
+from ticker_stream import get_ticker_feed
+from kline_decoder import (
+    KLINE_FIELDS, INT_FIELDS, decode_klines, columns_to_dataframe, klines_to_dataframe
+)
 
 # Loglama ayarları
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Uç noktaların istek ağırlıkları (GET /api/v3/...)
+ENDPOINT_WEIGHTS = {
+    'klines': 2,
+    'exchangeInfo': 20,
+    'ticker/price': 4,
+    'ticker/24hr': 80,
+    'account': 20,
+    'historicalTrades': 25,
+}
+
+# GET /api/v3/klines istek ağırlığı
+KLINES_REQUEST_WEIGHT = ENDPOINT_WEIGHTS['klines']
+
+# Önbelleğe alınan uç noktaların süreleri (saniye): (taze, taze süre dolduktan sonra bayat sunulabileceği ek süre)
+CACHE_TTLS = {
+    'exchangeInfo': (3600, 23 * 3600),
+    'ticker/24hr': (30, 300),
+    'ticker/price': (5, 30),
+}
+
+# Tekrar denenecek HTTP durum kodları (429: limit aşıldı, 418: IP engellendi, 5xx: sunucu hatası)
+RETRYABLE_STATUS_CODES = {429, 418, 500, 502, 503, 504}
+
+def order_book_weight(limit):
+    """GET /api/v3/depth isteğinin ağırlığı, ``limit`` değerine göre artar."""
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 25
+    if limit <= 1000:
+        return 50
+    return 250
+
+class RateLimiter:
+    """
+    Dakikalık istek ağırlığı için token bucket.
+    
+    Kova dakikalık limit kadar ağırlık taşır ve saniyede ``limit / 60`` hızla dolar; her istek
+    uç noktasının ağırlığı kadar token harcar. Binance'in döndürdüğü ``X-MBX-USED-WEIGHT-1M``
+    başlığı ile kova sunucunun gördüğü kullanıma göre düzeltilir, 429/418 yanıtlarında ise
+    ``Retry-After`` süresi boyunca tüm istekler durdurulur. Tüm thread'ler aynı kovayı paylaşır.
+    """
+    
+    def __init__(self, limit_per_minute):
+        self.limit = limit_per_minute
+        self.rate = limit_per_minute / 60.0
+        self._lock = threading.Lock()
+        self._tokens = float(limit_per_minute)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self.used_weight = 0
+        self.total_wait = 0.0
+        self.wait_count = 0
+        self.last_wait = 0.0
+        self.retry_count = 0
+    
+    def _refill(self, now):
+        self._tokens = min(self.limit, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def acquire(self, weight):
+        """
+        Verilen ağırlık için kovadan token alır, gerekirse bekler.
+        
+        Returns:
+            float: Beklenen süre (saniye)
+        """
+        weight = min(weight, self.limit)
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= weight:
+                    self._tokens -= weight
+                    break
+                wait = max(self._paused_until - now, (weight - self._tokens) / self.rate)
+            time.sleep(wait)
+        
+        waited = time.monotonic() - start
+        if waited > 0.001:
+            with self._lock:
+                self.total_wait += waited
+                self.wait_count += 1
+                self.last_wait = waited
+            logger.debug(f"İstek ağırlığı limiti nedeniyle {waited:.2f} saniye beklendi.")
+        return waited
+    
+    def observe(self, used_weight):
+        """Sunucunun bildirdiği dakikalık kullanılmış ağırlığa göre kovayı düzeltir."""
+        with self._lock:
+            self.used_weight = used_weight
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, float(self.limit - used_weight))
+    
+    def pause(self, seconds):
+        """Tüm istekleri verilen süre boyunca durdurur."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+    
+    def record_retry(self):
+        with self._lock:
+            self.retry_count += 1
+    
+    def stats(self):
+        """
+        Limitleyici durumunu döndürür.
+        
+        Returns:
+            dict: Kullanılan/kalan ağırlık, bekleme süreleri ve tekrar deneme sayısı
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                'limit': self.limit,
+                'used_weight': self.used_weight,
+                'available_weight': max(0.0, self._tokens),
+                'paused_for': max(0.0, self._paused_until - now),
+                'total_wait': self.total_wait,
+                'wait_count': self.wait_count,
+                'last_wait': self.last_wait,
+                'retry_count': self.retry_count,
+            }
+
+# Süreç genelinde paylaşılan istek limitleyici
+rate_limiter = RateLimiter(REQUEST_WEIGHT_LIMIT)
+
+class _CacheEntry:
+    __slots__ = ('value', 'loaded_at', 'refreshing')
+    
+    def __init__(self, value):
+        self.value = value
+        self.loaded_at = time.monotonic()
+        self.refreshing = False
+
+class TTLCache:
+    """
+    Uç nokta başına süreli, boyut sınırlı yanıt önbelleği.
+    
+    Değerler ``ttl`` süresince taze kabul edilir. Süresi dolmuş ama ``stale_ttl`` içinde kalan
+    değerler beklemeden döndürülür ve arka planda yenilenir (stale-while-revalidate). En fazla
+    ``max_entries`` kayıt tutulur; en uzun süredir kullanılmayan kayıt çıkarılır. Önbellekteki
+    nesneler paylaşıldığı için çağıranlar tarafından değiştirilmemelidir.
+    """
+    
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+    
+    def get_or_load(self, key, loader, ttl, stale_ttl=0):
+        """
+        Anahtarın değerini önbellekten döndürür, yoksa ``loader`` ile yükler.
+        
+        Args:
+            key (tuple): Önbellek anahtarı
+            loader (callable): Değeri yükleyen fonksiyon (hata fırlatırsa değer saklanmaz)
+            ttl (float): Taze kalma süresi (saniye)
+            stale_ttl (float): Arka planda yenilenirken bayat değerin sunulabileceği ek süre
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = time.monotonic() - entry.loaded_at
+                if age < ttl + stale_ttl:
+                    self._entries.move_to_end(key)
+                    if age < ttl:
+                        self.hits += 1
+                    else:
+                        self.stale_hits += 1
+                        if not entry.refreshing:
+                            entry.refreshing = True
+                            threading.Thread(target=self._refresh, args=(key, loader), daemon=True).start()
+                    return entry.value
+            self.misses += 1
+        
+        value = loader()
+        self._store(key, value)
+        return value
+    
+    def _refresh(self, key, loader):
+        try:
+            self._store(key, loader())
+        except Exception as e:
+            logger.warning(f"Önbellek kaydı yenilenemedi ({key[0]}): {e}")
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refreshing = False
+    
+    def _store(self, key, value):
+        with self._lock:
+            self._entries[key] = _CacheEntry(value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, key=None):
+        """Verilen kaydı veya (anahtar verilmezse) tüm önbelleği temizler."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+    
+    def stats(self):
+        """Önbellek boyutunu ve isabet sayılarını döndürür."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+            }
+
+# Süreç genelinde paylaşılan yanıt önbelleği
+response_cache = TTLCache(RESPONSE_CACHE_MAX_ENTRIES)
+
+def _retry_after(response):
+    """Yanıttaki ``Retry-After`` başlığını saniye olarak döndürür."""
+    try:
+        return float(response.headers.get('Retry-After', 0))
+    except (AttributeError, TypeError, ValueError):
+        return 0.0
+
+def _observe_response(response, *args, **kwargs):
+    """requests yanıt kancası: ağırlık başlıklarını ve limit yanıtlarını limitleyiciye iletir."""
+    used_weight = response.headers.get('X-MBX-USED-WEIGHT-1M')
+    if used_weight is not None:
+        try:
+            rate_limiter.observe(int(used_weight))
+        except ValueError:
+            pass
+    
+    if response.status_code in (429, 418):
+        rate_limiter.pause(_retry_after(response) or REQUEST_BACKOFF_BASE)
+    return response
+
+def _to_milliseconds(value):
+    """Milisaniye, datetime, pandas.Timestamp veya tarih metnini UTC milisaniyeye dönüştürür."""
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert('UTC').tz_localize(None)
+    return int(timestamp.value // 1_000_000)
+
+_kline_store = None
+_kline_store_lock = threading.Lock()
+
+def get_kline_store():
+    """Süreç genelinde paylaşılan yerel mum deposunu döndürür (``KLINE_STORE_PATH`` boşsa None)."""
+    global _kline_store
+    if not KLINE_STORE_PATH:
+        return None
+    
+    with _kline_store_lock:
+        if _kline_store is None:
+            try:
+                _kline_store = KlineStore(KLINE_STORE_PATH, max_candles=KLINE_STORE_MAX_CANDLES)
+            except Exception as e:
+                logger.error(f"Mum deposu açılamadı, veriler doğrudan ağdan alınacak: {e}")
+                return None
+        return _kline_store
+
+class _Client(Client):
+    """
+    Süreç genelinde paylaşılmak üzere ayarlanmış Binance istemcisi.
+    
+    İsteğe bağlı olarak farklı bir REST adresi kullanır, eşzamanlı isteklere yetecek büyüklükte
+    kalıcı (keep-alive) bağlantı havuzu ve açık zaman aşımı ile çalışır.
+    """
+    API_URL = BINANCE_API_URL or Client.API_URL
+    REQUEST_TIMEOUT = HTTP_TIMEOUT
+    
+    def _init_session(self):
+        session = super()._init_session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _request(self, method, uri, signed, force_params=False, raw=False, **kwargs):
+        # Thread'ler self.response'u birbirinin üzerine yazabileceği için yanıt yerel değişkenden işlenir
+        kwargs = self._get_request_kwargs(method, signed, force_params, **kwargs)
+        response = getattr(self.session, method)(uri, **kwargs)
+        self.response = response
+        if raw:
+            if not (200 <= response.status_code < 300):
+                raise BinanceAPIException(response, response.status_code, response.text)
+            return response.content
+        return self._handle_response(response)
+    
+    def get_klines_raw(self, **params):
+        """``get_klines`` ile aynı istek; yanıt JSON'a çözülmeden ham bayt olarak döndürülür."""
+        return self._get('klines', data=params, version=self.PRIVATE_API_VERSION, raw=True)
+
 class BinanceAPI:
     def __init__(self):
         """Binance API istemcisini başlatır."""
+        self.kline_store = get_kline_store()
         try:
-            self.client = Client(BINANCE_API_KEY, BINANCE_API_SECRET)
+            self.client = _Client(BINANCE_API_KEY, BINANCE_API_SECRET)
+            self.client.session.hooks['response'].append(_observe_response)
             logger.info("Binance API bağlantısı başarılı.")
         except Exception as e:
             logger.error(f"Binance API bağlantısı başarısız: {e}")
             self.client = None
 
+    def _call(self, weight, method, **params):
+        """
+        İstemci metodunu istek limitleyici ve tekrar deneme katmanı üzerinden çağırır.
+        
+        429/418, 5xx ve bağlantı hatalarında istek, ``Retry-After`` süresine ve jitter'lı
+        üstel geri çekilmeye göre bekleyip en fazla ``REQUEST_MAX_RETRIES`` kez tekrarlanır.
+        Son denemedeki hata çağırana iletilir.
+        
+        Args:
+            weight (int): Uç noktanın istek ağırlığı
+            method (callable): ``Client`` metodu
+            **params: Metoda iletilecek parametreler
+        """
+        for attempt in range(REQUEST_MAX_RETRIES + 1):
+            rate_limiter.acquire(weight)
+            try:
+                return method(**params)
+            except BinanceAPIException as e:
+                if e.status_code not in RETRYABLE_STATUS_CODES or attempt == REQUEST_MAX_RETRIES:
+                    raise
+                retry_after = _retry_after(e.response)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt == REQUEST_MAX_RETRIES:
+                    raise
+                retry_after = 0.0
+            
+            delay = max(retry_after, random.uniform(0.5, 1.0) * REQUEST_BACKOFF_BASE * 2 ** attempt)
+            rate_limiter.record_retry()
+            logger.warning(f"{method.__name__} isteği başarısız, {delay:.1f} saniye sonra tekrar denenecek "
+                           f"({attempt + 1}/{REQUEST_MAX_RETRIES}).")
+            time.sleep(delay)
+
+    def _cached_call(self, endpoint, method, **params):
+        """
+        ``_call`` sonucunu uç noktanın ``CACHE_TTLS`` süreleriyle paylaşılan önbellekte tutar.
+        
+        Args:
+            endpoint (str): ``CACHE_TTLS`` ve ``ENDPOINT_WEIGHTS`` anahtarı
+            method (callable): ``Client`` metodu
+            **params: Metoda iletilecek parametreler
+        """
+        ttl, stale_ttl = CACHE_TTLS[endpoint]
+        key = (endpoint, tuple(sorted(params.items())))
+        return response_cache.get_or_load(
+            key, lambda: self._call(ENDPOINT_WEIGHTS[endpoint], method, **params), ttl, stale_ttl
+        )
+
+    def rate_limit_stats(self):
+        """Paylaşılan istek limitleyicinin durumunu döndürür (bkz. ``RateLimiter.stats``)."""
+        return rate_limiter.stats()
+
     def get_all_symbols(self):
         """Tüm kripto para çiftlerini getirir."""
         try:
-            exchange_info = self.client.get_exchange_info()
+            exchange_info = self._cached_call('exchangeInfo', self.client.get_exchange_info)
             symbols = [s['symbol'] for s in exchange_info['symbols'] if s['quoteAsset'] == 'USDT']
             return sorted(symbols)
         except BinanceAPIException as e:
@@ -33,45 +403,154 @@ class BinanceAPI:
             logger.error(f"Beklenmeyen hata: {e}")
             return []
 
+    def _fetch_klines(self, **params):
+        """
+        Kline verilerini ağdan alır ve tipli sütunlara çözer (``Client.get_klines`` parametreleri).
+        
+        Returns:
+            dict: Alan adı -> numpy.ndarray (bkz. ``kline_decoder.decode_klines``)
+        """
+        payload = self._call(KLINES_REQUEST_WEIGHT, self.client.get_klines_raw, **params)
+        return decode_klines(payload)
+
     def get_klines(self, symbol, interval, limit=500):
-        """Belirli bir sembol ve zaman aralığı için kline verilerini getirir."""
+        """
+        Belirli bir sembol ve zaman aralığı için kline verilerini getirir.
+        
+        Yerel mum deposu etkinse yalnızca son kayıtlı mumdan sonraki veriler ağdan alınır.
+        """
         try:
-            klines = self.client.get_klines(symbol=symbol, interval=interval, limit=limit)
+            if limit > MAX_KLINES_PER_REQUEST and interval in INTERVAL_MS:
+                # Tek istek sınırını aşan veriler sayfalanarak alınır
+                start_time = int(time.time() * 1000) - limit * INTERVAL_MS[interval]
+                df = self.get_historical_klines(symbol, interval, start_time)
+                return df.tail(limit).reset_index(drop=True)
             
-            # Verileri DataFrame'e dönüştür
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_asset_volume', 'number_of_trades',
-                'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-            ])
+            if self.kline_store is not None and interval in INTERVAL_MS:
+                klines = self.kline_store.sync(self._fetch_klines, symbol, interval, limit)
+            else:
+                klines = self._fetch_klines(symbol=symbol, interval=interval, limit=limit)
+            
+            return columns_to_dataframe(klines)
+        except BinanceAPIException as e:
+            logger.error(f"{symbol} için kline verileri alınırken hata oluştu: {e}")
+            return pd.DataFrame()
+        except Exception as e:
+            logger.error(f"Beklenmeyen hata: {e}")
+            return pd.DataFrame()
+
+    def get_historical_klines(self, symbol, interval, start_time, end_time=None, max_workers=KLINE_FETCH_WORKERS):
+        """
+        Verilen zaman aralığındaki tüm kline verilerini sayfalayarak getirir.
+        
+        Aralık ``MAX_KLINES_PER_REQUEST`` mumluk pencerelere bölünür ve pencereler sınırlı sayıda
+        thread ile eşzamanlı olarak (istek limitleyicisi üzerinden) alınır. Her sayfa geldiği anda
+        önceden ayrılmış sütun dizilerine açılış zamanına göre yerleştirilir; böylece sayfa
+        sınırlarındaki tekrarlar kendiliğinden ayıklanır ve bellekte yalnızca uçuştaki sayfalar tutulur.
+        
+        Args:
+            symbol (str): Sembol
+            interval (str): Zaman aralığı ('1M' hariç)
+            start_time: Başlangıç (milisaniye, datetime veya tarih metni, UTC)
+            end_time: Bitiş (varsayılan: şimdi)
+            max_workers (int): Eşzamanlı istek sayısı
+        
+        Returns:
+            pandas.DataFrame: ``get_klines`` ile aynı sütunlar, eskiden yeniye sıralı
+        """
+        try:
+            step = INTERVAL_MS[interval]
+            start = _to_milliseconds(start_time)
+            end = int(time.time() * 1000) if end_time is None else _to_milliseconds(end_time)
+            if end < start:
+                return klines_to_dataframe([])
+            
+            size = (end - start) // step + 1
+            page_span = MAX_KLINES_PER_REQUEST * step
+            
+            columns = {
+                field: np.empty(size, dtype=np.int64 if field in INT_FIELDS else np.float64)
+                for field in KLINE_FIELDS
+            }
+            filled = np.zeros(size, dtype=bool)
             
-            # Veri tiplerini dönüştür
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df['close_time'] = pd.to_datetime(df['close_time'], unit='ms')
+            def fill(page):
+                times = page['open_time']
+                valid = (times >= start) & (times <= end)
+                index = (times[valid] - start) // step
+                for field, values in page.items():
+                    columns[field][index] = values[valid]
+                filled[index] = True
             
-            numeric_columns = ['open', 'high', 'low', 'close', 'volume', 
-                              'quote_asset_volume', 'taker_buy_base_asset_volume', 
-                              'taker_buy_quote_asset_volume']
+            def fetch_page(page_start):
+                return self._fetch_klines(symbol=symbol, interval=interval, startTime=page_start,
+                                          endTime=min(page_start + page_span - 1, end),
+                                          limit=MAX_KLINES_PER_REQUEST)
             
-            df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric)
+            page_starts = iter(range(start, end + 1, page_span))
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                # Uçuştaki sayfa sayısını sınırla; biri tamamlandıkça sıradaki pencere gönderilir
+                pending = {executor.submit(fetch_page, page_start)
+                           for _, page_start in zip(range(2 * max(1, max_workers)), page_starts)}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        fill(future.result())
+                        page_start = next(page_starts, None)
+                        if page_start is not None:
+                            pending.add(executor.submit(fetch_page, page_start))
             
-            return df
+            # Eksik mum yoksa maske kopyası oluşturma
+            if filled.all():
+                filled = slice(None)
+            
+            return columns_to_dataframe({field: values[filled] for field, values in columns.items()})
         except BinanceAPIException as e:
-            logger.error(f"{symbol} için kline verileri alınırken hata oluştu: {e}")
+            logger.error(f"{symbol} için geçmiş kline verileri alınırken hata oluştu: {e}")
             return pd.DataFrame()
         except Exception as e:
             logger.error(f"Beklenmeyen hata: {e}")
             return pd.DataFrame()
 
+    def iter_klines(self, symbols, interval, limit=500, max_workers=KLINE_FETCH_WORKERS):
+        """
+        Birden fazla sembolün kline verilerini eşzamanlı olarak getirir.
+        
+        İstekler sınırlı sayıda thread ile paralel yürütülür ve sonuçlar tamamlandıkça
+        döndürülür. Tüm istekler ortak istek limitleyicisini kullanır.
+        
+        Args:
+            symbols (list): Sembol listesi
+            interval (str): Zaman aralığı
+            limit (int): Sembol başına mum sayısı
+            max_workers (int): Eşzamanlı istek sayısı
+        
+        Yields:
+            tuple: (sembol, pandas.DataFrame) - veri alınamazsa boş DataFrame
+        
+        Üreteç erken kapatılırsa (ör. Streamlit betiği tarama sırasında durdurursa) sıradaki
+        istekler iptal edilir; yalnızca o anda çalışan istekler tamamlanır ve beklenmez.
+        """
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        try:
+            futures = {
+                executor.submit(self.get_klines, symbol, interval, limit): symbol
+                for symbol in symbols
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def get_ticker_prices(self, symbols=None):
         """Belirli sembollerin güncel fiyatlarını getirir."""
         try:
             if symbols:
-                prices = self.client.get_all_tickers()
+                prices = self._cached_call('ticker/price', self.client.get_all_tickers)
                 filtered_prices = [price for price in prices if price['symbol'] in symbols]
                 return filtered_prices
             else:
-                return self.client.get_all_tickers()
+                return self._cached_call('ticker/price', self.client.get_all_tickers)
         except BinanceAPIException as e:
             logger.error(f"Fiyat bilgileri alınırken hata oluştu: {e}")
             return []
@@ -82,7 +561,7 @@ class BinanceAPI:
     def get_account_info(self):
         """Hesap bilgilerini getirir."""
         try:
-            return self.client.get_account()
+            return self._call(ENDPOINT_WEIGHTS['account'], self.client.get_account)
         except BinanceAPIException as e:
             logger.error(f"Hesap bilgileri alınırken hata oluştu: {e}")
             return {}
@@ -91,9 +570,13 @@ class BinanceAPI:
             return {}
 
     def get_symbol_info(self, symbol):
-        """Belirli bir sembol hakkında detaylı bilgi getirir."""
+        """Belirli bir sembol hakkında detaylı bilgi getirir (önbellekteki borsa bilgisinden)."""
         try:
-            return self.client.get_symbol_info(symbol)
+            exchange_info = self._cached_call('exchangeInfo', self.client.get_exchange_info)
+            for item in exchange_info['symbols']:
+                if item['symbol'] == symbol.upper():
+                    return item
+            return None
         except BinanceAPIException as e:
             logger.error(f"{symbol} bilgileri alınırken hata oluştu: {e}")
             return {}
@@ -104,7 +587,8 @@ class BinanceAPI:
     def get_historical_trades(self, symbol, limit=500):
         """Belirli bir sembol için geçmiş işlemleri getirir."""
         try:
-            return self.client.get_historical_trades(symbol=symbol, limit=limit)
+            return self._call(ENDPOINT_WEIGHTS['historicalTrades'], self.client.get_historical_trades,
+                              symbol=symbol, limit=limit)
         except BinanceAPIException as e:
             logger.error(f"{symbol} için geçmiş işlemler alınırken hata oluştu: {e}")
             return []
@@ -116,7 +600,7 @@ class BinanceAPI:
         """İşlem hacmine göre en yüksek sembolleri getirir."""
         try:
             # 24 saatlik istatistikleri al
-            tickers = self.client.get_ticker()
+            tickers = self._cached_call('ticker/24hr', self.client.get_ticker)
             
             # USDT çiftlerini filtrele
             usdt_tickers = [t for t in tickers if t['symbol'].endswith(quote_asset)]
@@ -133,13 +617,47 @@ class BinanceAPI:
             logger.error(f"Beklenmeyen hata: {e}")
             return []
 
+    def get_top_symbols_live(self, limit=10):
+        """
+        İşlem hacmine göre en yüksek USDT sembollerini paylaşılan ``!ticker@arr`` akışından getirir.
+        
+        Akış süreç genelinde bir kez başlatılır ve tablo ilk açılışta ``get_top_symbols_by_volume``
+        ile doldurulur; sonraki çağrılar REST isteği yapmaz.
+        """
+        try:
+            feed = get_ticker_feed(seed=lambda: self.get_top_symbols_by_volume(limit=None))
+            return feed.top_by_volume(limit)
+        except Exception as e:
+            logger.error(f"Beklenmeyen hata: {e}")
+            return []
+
     def get_market_depth(self, symbol, limit=100):
         """Belirli bir sembol için emir defterini getirir."""
         try:
-            return self.client.get_order_book(symbol=symbol, limit=limit)
+            return self._call(order_book_weight(limit), self.client.get_order_book,
+                              symbol=symbol, limit=limit)
         except BinanceAPIException as e:
             logger.error(f"{symbol} için emir defteri alınırken hata oluştu: {e}")
             return {}
         except Exception as e:
             logger.error(f"Beklenmeyen hata: {e}")
-            return {}
\ No newline at end of file
+            return {}
+
+_binance_api = None
+_binance_api_lock = threading.Lock()
+
+def get_binance_api():
+    """
+    Süreç genelinde paylaşılan ``BinanceAPI`` nesnesini döndürür.
+    
+    İstemci ve bağlantı havuzu tüm oturumlar ve yeniden çalıştırmalar arasında paylaşılır.
+    Bağlantı kurulamazsa nesne saklanmaz; sonraki çağrı yeniden dener.
+    """
+    global _binance_api
+    with _binance_api_lock:
+        if _binance_api is None:
+            binance_api = BinanceAPI()
+            if binance_api.client is None:
+                return binance_api
+            _binance_api = binance_api
+        return _binance_api
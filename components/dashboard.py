@@ -4,15 +4,18 @@ import numpy as np
 import plotly.graph_objects as go
 from datetime import datetime
 import time
-from indicators import TechnicalIndicators, get_signals
-from utils import create_candlestick_chart, format_number, get_signal_emoji
+from config import COMPACT_FRAMES
+from indicators import get_signals, compact_frame
+from kline_stream import get_kline_stream
+from market_refresher import get_market_refresher
+from utils import ChartCache, format_number, get_signal_emoji
 import logging
 
 # Loglama ayarları
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def render_dashboard(symbol, interval, data_limit, selected_indicators, binance_api):
+def render_dashboard(symbol, interval, data_limit, selected_indicators, binance_api, live=False):
     """
     Ana dashboard'u oluşturur.
     
@@ -22,33 +25,36 @@ def render_dashboard(symbol, interval, data_limit, selected_indicators, binance_
         data_limit (int): Veri sayısı limiti
         selected_indicators (list): Seçilen indikatörler
         binance_api (BinanceAPI): Binance API nesnesi
+        live (bool): True ise mumlar WebSocket akışından okunur
+    
+    Returns:
+        callable: Canlı modda, paneli akıştan gelen mumlarla güncelleyen döngü
+            (``follow(refresh_seconds)``); aksi halde None
     """
     try:
         st.title(f"📊 {symbol} Analiz Paneli")
         
         # Veri yükleme göstergesi
         with st.spinner(f"{symbol} verileri yükleniyor..."):
-            # Kline verilerini al
-            df = binance_api.get_klines(symbol=symbol, interval=interval, limit=data_limit)
+            if live:
+                # Paylaşılan WebSocket akışı; ilk açılışta geçmiş mumlar REST ile yüklenir
+                stream = get_kline_stream(
+                    symbol, interval, data_limit,
+                    seed=lambda: binance_api.get_klines(symbol=symbol, interval=interval, limit=data_limit)
+                )
+                df_with_indicators = _live_frame(stream, data_limit, selected_indicators)
+                updated_at = None
+            else:
+                # Arka planda yenilenen son anlık görüntü (mumlar ve indikatörler hazır)
+                snapshot = get_market_refresher().get_snapshot(
+                    symbol, interval, data_limit, selected_indicators
+                )
+                df_with_indicators = snapshot.frame if snapshot is not None else None
+                updated_at = snapshot.updated_at if snapshot is not None else None
             
-            if df.empty:
+            if df_with_indicators is None or df_with_indicators.empty:
                 st.error(f"{symbol} için veri alınamadı. Lütfen başka bir sembol seçin.")
-                return
-            
-            # Teknik indikatörleri hesapla
-            indicators = TechnicalIndicators(df)
-            df_with_indicators = indicators.add_all_indicators()
-            
-            # Son fiyat bilgisini al
-            last_price = df_with_indicators['close'].iloc[-1]
-            previous_price = df_with_indicators['close'].iloc[-2]
-            price_change = ((last_price - previous_price) / previous_price) * 100
-            
-            # Fiyat değişim rengi
-            price_color = "green" if price_change >= 0 else "red"
-            
-            # Sinyalleri al
-            signals = get_signals(df_with_indicators)
+                return None
         
         # Analiz paneli stilini uygula
         st.markdown("""
@@ -173,160 +179,236 @@ def render_dashboard(symbol, interval, data_limit, selected_indicators, binance_
         </style>
         """, unsafe_allow_html=True)
         
-        # Metrik kartları için container
-        st.markdown('<div class="metric-row">', unsafe_allow_html=True)
-        
-        # Son Fiyat kartı
-        price_change_class = "positive" if price_change >= 0 else "negative"
-        price_change_icon = "↑" if price_change >= 0 else "↓"
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-title">SON FİYAT</div>
-            <div class="metric-value">${format_number(last_price, 4)}</div>
-            <div class="metric-change {price_change_class}">
-                {price_change_icon} {format_number(price_change, 2)}%
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Genel Sinyal kartı
-        overall_signal = signals['overall']['signal']
-        
-        # Sinyal değerini string'e çevir ve emoji al
-        overall_signal_str = str(overall_signal)
-        overall_emoji = get_signal_emoji(overall_signal)
         
-        # Değeri al ve sınıf belirle
-        try:
-            overall_value = signals['overall']['value'] if signals['overall']['value'] is not None else 0
-            overall_class = "positive" if overall_value > 0 else "negative" if overall_value < 0 else "neutral"
-        except Exception:
-            overall_value = 0
-            overall_class = "neutral"
+        # Panel, canlı modda yerinde yeniden çizilebilmesi için tek bir yer tutucuda
+        panel = st.empty()
+        with panel.container():
+            _render_panel(df_with_indicators, symbol, interval, selected_indicators, updated_at)
         
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-title">GENEL SİNYAL</div>
-            <div class="metric-value">{overall_signal_str} {overall_emoji}</div>
-            <div class="metric-change {overall_class}">
-                Değer: {overall_value}
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Grafik
-        fig = create_candlestick_chart(df_with_indicators, symbol, selected_indicators)
-        st.plotly_chart(fig, use_container_width=True, theme="streamlit")
-        
-        # Sinyal tablosu
-        st.subheader("📋 Teknik Analiz Sinyalleri")
-        
-        # Sinyal tablosunu oluştur
-        indicators_list = ["RSI", "MACD", "Bollinger Bands", "EMA Çaprazlama", "Stochastic", "VWAP", "VWEMA Çaprazlama"]
-        values = [
-            str(signals['rsi']['value']) if signals['rsi']['value'] is not None else "N/A",
-            str(signals['macd']['value']) if signals['macd']['value'] is not None else "N/A",
-            str(signals['bollinger']['value']) if signals['bollinger']['value'] is not None else "N/A",
-            str(signals['ema_cross']['value']) if signals['ema_cross']['value'] is not None else "N/A",
-            str(signals['stochastic']['value']) if signals['stochastic']['value'] is not None else "N/A",
-            str(signals['vwap']['value']) if signals['vwap']['value'] is not None else "N/A",
-            str(signals['vwema_cross']['value']) if signals['vwema_cross']['value'] is not None else "N/A"
-        ]
-        signal_texts = [
-            f"{signals['rsi']['signal']} {get_signal_emoji(signals['rsi']['signal'])}",
-            f"{signals['macd']['signal']} {get_signal_emoji(signals['macd']['signal'])}",
-            f"{signals['bollinger']['signal']} {get_signal_emoji(signals['bollinger']['signal'])}",
-            f"{signals['ema_cross']['signal']} {get_signal_emoji(signals['ema_cross']['signal'])}",
-            f"{signals['stochastic']['signal']} {get_signal_emoji(signals['stochastic']['signal'])}",
-            f"{signals['vwap']['signal']} {get_signal_emoji(signals['vwap']['signal'])}",
-            f"{signals['vwema_cross']['signal']} {get_signal_emoji(signals['vwema_cross']['signal'])}"
-        ]
-        
-        # Genel sinyali ekle
-        indicators_list.append("Genel Sinyal")
-        values.append(str(signals['overall']['value']) if signals['overall']['value'] is not None else "N/A")
-        signal_texts.append(f"{overall_signal_str} {overall_emoji}")
-        
-        signal_data = {
-            "İndikatör": indicators_list,
-            "Değer": values,
-            "Sinyal": signal_texts
-        }
+        if not live:
+            return None
         
-        signal_df = pd.DataFrame(signal_data)
+        status = st.empty()
         
-        # Sinyal tablosunu göster
-        st.dataframe(
-            signal_df,
-            column_config={
-                "İndikatör": st.column_config.TextColumn("İndikatör"),
-                "Değer": st.column_config.TextColumn("Değer"),
-                "Sinyal": st.column_config.TextColumn("Sinyal")
-            },
-            hide_index=True,
-            use_container_width=True
-        )
-        
-        # Detaylı veri tablosu
-        st.subheader("📋 Detaylı Veri Tablosu")
-        
-        # Gösterilecek sütunları belirle
-        display_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-        
-        if 'rsi' in df_with_indicators.columns:
-            display_columns.append('rsi')
+        def follow(refresh_seconds=1):
+            """
+            Akıştan yeni mum geldikçe paneli yeniden çizer (en fazla ``refresh_seconds`` saniyede bir).
             
-        if 'macd' in df_with_indicators.columns:
-            display_columns.extend(['macd', 'macd_signal'])
+            Kullanıcı etkileşiminde Streamlit betiği durdurup yeniden başlattığında döngü sona erer.
+            """
+            version = stream.version
+            while True:
+                new_version = stream.wait_for_update(version, timeout=refresh_seconds)
+                
+                # Durum satırı her turda güncellenir; bu çağrı Streamlit'in betiği durdurabilmesini de sağlar
+                if stream.last_message is not None:
+                    status.caption(f"🟢 Canlı akış - son mesaj {time.time() - stream.last_message:.0f} saniye önce")
+                else:
+                    status.caption("🟡 Canlı akış bekleniyor...")
+                
+                if new_version == version:
+                    continue
+                version = new_version
+                
+                try:
+                    df_with_indicators = _live_frame(stream, data_limit, selected_indicators)
+                    with panel.container():
+                        _render_panel(df_with_indicators, symbol, interval, selected_indicators)
+                except Exception as e:
+                    logger.error(f"Dashboard güncellenirken hata oluştu: {e}")
+                
+                time.sleep(refresh_seconds)
         
-        if 'bb_high' in df_with_indicators.columns:
-            display_columns.extend(['bb_high', 'bb_mid', 'bb_low'])
-        
-        if 'ema_9' in df_with_indicators.columns:
-            display_columns.extend(['ema_9', 'ema_21', 'ema_50'])
-            
-        if 'vwap' in df_with_indicators.columns:
-            display_columns.append('vwap')
-            
-        if 'vwema_5' in df_with_indicators.columns and 'vwema_20' in df_with_indicators.columns:
-            display_columns.extend(['vwema_5', 'vwema_20'])
-        
-        # Son 20 satırı göster
-        st.dataframe(
-            df_with_indicators[display_columns].tail(20),
-            use_container_width=True
-        )
-        
-        # Son güncelleme zamanı
-        st.markdown(f"""
-        <div style="
-            text-align: right;
-            color: #aaa;
-            font-size: 13px;
-            margin-top: 30px;
-            margin-bottom: 15px;
-            padding: 10px 16px;
-            background-color: rgba(0,0,0,0.3);
-            border-radius: 8px;
-            display: inline-block;
-            float: right;
-            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
-            border: 1px solid rgba(255, 255, 255, 0.05);
-            font-weight: 500;
-            letter-spacing: 0.5px;
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-        " onmouseover="this.style.transform='translateY(-3px)';this.style.boxShadow='0 6px 12px rgba(0, 0, 0, 0.3)';" 
-           onmouseout="this.style.transform='translateY(0)';this.style.boxShadow='0 4px 8px rgba(0, 0, 0, 0.2)';">
-            <span style="color: var(--primary-color); margin-right: 5px;">⏱️</span> Son güncelleme: <span style="color: white; font-weight: 600;">{datetime.now().strftime('%H:%M:%S')}</span>
-        </div>
-        <div style="clear: both;"></div>
-        """, unsafe_allow_html=True)
+        return follow
     
     except Exception as e:
         logger.error(f"Dashboard oluşturulurken hata oluştu: {e}")
         st.error(f"Bir hata oluştu: {e}")
+        return None
+
+def _live_frame(stream, data_limit, selected_indicators):
+    """
+    Canlı akışın artımlı güncellenen indikatörlerinden son ``data_limit`` mumu alır.
+    
+    Her mesajda değişen bu çerçeve ``IndicatorCache`` üzerinden geçmez; ``COMPACT_FRAMES``
+    açıksa önbellekteki çerçeveler gibi kompakt tiplere dönüştürülür.
+    """
+    df = stream.indicator_frame(selected_indicators).tail(data_limit).reset_index(drop=True)
+    return compact_frame(df) if COMPACT_FRAMES else df
+
+def _render_panel(df_with_indicators, symbol, interval, selected_indicators, updated_at=None):
+    """
+    Metrik kartlarını, grafiği ve sinyal/veri tablolarını çizer.
+    
+    Args:
+        df_with_indicators (pandas.DataFrame): İndikatörleri eklenmiş mum verileri
+        symbol (str): Kripto para sembolü
+        interval (str): Zaman aralığı
+        selected_indicators (list): Seçilen indikatörler
+        updated_at (float, optional): Verinin yenilendiği zaman (epoch saniye); yoksa şimdiki zaman
+    """
+    # Son fiyat bilgisini al
+    last_price = df_with_indicators['close'].iloc[-1]
+    previous_price = df_with_indicators['close'].iloc[-2]
+    price_change = ((last_price - previous_price) / previous_price) * 100
+    
+    # Sinyalleri al
+    signals = get_signals(df_with_indicators)
+    
+    # Metrik kartları için container
+    st.markdown('<div class="metric-row">', unsafe_allow_html=True)
+    
+    # Son Fiyat kartı
+    price_change_class = "positive" if price_change >= 0 else "negative"
+    price_change_icon = "↑" if price_change >= 0 else "↓"
+    st.markdown(f"""
+    <div class="metric-card">
+        <div class="metric-title">SON FİYAT</div>
+        <div class="metric-value">${format_number(last_price, 4)}</div>
+        <div class="metric-change {price_change_class}">
+            {price_change_icon} {format_number(price_change, 2)}%
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Genel Sinyal kartı
+    overall_signal = signals['overall']['signal']
+    
+    # Sinyal değerini string'e çevir ve emoji al
+    overall_signal_str = str(overall_signal)
+    overall_emoji = get_signal_emoji(overall_signal)
+    
+    # Değeri al ve sınıf belirle
+    try:
+        overall_value = signals['overall']['value'] if signals['overall']['value'] is not None else 0
+        overall_class = "positive" if overall_value > 0 else "negative" if overall_value < 0 else "neutral"
+    except Exception:
+        overall_value = 0
+        overall_class = "neutral"
+    
+    st.markdown(f"""
+    <div class="metric-card">
+        <div class="metric-title">GENEL SİNYAL</div>
+        <div class="metric-value">{overall_signal_str} {overall_emoji}</div>
+        <div class="metric-change {overall_class}">
+            Değer: {overall_value}
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Grafik
+    # Oturuma özel grafik önbelleği: yenilemelerde yalnızca iz verileri değiştirilir
+    if 'chart_cache' not in st.session_state:
+        st.session_state.chart_cache = ChartCache()
+    fig = st.session_state.chart_cache.get_chart(df_with_indicators, symbol, interval, selected_indicators)
+    st.plotly_chart(fig, use_container_width=True, theme="streamlit")
+    
+    # Sinyal tablosu
+    st.subheader("📋 Teknik Analiz Sinyalleri")
+    
+    # Sinyal tablosunu oluştur
+    indicators_list = ["RSI", "MACD", "Bollinger Bands", "EMA Çaprazlama", "Stochastic", "VWAP", "VWEMA Çaprazlama"]
+    values = [
+        str(signals['rsi']['value']) if signals['rsi']['value'] is not None else "N/A",
+        str(signals['macd']['value']) if signals['macd']['value'] is not None else "N/A",
+        str(signals['bollinger']['value']) if signals['bollinger']['value'] is not None else "N/A",
+        str(signals['ema_cross']['value']) if signals['ema_cross']['value'] is not None else "N/A",
+        str(signals['stochastic']['value']) if signals['stochastic']['value'] is not None else "N/A",
+        str(signals['vwap']['value']) if signals['vwap']['value'] is not None else "N/A",
+        str(signals['vwema_cross']['value']) if signals['vwema_cross']['value'] is not None else "N/A"
+    ]
+    signal_texts = [
+        f"{signals['rsi']['signal']} {get_signal_emoji(signals['rsi']['signal'])}",
+        f"{signals['macd']['signal']} {get_signal_emoji(signals['macd']['signal'])}",
+        f"{signals['bollinger']['signal']} {get_signal_emoji(signals['bollinger']['signal'])}",
+        f"{signals['ema_cross']['signal']} {get_signal_emoji(signals['ema_cross']['signal'])}",
+        f"{signals['stochastic']['signal']} {get_signal_emoji(signals['stochastic']['signal'])}",
+        f"{signals['vwap']['signal']} {get_signal_emoji(signals['vwap']['signal'])}",
+        f"{signals['vwema_cross']['signal']} {get_signal_emoji(signals['vwema_cross']['signal'])}"
+    ]
+    
+    # Genel sinyali ekle
+    indicators_list.append("Genel Sinyal")
+    values.append(str(signals['overall']['value']) if signals['overall']['value'] is not None else "N/A")
+    signal_texts.append(f"{overall_signal_str} {overall_emoji}")
+    
+    signal_data = {
+        "İndikatör": indicators_list,
+        "Değer": values,
+        "Sinyal": signal_texts
+    }
+    
+    signal_df = pd.DataFrame(signal_data)
+    
+    # Sinyal tablosunu göster
+    st.dataframe(
+        signal_df,
+        column_config={
+            "İndikatör": st.column_config.TextColumn("İndikatör"),
+            "Değer": st.column_config.TextColumn("Değer"),
+            "Sinyal": st.column_config.TextColumn("Sinyal")
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+    
+    # Detaylı veri tablosu
+    st.subheader("📋 Detaylı Veri Tablosu")
+    
+    # Gösterilecek sütunları belirle
+    display_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+    
+    if 'rsi' in df_with_indicators.columns:
+        display_columns.append('rsi')
+        
+    if 'macd' in df_with_indicators.columns:
+        display_columns.extend(['macd', 'macd_signal'])
+    
+    if 'bb_high' in df_with_indicators.columns:
+        display_columns.extend(['bb_high', 'bb_mid', 'bb_low'])
+    
+    if 'ema_9' in df_with_indicators.columns:
+        display_columns.extend(['ema_9', 'ema_21', 'ema_50'])
+        
+    if 'vwap' in df_with_indicators.columns:
+        display_columns.append('vwap')
+        
+    if 'vwema_5' in df_with_indicators.columns and 'vwema_20' in df_with_indicators.columns:
+        display_columns.extend(['vwema_5', 'vwema_20'])
+    
+    # Son 20 satırı göster
+    st.dataframe(
+        df_with_indicators[display_columns].tail(20),
+        use_container_width=True
+    )
+    
+    # Son güncelleme zamanı
+    st.markdown(f"""
+    <div style="
+        text-align: right;
+        color: #aaa;
+        font-size: 13px;
+        margin-top: 30px;
+        margin-bottom: 15px;
+        padding: 10px 16px;
+        background-color: rgba(0,0,0,0.3);
+        border-radius: 8px;
+        display: inline-block;
+        float: right;
+        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
+        border: 1px solid rgba(255, 255, 255, 0.05);
+        font-weight: 500;
+        letter-spacing: 0.5px;
+        transition: transform 0.3s ease, box-shadow 0.3s ease;
+    " onmouseover="this.style.transform='translateY(-3px)';this.style.boxShadow='0 6px 12px rgba(0, 0, 0, 0.3)';" 
+       onmouseout="this.style.transform='translateY(0)';this.style.boxShadow='0 4px 8px rgba(0, 0, 0, 0.2)';">
+        <span style="color: var(--primary-color); margin-right: 5px;">⏱️</span> Son güncelleme: <span style="color: white; font-weight: 600;">{(datetime.fromtimestamp(updated_at) if updated_at else datetime.now()).strftime('%H:%M:%S')}</span>
+    </div>
+    <div style="clear: both;"></div>
+    """, unsafe_allow_html=True)
+
 
 def render_loading_placeholder():
     """
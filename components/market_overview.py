@@ -4,6 +4,7 @@ import numpy as np
 import plotly.graph_objects as go
 from datetime import datetime
 from utils import format_number, calculate_change
+from market_refresher import get_market_refresher
 import logging
 
 # Loglama ayarları
@@ -23,7 +24,7 @@ def render_market_overview(binance_api):
         # Veri yükleme göstergesi
         with st.spinner("Piyasa verileri yükleniyor..."):
             # En yüksek hacimli kripto paraları al
-            top_symbols = binance_api.get_top_symbols_by_volume(limit=20)
+            top_symbols = get_market_refresher().get_top_symbols(limit=20)
             
             if not top_symbols:
                 st.error("Piyasa verileri alınamadı. Lütfen daha sonra tekrar deneyin.")
@@ -3,8 +3,11 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import time
-from indicators import TechnicalIndicators, get_signals
+from batch_indicators import compute_signal_batch
+from indicators import compact_frame, frame_memory_usage
+from config import COMPACT_FRAMES
 from utils import get_signal_emoji
+from market_refresher import get_market_refresher
 import logging
 
 # Loglama ayarları
@@ -52,79 +55,80 @@ def render_screener(binance_api, interval="1h"):
             # Yükleme göstergesi
             with st.spinner("Kripto paralar taranıyor... Bu işlem birkaç dakika sürebilir."):
                 # En yüksek hacimli kripto paraları al
-                top_symbols = binance_api.get_top_symbols_by_volume(limit=50)
+                top_symbols = get_market_refresher().get_top_symbols(limit=50)
                 
                 if not top_symbols:
                     st.error("Piyasa verileri alınamadı. Lütfen daha sonra tekrar deneyin.")
                     return
                 
-                # Hacim filtresini uygula
-                filtered_symbols = [
-                    ticker for ticker in top_symbols 
-                    if float(ticker.get('quoteVolume', 0)) >= min_volume
-                ]
-                
-                # Sonuçları saklamak için liste
-                results = []
+                # Ticker verilerini sütunlara al ve hacim filtresini uygula
+                tickers = pd.DataFrame.from_records(
+                    top_symbols, columns=['symbol', 'priceChangePercent', 'quoteVolume']
+                ).set_index('symbol').astype(float)
+                tickers = tickers[tickers['quoteVolume'] >= min_volume]
                 
                 # İlerleme çubuğu
                 progress_bar = st.progress(0)
                 
-                # Her sembol için teknik analiz yap
-                for i, ticker in enumerate(filtered_symbols):
-                    symbol = ticker['symbol']
-                    
+                # Durum mesajı
+                status = st.empty()
+                
+                # Kline verilerini eşzamanlı olarak al; sonuçlar tamamlandıkça gelir
+                frames = {}
+                symbols = tickers.index.tolist()
+                for i, (symbol, df) in enumerate(binance_api.iter_klines(symbols, interval=interval, limit=100)):
                     # İlerleme çubuğunu güncelle
-                    progress = (i + 1) / len(filtered_symbols)
+                    progress = (i + 1) / len(symbols)
                     progress_bar.progress(progress)
                     
-                    # Durum mesajını güncelle
-                    st.caption(f"İşleniyor: {symbol} ({i+1}/{len(filtered_symbols)})")
+                    # Durum mesajını güncelle (istek limiti nedeniyle bekleniyorsa göster)
+                    rate_stats = binance_api.rate_limit_stats()
+                    message = f"İşleniyor: {symbol} ({i+1}/{len(symbols)})"
+                    if rate_stats['paused_for'] > 0:
+                        message += f" - istek limiti nedeniyle {rate_stats['paused_for']:.0f} sn bekleniyor"
+                    status.caption(message)
                     
-                    try:
-                        # Kline verilerini al
-                        df = binance_api.get_klines(symbol=symbol, interval=interval, limit=100)
-                        
-                        if df.empty:
-                            continue
-                        
-                        # Teknik indikatörleri hesapla
-                        indicators = TechnicalIndicators(df)
-                        df_with_indicators = indicators.add_all_indicators()
-                        
-                        # Sinyalleri al
-                        signals = get_signals(df_with_indicators)
-                        
-                        # Fiyat bilgilerini al
-                        last_price = df_with_indicators['close'].iloc[-1]
-                        previous_price = df_with_indicators['close'].iloc[-2]
-                        price_change = ((last_price - previous_price) / previous_price) * 100
-                        
-                        # Sonuçları listeye ekle
-                        results.append({
-                            "Sembol": symbol,
-                            "Son Fiyat": last_price,
-                            "24s Değişim (%)": float(ticker.get('priceChangePercent', 0)),
-                            "24s Hacim": float(ticker.get('quoteVolume', 0)),
-                            "RSI": signals['rsi']['value'],
-                            "MACD": signals['macd']['value'],
-                            "BB (%)": signals['bollinger']['value'],
-                            "RSI Sinyal": signals['rsi']['signal'],
-                            "MACD Sinyal": signals['macd']['signal'],
-                            "BB Sinyal": signals['bollinger']['signal'],
-                            "Genel Sinyal": signals['overall']['signal'],
-                            "Sinyal Puanı": signals['overall']['value']
-                        })
-                    except Exception as e:
-                        logger.error(f"{symbol} için analiz yapılırken hata oluştu: {e}")
+                    if df.empty:
                         continue
+                    
+                    frames[symbol] = compact_frame(df) if COMPACT_FRAMES else df
+                
+                status.empty()
+                
+                # Bellek kullanımı
+                if frames:
+                    memory = frame_memory_usage(frames)
+                    st.caption(
+                        f"Mum verileri: {memory['bytes'].sum() / 1024 ** 2:.2f} MB "
+                        f"(sembol başına ortalama {memory['bytes'].mean() / 1024:.1f} KB"
+                        f"{', kompakt mod' if COMPACT_FRAMES else ''})"
+                    )
+                
+                # Teknik indikatörleri tüm semboller için tek seferde hesapla
+                signal_batch = compute_signal_batch(frames).to_frame()
                 
                 # İlerleme çubuğunu kaldır
                 progress_bar.empty()
                 
-                # Sonuçları DataFrame'e dönüştür
-                if results:
-                    results_df = pd.DataFrame(results)
+                # Sonuç tablosunu sütunlardan oluştur (ticker sırası korunur)
+                table = tickers.join(signal_batch, how='inner')
+                if not table.empty:
+                    results_df = pd.DataFrame({
+                        "Sembol": table.index,
+                        "Son Fiyat": table['close'].to_numpy(),
+                        "24s Değişim (%)": table['priceChangePercent'].to_numpy(),
+                        "24s Hacim": table['quoteVolume'].to_numpy(),
+                        "RSI": table['rsi'].to_numpy(),
+                        "MACD": table['macd'].to_numpy(),
+                        "BB (%)": table['bb_pct'].to_numpy() * 100,
+                        "RSI Sinyal": table['rsi_signal'].to_numpy(),
+                        "MACD Sinyal": table['macd_signal'].to_numpy(),
+                        "BB Sinyal": table['bb_signal'].to_numpy(),
+                        "Genel Sinyal": table['overall_signal'].to_numpy(),
+                        "Sinyal Puanı": table['overall_signal'].to_numpy()
+                    })
+                    strong_buy = table['strong_buy_signal'].to_numpy(dtype=bool)
+                    strong_sell = table['strong_sell_signal'].to_numpy(dtype=bool)
                     
                     # Sinyal filtresini uygula
                     if signal_filter == "Alış Sinyalleri":
@@ -132,9 +136,9 @@ def render_screener(binance_api, interval="1h"):
                     elif signal_filter == "Satış Sinyalleri":
                         results_df = results_df[results_df['Sinyal Puanı'] < 0]
                     elif signal_filter == "Güçlü Alış":
-                        results_df = results_df[results_df['Genel Sinyal'] == "GÜÇLÜ AL"]
+                        results_df = results_df[strong_buy]
                     elif signal_filter == "Güçlü Satış":
-                        results_df = results_df[results_df['Genel Sinyal'] == "GÜÇLÜ SAT"]
+                        results_df = results_df[strong_sell]
                     elif signal_filter == "Nötr":
                         results_df = results_df[results_df['Sinyal Puanı'] == 0]
                     
@@ -148,10 +152,9 @@ def render_screener(binance_api, interval="1h"):
                     elif sort_by == "Değişim (Artan)":
                         results_df = results_df.sort_values(by="24s Değişim (%)", ascending=True)
                     
-                    # Emoji ekle
-                    results_df['Genel Sinyal'] = results_df['Genel Sinyal'].apply(
-                        lambda x: f"{x} {get_signal_emoji(x)}"
-                    )
+                    # Emoji ekle (yalnızca gösterilen satırlardaki farklı sinyal kodları için biçimlendirilir)
+                    labels = {code: f"{code} {get_signal_emoji(code)}" for code in map(int, results_df['Genel Sinyal'].unique())}
+                    results_df = results_df.assign(**{"Genel Sinyal": results_df['Genel Sinyal'].map(labels)})
                     
                     # Sonuçları göster
                     st.subheader(f"Tarama Sonuçları ({len(results_df)} kripto para)")
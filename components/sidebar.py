@@ -1,7 +1,8 @@
 import streamlit as st
 import pandas as pd
 from config import DEFAULT_SYMBOLS, INTERVALS
-from binance_api import BinanceAPI
+from binance_api import get_binance_api
+from market_refresher import get_market_refresher
 import logging
 
 # Loglama ayarları
@@ -191,7 +192,7 @@ def render_sidebar():
         
         # API bağlantısı
         api_connected = False
-        binance_api = BinanceAPI()
+        binance_api = get_binance_api()
         
         if binance_api.client:
             api_connected = True
@@ -207,7 +208,7 @@ def render_sidebar():
         if api_connected:
             try:
                 all_symbols = binance_api.get_all_symbols()
-                top_symbols = [s['symbol'] for s in binance_api.get_top_symbols_by_volume(limit=10)]
+                top_symbols = [s['symbol'] for s in get_market_refresher().get_top_symbols(limit=10)]
                 
                 # Sembol listesini oluştur
                 symbol_options = ["En Popüler 10"] + ["Tüm Semboller"] + top_symbols
@@ -259,7 +260,7 @@ def render_sidebar():
         data_limit = st.sidebar.slider(
             "Veri Sayısı",
             min_value=50,
-            max_value=1000,
+            max_value=10000,
             value=200,
             step=50
         )
@@ -314,8 +315,9 @@ def render_sidebar():
         if auto_refresh:
             refresh_interval = st.sidebar.selectbox(
                 "Yenileme Aralığı",
-                options=["10 saniye", "30 saniye", "1 dakika", "5 dakika"],
-                index=1
+                options=["1 saniye", "5 saniye", "10 saniye", "30 saniye"],
+                index=0,
+                help="Grafik canlı WebSocket akışından güncellenir; bu değer en sık yeniden çizim aralığıdır"
             )
         
         # Hakkında bölümü
@@ -8,6 +8,45 @@ load_dotenv()
 BINANCE_API_KEY = os.getenv("BINANCE_API_KEY")
 BINANCE_API_SECRET = os.getenv("BINANCE_API_SECRET")
 
+# İsteğe bağlı REST adresi (ör. yerel test sunucusu: http://127.0.0.1:8000/api)
+BINANCE_API_URL = os.getenv("BINANCE_API_URL")
+
+# WebSocket akış adresi (ör. yerel test sunucusu: ws://127.0.0.1:9000)
+BINANCE_WS_URL = os.getenv("BINANCE_WS_URL", "wss://stream.binance.com:9443")
+
+# İstek limitleri
+REQUEST_WEIGHT_LIMIT = int(os.getenv("REQUEST_WEIGHT_LIMIT", 6000))  # Dakika başına izin verilen istek ağırlığı
+KLINE_FETCH_WORKERS = int(os.getenv("KLINE_FETCH_WORKERS", 8))  # Eşzamanlı kline isteği sayısı
+REQUEST_MAX_RETRIES = int(os.getenv("REQUEST_MAX_RETRIES", 3))  # 429/418/5xx yanıtlarında tekrar deneme sayısı
+REQUEST_BACKOFF_BASE = float(os.getenv("REQUEST_BACKOFF_BASE", 1.0))  # Geri çekilme başlangıç süresi (saniye)
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 10))  # REST istek zaman aşımı (saniye)
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", 2 * KLINE_FETCH_WORKERS))  # Kalıcı HTTP bağlantı havuzu boyutu
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 256))  # Yanıt önbelleğindeki en fazla kayıt sayısı
+
+# Yerel mum deposu (isteğe bağlı, ör. data/klines.db; boş bırakılırsa devre dışı)
+KLINE_STORE_PATH = os.getenv("KLINE_STORE_PATH", "")
+KLINE_STORE_MAX_CANDLES = int(os.getenv("KLINE_STORE_MAX_CANDLES", 10000))  # Sembol/zaman aralığı başına tutulan en fazla mum
+
+# Kompakt bellek modu: mum ve indikatör verileri float32/int8/bool tiplerinde tutulur
+COMPACT_FRAMES = os.getenv("COMPACT_FRAMES", "false").lower() in ("1", "true", "yes")
+
+# Arka plan veri yenileyicisi
+MARKET_REFRESH_MAX_AGE = float(os.getenv("MARKET_REFRESH_MAX_AGE", 60))  # Kapanmamış mum için en uzun yenileme aralığı (saniye)
+MARKET_REFRESH_CLOSE_DELAY = float(os.getenv("MARKET_REFRESH_CLOSE_DELAY", 2))  # Mum kapanışından sonra bekleme (saniye)
+MARKET_REFRESH_IDLE_TIMEOUT = float(os.getenv("MARKET_REFRESH_IDLE_TIMEOUT", 300))  # Okunmayan abonelikler bu süre sonra bırakılır
+TICKER_REFRESH_SECONDS = float(os.getenv("TICKER_REFRESH_SECONDS", 30))  # En yüksek hacimli semboller listesinin yenilenme aralığı
+
+# Oturumlar arası paylaşılan indikatör önbelleği (toplam bayt sınırı, 0 ise devre dışı)
+INDICATOR_CACHE_MAX_BYTES = int(os.getenv("INDICATOR_CACHE_MAX_MB", 256)) * 1024 ** 2
+
+# Grafik yoğunluk ayarları: mum sayısı eşiği aşınca WebGL (Scattergl) ve seyreltme kullanılır
+CHART_HIGH_DENSITY_THRESHOLD = int(os.getenv("CHART_HIGH_DENSITY_THRESHOLD", 2000))
+CHART_MAX_POINTS = int(os.getenv("CHART_MAX_POINTS", 1500))  # Seri başına gönderilecek en fazla nokta
+CHART_FULL_RESOLUTION_CANDLES = int(os.getenv("CHART_FULL_RESOLUTION_CANDLES", 500))  # Seyreltilmeyen son mumlar
+CHART_VISIBLE_CANDLES = int(os.getenv("CHART_VISIBLE_CANDLES", 5000))  # Gönderilecek son mum sayısı (0: tümü)
+CHART_MAX_EVENTS = int(os.getenv("CHART_MAX_EVENTS", 200))  # Olay türü başına çizilecek en fazla FVG/BOS/kombo
+CHART_AXIS_MODE = os.getenv("CHART_AXIS_MODE", "date")  # 'date': kesintisiz tarih ekseni, 'index': mum sırası ekseni
+
 # Varsayılan semboller
 DEFAULT_SYMBOLS = [
     "BTCUSDT", "ETHUSDT", "BNBUSDT", "ADAUSDT", "DOGEUSDT",
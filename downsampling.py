@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+
+
+def lttb_indices(y, threshold):
+    """
+    Largest-Triangle-Three-Buckets ile bir seriden korunacak noktaların indekslerini seçer.
+
+    Noktalar eşit aralıklı kabul edilir (mumlar sabit aralıklıdır). İlk ve son nokta her zaman
+    korunur; aradaki her kovadan, önceki ve sonraki kovanın ortalamalarıyla en büyük üçgeni
+    oluşturan nokta seçilir. Böylece tepe ve dipler (görsel şekil) korunur.
+
+    Klasik LTTB'de üçgenin ilk köşesi önceki kovada seçilen noktadır ve kovalar sırayla işlenmek
+    zorundadır; burada önceki kovanın ortalaması kullanıldığından tüm kovalar tek bir vektörel
+    işlemle seçilir.
+
+    Args:
+        y (numpy.ndarray): Seri değerleri (NaN içermemelidir)
+        threshold (int): Korunacak nokta sayısı
+
+    Returns:
+        numpy.ndarray: Artan sıralı int64 indeksler
+    """
+    count = len(y)
+    if threshold >= count or threshold < 3:
+        return np.arange(count)
+
+    y = np.asarray(y, dtype=np.float64)
+    # Kova sınırları: ilk nokta, threshold - 2 ara kova ve son nokta
+    bounds = np.concatenate([[0], np.linspace(1, count - 1, threshold - 1).astype(np.int64), [count]])
+    starts, ends = bounds[:-1], bounds[1:]
+    sizes = ends - starts
+    mean_x = (starts + ends - 1) / 2.0
+    mean_y = np.add.reduceat(y, starts) / sizes
+
+    # Ara kovaların adayları (kovalar en fazla ``width`` uzunluğunda, taşan konumlar maskelenir)
+    width = int(sizes[1:-1].max())
+    candidates = starts[1:-1, None] + np.arange(width)
+    valid = candidates < ends[1:-1, None]
+    candidates = np.where(valid, candidates, starts[1:-1, None])
+
+    previous_x, previous_y = mean_x[:-2, None], mean_y[:-2, None]
+    next_x, next_y = mean_x[2:, None], mean_y[2:, None]
+    area = np.abs(
+        (previous_x - next_x) * (y[candidates] - previous_y) -
+        (previous_x - candidates) * (next_y - previous_y)
+    )
+    area[~valid] = -1.0
+
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = count - 1
+    indices[1:-1] = candidates[np.arange(len(candidates)), area.argmax(axis=1)]
+    return indices
+
+
+def _split(count, max_points, full_resolution):
+    """Eski (seyreltilecek) kısmın uzunluğunu ve ona ayrılan nokta bütçesini döndürür."""
+    full_resolution = min(full_resolution, count)
+    head = count - full_resolution
+    budget = max(max_points - full_resolution, 0)
+    return head, budget
+
+
+def recent_window_indices(y, max_points, full_resolution):
+    """
+    Son ``full_resolution`` noktayı olduğu gibi bırakıp öncesini LTTB ile seyrelten indeksler.
+
+    Serinin başındaki NaN değerler (indikatör ısınma dönemi) gönderilmez.
+
+    Args:
+        y (numpy.ndarray): Seri değerleri
+        max_points (int): Toplam nokta bütçesi
+        full_resolution (int): Tam çözünürlükte tutulacak son nokta sayısı
+
+    Returns:
+        numpy.ndarray: Artan sıralı int64 indeksler
+    """
+    y = np.asarray(y, dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(y))
+    if not len(valid):
+        return valid
+
+    first = valid[0]
+    head, budget = _split(len(y) - first, max_points, full_resolution)
+    tail = np.arange(first + head, len(y))
+    if head <= budget:
+        return np.arange(first, len(y))
+
+    # Aradaki NaN değerler seçimi bozmasın diye önceki değerle doldurulur
+    values = pd.Series(y[first:first + head]).ffill().to_numpy()
+    return np.concatenate([first + lttb_indices(values, budget), tail])
+
+
+def downsample_ohlc(df, max_points, full_resolution):
+    """
+    Mumları bütçeye sığdırır: son ``full_resolution`` mum olduğu gibi kalır, öncesi eşit kovalara
+    toplanır (min/max seyreltme).
+
+    Her kova tek bir mum olur: açılış ilk mumun açılışı, kapanış son mumun kapanışı, en yüksek/en düşük
+    kovadaki uç değerler, hacim kovadaki toplamdır. Böylece fitiller ve fiyat aralığı kaybolmaz.
+
+    Args:
+        df (pd.DataFrame): timestamp, open, high, low, close (ve isteğe bağlı volume) sütunları
+        max_points (int): Toplam mum bütçesi
+        full_resolution (int): Tam çözünürlükte tutulacak son mum sayısı
+
+    Returns:
+        pd.DataFrame: Seyreltilmiş mumlar (bütçe aşılmıyorsa ``df`` kendisi)
+    """
+    head, budget = _split(len(df), max_points, full_resolution)
+    if head <= budget:
+        return df
+
+    starts = np.unique(np.linspace(0, head, budget + 1).astype(np.int64)[:-1])
+    ends = np.append(starts[1:], head)
+
+    data = {
+        'timestamp': df['timestamp'].to_numpy()[starts],
+        'open': df['open'].to_numpy()[starts],
+        'high': np.maximum.reduceat(df['high'].to_numpy()[:head], starts),
+        'low': np.minimum.reduceat(df['low'].to_numpy()[:head], starts),
+        'close': df['close'].to_numpy()[ends - 1],
+    }
+    if 'volume' in df.columns:
+        data['volume'] = np.add.reduceat(df['volume'].to_numpy()[:head], starts)
+
+    buckets = pd.DataFrame(data)
+    recent = df.iloc[head:][list(data)]
+    return pd.concat([buckets, recent], ignore_index=True)
@@ -0,0 +1,612 @@
+import copy
+import math
+import logging
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from indicators import plan_indicators
+
+# Loglama ayarları
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+NAN = float('nan')
+
+def indicator_columns(ema_periods=(9, 21, 50), vwema_periods=(5, 20)):
+    """
+    İndikatör (``plan_indicators`` adı) -> (değer sütunları, sinyal sütunu) eşlemesi; hacim sütun eklemez.
+
+    Args:
+        ema_periods (tuple): Motorun EMA periyotları
+        vwema_periods (tuple): Motorun VWEMA periyotları
+
+    Returns:
+        dict: İndikatör adı -> (değer sütunları, sinyal sütunu veya None)
+    """
+    return {
+        'rsi': (('rsi',), 'rsi_signal'),
+        'macd': (('macd', 'macd_diff', 'macd_signal_value'), 'macd_signal'),
+        'bollinger': (('bb_high', 'bb_mid', 'bb_low', 'bb_width', 'bb_pct'), 'bb_signal'),
+        'ema': (tuple(f'ema_{period}' for period in ema_periods), 'ema_cross_signal'),
+        'stochastic': (('stoch_k', 'stoch_d'), 'stoch_signal'),
+        'vwap': (('vwap',), None),
+        'vwema': (tuple(f'vwema_{period}' for period in vwema_periods), 'vwema_cross_signal'),
+        'fvg': (('bullish_fvg_count', 'bearish_fvg_count'), 'fvg_signal'),
+        'bos': (('bullish_bos', 'bearish_bos'), 'bos_signal'),
+    }
+
+
+# Varsayılan parametrelerle sütun eşlemesi
+INDICATOR_COLUMNS = indicator_columns()
+
+# Genel sinyale eklenen sinyal sütunları
+OVERALL_SIGNAL_COLUMNS = (
+    'rsi_signal', 'macd_signal', 'bb_signal', 'ema_cross_signal', 'stoch_signal',
+    'vwema_cross_signal', 'fvg_signal', 'bos_signal', 'fvg_bos_combo_signal'
+)
+
+
+def _div(numerator, denominator):
+    """NumPy/pandas gibi sıfıra bölmede inf/NaN döndüren bölme."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return float(np.float64(numerator) / np.float64(denominator))
+
+
+class _EMAState:
+    """pandas ``ewm(adjust=False, min_periods=...)`` ile aynı özyinelemeli EMA durumu."""
+
+    __slots__ = ('alpha', 'min_periods', 'value', 'count')
+
+    def __init__(self, alpha, min_periods):
+        self.alpha = alpha
+        self.min_periods = min_periods
+        self.value = None
+        self.count = 0
+
+    def update(self, x):
+        # Baştaki NaN değerler (ör. MACD sinyal hattı) atlanır
+        if math.isnan(x):
+            return self.value if self.value is not None and self.count >= self.min_periods else NAN
+
+        if self.value is None:
+            self.value = x
+        else:
+            self.value = ((1 - self.alpha) * self.value + self.alpha * x) / ((1 - self.alpha) + self.alpha)
+        self.count += 1
+
+        return self.value if self.count >= self.min_periods else NAN
+
+    def copy(self):
+        clone = _EMAState(self.alpha, self.min_periods)
+        clone.value = self.value
+        clone.count = self.count
+        return clone
+
+
+class _VWEMAState:
+    """``calculate_vwemas`` ile aynı VWEMA durumu: ilk ``period`` mum hacim ağırlıklı ortalama ile tohumlanır."""
+
+    __slots__ = ('period', 'count', 'seed_pv', 'seed_volume', 'value')
+
+    def __init__(self, period):
+        self.period = period
+        self.count = 0
+        self.seed_pv = 0.0
+        self.seed_volume = 0.0
+        self.value = NAN
+
+    @property
+    def warming_up(self):
+        return self.count <= self.period
+
+    def update(self, vw_price, volume):
+        self.count += 1
+
+        if self.count <= self.period:
+            # Tohum değer ilk 'period' mumun tamamına yazılır
+            self.seed_pv += vw_price
+            self.seed_volume += volume
+            self.value = _div(self.seed_pv, self.seed_volume)
+        else:
+            multiplier = 2 / (self.period + 1)
+            self.value = ((1 - multiplier) * self.value + multiplier * vw_price) / ((1 - multiplier) + multiplier)
+
+        return self.value
+
+    def copy(self):
+        clone = _VWEMAState(self.period)
+        clone.count = self.count
+        clone.seed_pv = self.seed_pv
+        clone.seed_volume = self.seed_volume
+        clone.value = self.value
+        return clone
+
+
+class _RollingMeanState:
+    """
+    pandas ``rolling(window, min_periods=window).mean()`` ile bit düzeyinde aynı kayan ortalama.
+
+    pandas toplamı pencere boyunca Kahan düzeltmeli bir akümülatörle taşır (çıkan değer çıkarılır,
+    giren eklenir); sonuç bu yüzden pencerenin yeniden toplanmasından son bitte farklı olabilir.
+    Eşik/kesişim karşılaştırmalarında (ör. %K = %D) aynı sinyali üretmek için aynı sıra izlenir.
+    """
+
+    __slots__ = ('window', 'values', 'count', 'total', 'add_compensation', 'remove_compensation',
+                 'negative_count', 'same_count', 'previous')
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()
+        self.count = 0
+        self.total = 0.0
+        self.add_compensation = 0.0
+        self.remove_compensation = 0.0
+        self.negative_count = 0
+        self.same_count = 0
+        self.previous = None
+
+    def update(self, x):
+        if len(self.values) == self.window:
+            old = self.values.popleft()
+            if not math.isnan(old):
+                self.count -= 1
+                y = -old - self.remove_compensation
+                t = self.total + y
+                self.remove_compensation = t - self.total - y
+                self.total = t
+                if math.copysign(1.0, old) < 0:
+                    self.negative_count -= 1
+
+        self.values.append(x)
+        if not math.isnan(x):
+            self.count += 1
+            y = x - self.add_compensation
+            t = self.total + y
+            self.add_compensation = t - self.total - y
+            self.total = t
+            if math.copysign(1.0, x) < 0:
+                self.negative_count += 1
+            self.same_count = self.same_count + 1 if x == self.previous else 1
+            self.previous = x
+
+        if self.count < self.window:
+            return NAN
+        if self.same_count >= self.count:
+            return self.previous
+        mean = self.total / self.count
+        if self.negative_count == 0 and mean < 0:
+            return 0.0
+        if self.negative_count == self.count and mean > 0:
+            return 0.0
+        return mean
+
+    def copy(self):
+        clone = _RollingMeanState(self.window)
+        for name in self.__slots__:
+            setattr(clone, name, getattr(self, name))
+        clone.values = deque(self.values)
+        return clone
+
+
+class _IndicatorState:
+    """Tüm indikatörlerin bir mumdan diğerine taşınan durumu."""
+
+    def __init__(self, params):
+        p = params
+
+        # RSI (Wilder ortalamaları)
+        self.prev_close = None
+        self.rsi_up = _EMAState(1 / p['rsi_period'], p['rsi_period'])
+        self.rsi_down = _EMAState(1 / p['rsi_period'], p['rsi_period'])
+
+        # MACD
+        self.macd_fast = _EMAState(2 / (p['macd_fast'] + 1), p['macd_fast'])
+        self.macd_slow = _EMAState(2 / (p['macd_slow'] + 1), p['macd_slow'])
+        self.macd_signal = _EMAState(2 / (p['macd_signal'] + 1), p['macd_signal'])
+
+        # Bollinger Bands
+        self.bb_closes = deque(maxlen=p['bb_window'])
+
+        # EMA
+        self.emas = {
+            period: _EMAState(2 / (period + 1), period)
+            for period in p['ema_periods']
+        }
+
+        # Stochastic
+        self.stoch_highs = deque(maxlen=p['stoch_window'])
+        self.stoch_lows = deque(maxlen=p['stoch_window'])
+        self.stoch_d = _RollingMeanState(p['stoch_smooth'])
+
+        # VWAP
+        self.vwap_pv = deque(maxlen=p['vwap_window'])
+        self.vwap_volume = deque(maxlen=p['vwap_window'])
+
+        # VWEMA
+        self.vwemas = {period: _VWEMAState(period) for period in p['vwema_periods']}
+
+        # FVG: son iki mum ve son 6+1 mumun bayrakları
+        self.last_candles = deque(maxlen=2)
+        self.fvg_flags = deque(maxlen=p['fvg_window'] + 1)
+
+        # BOS: önceki 'window' mumun yüksek/düşük değerleri
+        self.bos_highs = deque(maxlen=p['bos_window'])
+        self.bos_lows = deque(maxlen=p['bos_window'])
+
+    def copy(self):
+        """Durumun bağımsız bir kopyasını döndürür (pencereler sabit boyutlu olduğundan O(1))."""
+        clone = copy.copy(self)
+        for name, value in vars(self).items():
+            if isinstance(value, deque):
+                setattr(clone, name, deque(value, maxlen=value.maxlen))
+            elif isinstance(value, (_EMAState, _VWEMAState, _RollingMeanState)):
+                setattr(clone, name, value.copy())
+            elif isinstance(value, dict):
+                setattr(clone, name, {key: item.copy() for key, item in value.items()})
+        return clone
+
+
+class IncrementalIndicators:
+    """
+    Yeni mum eklendiğinde tüm geçmişi yeniden hesaplamadan indikatörleri güncelleyen motor.
+
+    ``TechnicalIndicators.add_all_indicators()`` ile aynı sütunları üretir. Her indikatör
+    kendi durumunu (EMA akümülatörleri, Wilder RSI ortalamaları, rolling pencereler,
+    FVG için son iki mum) tutar; ``update(candle)`` bu durumu mum başına sabit sürede ilerletir.
+
+    Aynı ``timestamp`` ile gelen mum, devam eden (kapanmamış) son mumun güncellemesi
+    kabul edilir ve son mum uygulanmadan önceki duruma geri dönülerek yeniden hesaplanır.
+    """
+
+    def __init__(self, rsi_period=14, macd_fast=12, macd_slow=26, macd_signal=9,
+                 bb_window=20, bb_window_dev=2, ema_periods=(9, 21, 50),
+                 stoch_window=14, stoch_smooth=3, vwap_window=14,
+                 vwema_periods=(5, 20), fvg_window=6, bos_window=10, max_rows=None):
+        """
+        Args:
+            rsi_period (int): RSI periyodu
+            macd_fast (int): MACD hızlı EMA periyodu
+            macd_slow (int): MACD yavaş EMA periyodu
+            macd_signal (int): MACD sinyal periyodu
+            bb_window (int): Bollinger pencere boyutu
+            bb_window_dev (int): Bollinger standart sapma çarpanı
+            ema_periods (tuple): Kısa, orta ve uzun EMA periyotları
+            stoch_window (int): Stochastic pencere boyutu
+            stoch_smooth (int): Stochastic %D yumuşatma penceresi
+            vwap_window (int): VWAP pencere boyutu
+            vwema_periods (tuple): Kısa ve uzun VWEMA periyotları
+            fvg_window (int): FVG sayımı için mum sayısı (mevcut mum dahil)
+            bos_window (int): BOS pencere boyutu
+            max_rows (int, optional): Tutulacak en fazla mum satırı (ör. görüntülenen pencere);
+                eski satırlar atılır, indikatör durumu etkilenmez. None ise sınırsız
+        """
+        self.params = {
+            'rsi_period': rsi_period,
+            'macd_fast': macd_fast,
+            'macd_slow': macd_slow,
+            'macd_signal': macd_signal,
+            'bb_window': bb_window,
+            'bb_window_dev': bb_window_dev,
+            'ema_periods': tuple(ema_periods),
+            'stoch_window': stoch_window,
+            'stoch_smooth': stoch_smooth,
+            'vwap_window': vwap_window,
+            'vwema_periods': tuple(vwema_periods),
+            'fvg_window': fvg_window,
+            'bos_window': bos_window
+        }
+        self.max_rows = max_rows
+        self._state = _IndicatorState(self.params)
+        self._rows = deque()
+        self._checkpoint = None
+
+    @classmethod
+    def from_dataframe(cls, df, **params):
+        """
+        Geçmiş mumlarla ısıtılmış bir motor oluşturur.
+
+        Args:
+            df (pandas.DataFrame): ``get_klines`` formatında OHLCV verileri
+            **params: ``IncrementalIndicators`` parametreleri
+
+        Returns:
+            IncrementalIndicators: Son muma kadar ilerletilmiş motor
+        """
+        engine = cls(**params)
+        for candle in df.to_dict('records'):
+            engine.update(candle)
+        return engine
+
+    def __len__(self):
+        return len(self._rows)
+
+    @property
+    def last_row(self):
+        """Son mumun indikatör değerlerini içeren sözlük."""
+        return self._rows[-1] if self._rows else {}
+
+    def to_dataframe(self):
+        """
+        Tüm mumları ``add_all_indicators()`` çıktısıyla aynı düzende DataFrame olarak döndürür.
+
+        Returns:
+            pandas.DataFrame: İndikatörleri eklenmiş DataFrame
+        """
+        return pd.DataFrame(list(self._rows))
+
+    def update(self, candle):
+        """
+        Motoru yeni (veya devam eden) bir mumla ilerletir.
+
+        Args:
+            candle (dict or pandas.Series): En az timestamp, open, high, low, close, volume alanları
+
+        Returns:
+            dict: Mumun indikatör ve sinyal değerleri
+        """
+        try:
+            candle = dict(candle)
+
+            # Devam eden mum: son mumdan önceki duruma geri dön
+            if self._rows and candle['timestamp'] == self._rows[-1]['timestamp']:
+                self._restore()
+
+            # Yeni satır için yer aç; en eski satırlar atılır (durum pencereleri ayrıca tutulur)
+            while self.max_rows is not None and self._rows and len(self._rows) >= self.max_rows:
+                self._rows.popleft()
+
+            self._save()
+            self._apply(candle)
+
+            return self._rows[-1]
+        except Exception as e:
+            logger.error(f"İndikatör durumu güncellenirken hata oluştu: {e}")
+            return {}
+
+    def _save(self):
+        # Son mum uygulanırken geriye dönük değişebilecek satırlar: FVG için önceki mum,
+        # VWEMA ısınması sırasında ise ilk mumların tamamı
+        warmup = max(self.params['vwema_periods'])
+        start = 0 if len(self._rows) <= warmup else len(self._rows) - 1
+        amended = {i: dict(self._rows[i]) for i in range(start, len(self._rows))}
+        self._checkpoint = (self._state.copy(), len(self._rows), amended)
+
+    def _restore(self):
+        state, n_rows, amended = self._checkpoint
+        self._state = state
+        while len(self._rows) > n_rows:
+            self._rows.pop()
+        for i, row in amended.items():
+            self._rows[i] = row
+
+    def _apply(self, candle):
+        s = self._state
+        p = self.params
+
+        high = float(candle['high'])
+        low = float(candle['low'])
+        close = float(candle['close'])
+        volume = float(candle['volume'])
+
+        row = dict(candle)
+
+        # RSI
+        diff = NAN if s.prev_close is None else close - s.prev_close
+        up = diff if diff > 0 else 0.0
+        down = -diff if diff < 0 else -0.0
+        s.prev_close = close
+        ema_up = s.rsi_up.update(up)
+        ema_down = s.rsi_down.update(down)
+        row['rsi'] = 100.0 if ema_down == 0 else 100 - _div(100, 1 + _div(ema_up, ema_down))
+
+        # MACD
+        macd = s.macd_fast.update(close) - s.macd_slow.update(close)
+        macd_signal = s.macd_signal.update(macd)
+        row['macd'] = macd
+        row['macd_signal'] = macd_signal
+        row['macd_diff'] = macd - macd_signal
+
+        # Bollinger Bands
+        s.bb_closes.append(close)
+        if len(s.bb_closes) == p['bb_window']:
+            mavg = math.fsum(s.bb_closes) / p['bb_window']
+            mstd = math.sqrt(math.fsum((c - mavg) ** 2 for c in s.bb_closes) / p['bb_window'])
+        else:
+            mavg = mstd = NAN
+        row['bb_high'] = mavg + p['bb_window_dev'] * mstd
+        row['bb_mid'] = mavg
+        row['bb_low'] = mavg - p['bb_window_dev'] * mstd
+        row['bb_width'] = _div(row['bb_high'] - row['bb_low'], mavg) * 100
+        row['bb_pct'] = _div(close - row['bb_low'], row['bb_high'] - row['bb_low'])
+
+        # EMA
+        for period, ema in s.emas.items():
+            row[f'ema_{period}'] = ema.update(close)
+
+        # Stochastic
+        s.stoch_highs.append(high)
+        s.stoch_lows.append(low)
+        if len(s.stoch_highs) == p['stoch_window']:
+            smin, smax = min(s.stoch_lows), max(s.stoch_highs)
+            stoch_k = _div(100 * (close - smin), smax - smin)
+        else:
+            stoch_k = NAN
+        row['stoch_k'] = stoch_k
+        row['stoch_d'] = s.stoch_d.update(stoch_k)
+
+        # VWAP
+        typical_price = (high + low + close) / 3.0
+        s.vwap_pv.append(typical_price * volume)
+        s.vwap_volume.append(volume)
+        if len(s.vwap_pv) == p['vwap_window']:
+            row['vwap'] = _div(math.fsum(s.vwap_pv), math.fsum(s.vwap_volume))
+        else:
+            row['vwap'] = NAN
+
+        # VWEMA (TechnicalIndicators ile aynı tipik fiyat hesabı)
+        vw_price = (high + low + close) / 3 * volume
+        warmup_rows = []
+        for period, vwema in s.vwemas.items():
+            value = vwema.update(vw_price, volume)
+            row[f'vwema_{period}'] = value
+            if vwema.warming_up:
+                # Isınma süresince önceki mumların tohum değeri de güncellenir
+                for prev in self._rows:
+                    prev[f'vwema_{period}'] = value
+                warmup_rows = range(len(self._rows))
+
+        # FVG: önceki mumun bayrağı bu mumla kesinleşir
+        if len(s.last_candles) == 2:
+            prev_high, prev_low = s.last_candles[0]
+            s.fvg_flags[-1] = (prev_high < low, prev_low > high)
+        s.last_candles.append((high, low))
+        s.fvg_flags.append((False, False))
+
+        recent = list(s.fvg_flags)[-p['fvg_window']:]
+        row['bullish_fvg_count'] = sum(flag[0] for flag in recent)
+        row['bearish_fvg_count'] = sum(flag[1] for flag in recent)
+
+        if self._rows:
+            previous = list(s.fvg_flags)[:-1][-p['fvg_window']:]
+            self._rows[-1]['bullish_fvg_count'] = sum(flag[0] for flag in previous)
+            self._rows[-1]['bearish_fvg_count'] = sum(flag[1] for flag in previous)
+
+        # BOS
+        full = len(s.bos_highs) == p['bos_window']
+        row['bullish_bos'] = full and high > max(s.bos_highs)
+        row['bearish_bos'] = full and low < min(s.bos_lows)
+        s.bos_highs.append(high)
+        s.bos_lows.append(low)
+
+        # Sinyal sütunları
+        self._rows.append(row)
+        for i in set(warmup_rows) | {len(self._rows) - 2}:
+            if i >= 0:
+                self._add_signals(i)
+        self._add_signals(len(self._rows) - 1)
+
+    def _add_signals(self, i):
+        """``TechnicalIndicators.add_signal_columns`` mantığını tek satıra uygular."""
+        row = self._rows[i]
+        prev = self._rows[i - 1] if i > 0 else {}
+        short_ema, medium_ema = self.params['ema_periods'][:2]
+        short_vwema, long_vwema = self.params['vwema_periods'][:2]
+
+        def cross(fast, slow):
+            now_fast, now_slow = row[fast], row[slow]
+            prev_fast, prev_slow = prev.get(fast, NAN), prev.get(slow, NAN)
+            if now_fast > now_slow and prev_fast <= prev_slow:
+                return 1
+            if now_fast < now_slow and prev_fast >= prev_slow:
+                return -1
+            return 0
+
+        # RSI sinyalleri
+        rsi = row['rsi']
+        row['rsi_signal'] = -1 if rsi > 70 else (1 if rsi < 30 else 0)
+
+        # MACD sinyalleri
+        # İlk geçişte 'macd_signal' sinyal hattını tutar; sonra sinyal koduna dönüşür
+        macd = row['macd']
+        macd_signal_value = row['macd_signal_value'] if 'macd_signal_value' in row else row['macd_signal']
+        row['macd_signal_value'] = macd_signal_value
+        row['macd_diff'] = macd - macd_signal_value
+        row['macd_signal'] = -1 if macd < macd_signal_value else (1 if macd > macd_signal_value else 0)
+
+        # Bollinger Bands sinyalleri
+        close = row['close']
+        row['bb_signal'] = -1 if close > row['bb_high'] else (1 if close < row['bb_low'] else 0)
+
+        # EMA çapraz sinyalleri
+        row['ema_cross_signal'] = cross(f'ema_{short_ema}', f'ema_{medium_ema}')
+
+        # Stochastic sinyalleri
+        k, d = row['stoch_k'], row['stoch_d']
+        if k > 80 and d > 80 and k < d:
+            row['stoch_signal'] = -1
+        elif k < 20 and d < 20 and k > d:
+            row['stoch_signal'] = 1
+        else:
+            row['stoch_signal'] = 0
+
+        # VWEMA çapraz sinyalleri
+        row['vwema_cross_signal'] = cross(f'vwema_{short_vwema}', f'vwema_{long_vwema}')
+
+        # FVG sinyalleri
+        bullish_count, bearish_count = row['bullish_fvg_count'], row['bearish_fvg_count']
+        row['fvg_signal'] = 1 if bullish_count > bearish_count else (-1 if bearish_count > bullish_count else 0)
+
+        # BOS sinyalleri
+        row['bos_signal'] = -1 if row['bearish_bos'] else (1 if row['bullish_bos'] else 0)
+
+        # FVG + BOS Kombo sinyali
+        if bearish_count > 0 and row['bearish_bos']:
+            row['fvg_bos_combo_signal'] = -2
+        elif bullish_count > 0 and row['bullish_bos']:
+            row['fvg_bos_combo_signal'] = 2
+        else:
+            row['fvg_bos_combo_signal'] = 0
+
+        # Genel sinyal
+        row['overall_signal'] = (
+            row['rsi_signal'] +
+            row['macd_signal'] +
+            row['bb_signal'] +
+            row['ema_cross_signal'] +
+            row['stoch_signal'] +
+            row['vwema_cross_signal'] +
+            row['fvg_signal'] +
+            row['bos_signal'] +
+            row['fvg_bos_combo_signal']
+        )
+
+        # Güçlü sinyal sütunları
+        row['strong_buy_signal'] = int(row['overall_signal'] >= 3)
+        row['strong_sell_signal'] = int(row['overall_signal'] <= -3)
+
+
+def select_indicators(frame, selected_indicators=None, params=None):
+    """
+    Tüm indikatörleri içeren motor çıktısını seçilen indikatörlere indirger.
+
+    Seçilmeyen indikatörlerin değer sütunları atılır, sinyalleri nötr (0) kabul edilir ve genel
+    sinyal yeniden toplanır; sonuç ``add_all_indicators(selected_indicators)`` ile aynı değerleri verir.
+
+    Args:
+        frame (pandas.DataFrame): ``IncrementalIndicators.to_dataframe`` çıktısı
+        selected_indicators (list, optional): Seçilen indikatörler. None ise tüm indikatörler.
+        params (dict, optional): Çıktıyı üreten motorun ``params`` sözlüğü; EMA/VWEMA sütun adları
+            buradaki periyotlardan türetilir. None ise varsayılan periyotlar.
+
+    Returns:
+        pandas.DataFrame: Seçilen indikatörleri içeren DataFrame
+    """
+    if selected_indicators is None or frame.empty:
+        return frame
+
+    columns = INDICATOR_COLUMNS if params is None else indicator_columns(
+        params['ema_periods'], params['vwema_periods']
+    )
+    plan = set(plan_indicators(selected_indicators))
+    dropped, neutral = [], []
+    for name, (values, signal) in columns.items():
+        if name not in plan:
+            dropped.extend(values)
+            if signal is not None:
+                neutral.append(signal)
+    # Kombo sinyali FVG ve BOS birlikte hesaplandığında oluşur
+    if not {'fvg', 'bos'} <= plan:
+        neutral.append('fvg_bos_combo_signal')
+
+    if not dropped and not neutral:
+        return frame
+
+    frame = frame.drop(columns=dropped).assign(**{column: 0 for column in neutral})
+    overall = frame[list(OVERALL_SIGNAL_COLUMNS)].sum(axis=1)
+    return frame.assign(
+        overall_signal=overall,
+        strong_buy_signal=(overall >= 3).astype(int),
+        strong_sell_signal=(overall <= -3).astype(int)
+    )
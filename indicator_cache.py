@@ -0,0 +1,137 @@
+import logging
+import threading
+from collections import OrderedDict
+
+from config import COMPACT_FRAMES, INDICATOR_CACHE_MAX_BYTES
+from indicators import TechnicalIndicators
+
+# Loglama ayarları
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def indicator_key(indicators):
+    """İndikatör seçimini sıradan bağımsız anahtara çevirir (hesaplama sırası ``plan_indicators`` ile belirlenir)."""
+    return tuple(sorted(set(indicators)))
+
+
+def _last_candle(df):
+    """Mum kümesini tanımlayan son mum alanları (kapanış zamanı, kapanış fiyatı, hacim)."""
+    last = df.iloc[-1]
+    return last['close_time'], float(last['close']), float(last['volume'])
+
+
+class IndicatorCache:
+    """
+    Süreç genelinde paylaşılan, toplam bayt sınırlı LRU indikatör önbelleği.
+
+    Anahtar (sembol, zaman aralığı, limit, indikatörler, son mum) demetidir. Son mumun kapanış
+    zamanının yanında kapanış fiyatı ve hacmi de anahtara girer; böylece kapanmamış mum güncellendiğinde
+    veya yeni mum oluştuğunda önbellek kendiliğinden geçersiz olur. Aynı mum kümesine bakan tüm
+    oturumlar tek bir hesaplanmış DataFrame'i paylaşır; bu yüzden dönen DataFrame salt okunur kabul
+    edilmelidir.
+    """
+
+    def __init__(self, max_bytes=INDICATOR_CACHE_MAX_BYTES):
+        """
+        Args:
+            max_bytes (int): Önbellekteki DataFrame'lerin toplam bayt sınırı (0 ise önbellek kapalı)
+        """
+        self.max_bytes = max_bytes
+        self._frames = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_frame(self, df, symbol, interval, limit, indicators):
+        """
+        İndikatörleri eklenmiş mum verilerini önbellekten döndürür, yoksa hesaplayıp saklar.
+
+        Args:
+            df (pandas.DataFrame): ``get_klines`` formatında mum verileri
+            symbol (str): Sembol
+            interval (str): Zaman aralığı
+            limit (int): İstenen mum sayısı
+            indicators (list): Hesaplanacak indikatörler
+
+        Returns:
+            pandas.DataFrame: İndikatörleri eklenmiş mum verileri
+        """
+        indicators = indicator_key(indicators)
+        if df.empty:
+            return TechnicalIndicators(df, compact=COMPACT_FRAMES).add_all_indicators(list(indicators))
+
+        key = (symbol, interval, limit, indicators) + _last_candle(df)
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is not None:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        frame = TechnicalIndicators(df, compact=COMPACT_FRAMES).add_all_indicators(list(indicators))
+        size = int(frame.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return frame
+
+        with self._lock:
+            # Aynı anda hesaplayan başka bir oturum önce yazdıysa onun sonucu paylaşılır
+            entry = self._frames.get(key)
+            if entry is not None:
+                self._frames.move_to_end(key)
+                return entry[0]
+
+            self._frames[key] = (frame, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._frames.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+        return frame
+
+    def clear(self):
+        """Önbelleği boşaltır."""
+        with self._lock:
+            self._frames.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        """
+        Önbellek sayaçları.
+
+        Returns:
+            dict: entries, bytes, max_bytes, hits, misses, evictions ve hit_rate
+        """
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                'entries': len(self._frames),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / requests if requests else 0.0,
+            }
+
+
+# Süreç genelinde paylaşılan önbellek
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_indicator_cache():
+    """
+    Paylaşılan ``IndicatorCache`` nesnesini döndürür, yoksa oluşturur.
+
+    Returns:
+        IndicatorCache: Süreç genelindeki önbellek
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = IndicatorCache()
+        return _cache
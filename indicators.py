@@ -8,37 +8,88 @@ from ta.volume import OnBalanceVolumeIndicator, VolumeWeightedAveragePrice
 import logging
 from typing import Tuple, List, Dict, Optional
 
-def calculate_vwema(df, period):
+def calculate_vwemas(df, periods):
     """
-    Volume Weighted Exponential Moving Average hesaplar.
+    Birden fazla periyot için Volume Weighted Exponential Moving Average hesaplar.
+    
+    Tipik fiyat ve hacim ağırlıklı fiyat bir kez hesaplanır; her periyot için
+    özyinelemeli EMA filtresi pandas ``ewm(adjust=False)`` ile derlenmiş kodda çalışır.
     
     Args:
         df (pandas.DataFrame): OHLCV verileri içeren DataFrame
-        period (int): VWEMA periyodu
+        periods (list): VWEMA periyotları
     
     Returns:
-        pandas.Series: Hesaplanan VWEMA değerleri
+        pandas.DataFrame: Her periyot için ``vwema_<periyot>`` sütunlarını içeren DataFrame
     """
     try:
         # Hacim ağırlıklı fiyat hesapla
         typical_price = (df['high'] + df['low'] + df['close']) / 3
-        vw_price = typical_price * df['volume']
-        
-        # EMA hesapla
-        multiplier = 2 / (period + 1)
-        vwema = pd.Series(index=df.index)
-        
-        # İlk değeri SMA olarak ayarla
-        vwema.iloc[:period] = vw_price.iloc[:period].sum() / df['volume'].iloc[:period].sum()
+        vw_price = (typical_price * df['volume']).to_numpy(dtype=np.float64)
+        volume = df['volume'].to_numpy(dtype=np.float64)
         
-        # Kalan değerleri EMA formülü ile hesapla
-        for i in range(period, len(df)):
-            vwema.iloc[i] = (vw_price.iloc[i] * multiplier) + (vwema.iloc[i-1] * (1 - multiplier))
+        result = {}
+        for period in periods:
+            vwema = np.empty(len(df), dtype=np.float64)
+            
+            # İlk değeri SMA olarak ayarla
+            vwema[:period] = vw_price[:period].sum() / volume[:period].sum()
+            
+            # Kalan değerleri EMA formülü ile hesapla: y[i] = x[i] * k + y[i-1] * (1 - k)
+            if len(df) > period:
+                seeded = np.concatenate(([vwema[period - 1]], vw_price[period:]))
+                smoothed = pd.Series(seeded).ewm(alpha=2 / (period + 1), adjust=False).mean()
+                vwema[period:] = smoothed.to_numpy()[1:]
+            
+            result[f'vwema_{period}'] = vwema
         
-        return vwema
+        return pd.DataFrame(result, index=df.index)
     except Exception as e:
         logger.error(f"VWEMA hesaplanırken hata oluştu: {e}")
-        return pd.Series(np.nan, index=df.index)
+        return pd.DataFrame({f'vwema_{period}': np.nan for period in periods}, index=df.index)
+
+def calculate_vwema(df, period):
+    """
+    Volume Weighted Exponential Moving Average hesaplar.
+    
+    Args:
+        df (pandas.DataFrame): OHLCV verileri içeren DataFrame
+        period (int): VWEMA periyodu
+    
+    Returns:
+        pandas.Series: Hesaplanan VWEMA değerleri
+    """
+    return calculate_vwemas(df, [period])[f'vwema_{period}']
+
+def fair_value_gap_flags(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Her mum için Bullish/Bearish FVG bayraklarını tek geçişte hesaplar.
+    
+    Bayrak, boşluğun orta mumuna (FVG tablolarındaki ``timestamp``) yazılır.
+    
+    Args:
+        df (pandas.DataFrame): OHLCV verileri içeren DataFrame
+    
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Bullish ve Bearish FVG boolean dizileri
+    """
+    n = len(df)
+    bullish = np.zeros(n, dtype=bool)
+    bearish = np.zeros(n, dtype=bool)
+    
+    # En az 3 mum gerekli
+    if n < 3:
+        return bullish, bearish
+    
+    high = df['high'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    
+    # Bullish FVG: Önceki mumun yüksek değeri, sonraki mumun düşük değerinden küçükse
+    bullish[1:-1] = high[:-2] < low[2:]
+    # Bearish FVG: Önceki mumun düşük değeri, sonraki mumun yüksek değerinden büyükse
+    bearish[1:-1] = low[:-2] > high[2:]
+    
+    return bullish, bearish
 
 def find_fair_value_gaps(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
@@ -47,6 +98,10 @@ def find_fair_value_gaps(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
     FVG, piyasada hızlı bir fiyat hareketi sonucu oluşan ve daha sonra
     fiyatın geri dönüp doldurma eğiliminde olduğu boşluklardır.
     
+    Tüm mumlar kaydırılmış NumPy dizileri üzerinden tek geçişte karşılaştırılır.
+    Bir boşluk, üçüncü mumdan sonraki herhangi bir mum boşluğun karşı kenarına
+    ulaştığında doldurulmuş (``filled``) kabul edilir.
+    
     Args:
         df (pandas.DataFrame): OHLCV verileri içeren DataFrame
     
@@ -54,41 +109,103 @@ def find_fair_value_gaps(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
         Tuple[pandas.DataFrame, pandas.DataFrame]: Bullish ve Bearish FVG'leri içeren DataFrames
     """
     try:
-        # Boş DataFrames oluştur
-        bullish_fvg = pd.DataFrame(columns=['timestamp', 'fvg_low', 'fvg_high', 'filled'])
-        bearish_fvg = pd.DataFrame(columns=['timestamp', 'fvg_low', 'fvg_high', 'filled'])
+        columns = ['timestamp', 'fvg_low', 'fvg_high', 'filled']
         
         # En az 3 mum gerekli
         if len(df) < 3:
-            return bullish_fvg, bearish_fvg
+            return pd.DataFrame(columns=columns), pd.DataFrame(columns=columns)
+        
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        timestamps = df['timestamp'].to_numpy()
+        
+        # Orta mum indeksleri; i-1 ve i+1 komşuları bunlardan türetilir
+        bullish_flags, bearish_flags = fair_value_gap_flags(df)
+        bullish_idx = np.flatnonzero(bullish_flags)
+        bearish_idx = np.flatnonzero(bearish_flags)
+        
+        # i+2'den itibaren görülen en düşük/en yüksek fiyatlar
+        future_low = np.append(np.minimum.accumulate(low[::-1])[::-1], np.inf)
+        future_high = np.append(np.maximum.accumulate(high[::-1])[::-1], -np.inf)
+        
+        # Her iki tablo tek bir dizi üzerinde oluşturulur: önce bullish, sonra bearish
+        idx = np.concatenate([bullish_idx, bearish_idx])
+        n_bullish = len(bullish_idx)
+        
+        fvg_low = np.concatenate([high[bullish_idx - 1], high[bearish_idx + 1]])
+        fvg_high = np.concatenate([low[bullish_idx + 1], low[bearish_idx - 1]])
+        
+        # Bullish boşluk fiyat alt kenara inince, bearish boşluk üst kenara çıkınca dolar
+        filled = np.concatenate([
+            future_low[bullish_idx + 2] <= fvg_low[:n_bullish],
+            future_high[bearish_idx + 2] >= fvg_high[n_bullish:]
+        ])
         
-        # FVG'leri bul
-        for i in range(1, len(df) - 1):
-            # Bullish FVG: Önceki mumun yüksek değeri, sonraki mumun düşük değerinden küçükse
-            if df['high'].iloc[i-1] < df['low'].iloc[i+1]:
-                new_row = pd.DataFrame({
-                    'timestamp': [df['timestamp'].iloc[i]],
-                    'fvg_low': [df['high'].iloc[i-1]],
-                    'fvg_high': [df['low'].iloc[i+1]],
-                    'filled': [False]
-                })
-                bullish_fvg = pd.concat([bullish_fvg, new_row], ignore_index=True)
-            
-            # Bearish FVG: Önceki mumun düşük değeri, sonraki mumun yüksek değerinden büyükse
-            if df['low'].iloc[i-1] > df['high'].iloc[i+1]:
-                new_row = pd.DataFrame({
-                    'timestamp': [df['timestamp'].iloc[i]],
-                    'fvg_low': [df['high'].iloc[i+1]],
-                    'fvg_high': [df['low'].iloc[i-1]],
-                    'filled': [False]
-                })
-                bearish_fvg = pd.concat([bearish_fvg, new_row], ignore_index=True)
+        gaps = pd.DataFrame({
+            'timestamp': timestamps[idx],
+            'fvg_low': fvg_low,
+            'fvg_high': fvg_high,
+            'filled': filled
+        })
+        
+        bullish_fvg = gaps.iloc[:n_bullish].reset_index(drop=True)
+        bearish_fvg = gaps.iloc[n_bullish:].reset_index(drop=True)
         
         return bullish_fvg, bearish_fvg
     except Exception as e:
         logger.error(f"FVG hesaplanırken hata oluştu: {e}")
         return pd.DataFrame(), pd.DataFrame()
 
+def rolling_event_count(flags: np.ndarray, window: int) -> np.ndarray:
+    """
+    Boolean olay dizisinin son ``window`` mumdaki toplamını hesaplar.
+    
+    Args:
+        flags (numpy.ndarray): Mum başına olay bayrakları
+        window (int): Pencere boyutu (mevcut mum dahil)
+    
+    Returns:
+        numpy.ndarray: Her mum için pencere içindeki olay sayısı
+    """
+    cumulative = np.cumsum(flags, dtype=np.int64)
+    counts = cumulative.copy()
+    counts[window:] -= cumulative[:-window]
+    return counts
+
+def break_of_structure_flags(df: pd.DataFrame, window: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Her mum için Bullish/Bearish BOS bayraklarını tek geçişte hesaplar.
+    
+    Önceki ``window`` mumun en yüksek/en düşük değerleri kaydırılmış rolling
+    dizilerden alınır; verilen DataFrame'e geçici sütun eklenmez.
+    
+    Args:
+        df (pandas.DataFrame): OHLCV verileri içeren DataFrame
+        window (int): Yüksek/düşük noktaları belirlemek için kullanılacak pencere boyutu
+    
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Bullish ve Bearish BOS boolean dizileri
+    """
+    n = len(df)
+    
+    # En az window+1 mum gerekli
+    if n <= window:
+        return np.zeros(n, dtype=bool), np.zeros(n, dtype=bool)
+    
+    high = df['high'].astype(np.float64)
+    low = df['low'].astype(np.float64)
+    
+    # Önceki 'window' mumun en yüksek ve en düşük değerleri (NaN karşılaştırmaları False döner)
+    rolling_high = high.rolling(window=window).max().shift(1).to_numpy()
+    rolling_low = low.rolling(window=window).min().shift(1).to_numpy()
+    
+    # Bullish BOS: Fiyat önceki yüksek noktayı kırıyorsa
+    bullish = high.to_numpy() > rolling_high
+    # Bearish BOS: Fiyat önceki düşük noktayı kırıyorsa
+    bearish = low.to_numpy() < rolling_low
+    
+    return bullish, bearish
+
 def find_break_of_structure(df: pd.DataFrame, window: int = 10) -> pd.DataFrame:
     """
     Break of Structure (BOS) noktalarını tespit eder.
@@ -104,55 +221,181 @@ def find_break_of_structure(df: pd.DataFrame, window: int = 10) -> pd.DataFrame:
         pandas.DataFrame: BOS noktalarını içeren DataFrame
     """
     try:
-        # Boş DataFrame oluştur
-        bos_points = pd.DataFrame(columns=['timestamp', 'price', 'type'])
-        
         # En az window+1 mum gerekli
         if len(df) <= window:
-            return bos_points
+            return pd.DataFrame(columns=['timestamp', 'price', 'type'])
+        
+        bullish, bearish = break_of_structure_flags(df, window)
+        bullish_idx = np.flatnonzero(bullish)
+        bearish_idx = np.flatnonzero(bearish)
         
-        # Rolling window ile yüksek ve düşük noktaları bul
-        df['rolling_high'] = df['high'].rolling(window=window).max().shift(1)
-        df['rolling_low'] = df['low'].rolling(window=window).min().shift(1)
+        # Noktaları mum sırasına göre diz (aynı mumda önce bullish)
+        idx = np.concatenate([bullish_idx, bearish_idx])
+        order = np.argsort(idx, kind='stable')
+        idx = idx[order]
         
-        # BOS noktalarını bul
-        for i in range(window, len(df)):
-            # Bullish BOS: Fiyat önceki yüksek noktayı kırıyorsa
-            if df['high'].iloc[i] > df['rolling_high'].iloc[i]:
-                new_row = pd.DataFrame({
-                    'timestamp': [df['timestamp'].iloc[i]],
-                    'price': [df['high'].iloc[i]],
-                    'type': ['bullish']
-                })
-                bos_points = pd.concat([bos_points, new_row], ignore_index=True)
-            
-            # Bearish BOS: Fiyat önceki düşük noktayı kırıyorsa
-            if df['low'].iloc[i] < df['rolling_low'].iloc[i]:
-                new_row = pd.DataFrame({
-                    'timestamp': [df['timestamp'].iloc[i]],
-                    'price': [df['low'].iloc[i]],
-                    'type': ['bearish']
-                })
-                bos_points = pd.concat([bos_points, new_row], ignore_index=True)
+        prices = np.concatenate([
+            df['high'].to_numpy()[bullish_idx],
+            df['low'].to_numpy()[bearish_idx]
+        ])[order]
+        types = np.repeat(np.array(['bullish', 'bearish'], dtype=object), [len(bullish_idx), len(bearish_idx)])[order]
         
-        return bos_points
+        return pd.DataFrame({
+            'timestamp': df['timestamp'].to_numpy()[idx],
+            'price': prices,
+            'type': types
+        })
     except Exception as e:
         logger.error(f"BOS hesaplanırken hata oluştu: {e}")
         return pd.DataFrame()
 
+# Hesaplanabilir indikatörler (hesaplama sırasıyla) ve ihtiyaç duydukları diğer indikatörler
+INDICATOR_DEPENDENCIES = {
+    "rsi": [],
+    "macd": [],
+    "bollinger": [],
+    "ema": [],
+    "stochastic": [],
+    "volume": [],
+    "vwap": [],
+    "vwema": [],
+    "fvg": [],
+    "bos": [],
+    "fvg_bos_combo": ["fvg", "bos"]
+}
+
+def plan_indicators(selected_indicators: Optional[List[str]] = None) -> List[str]:
+    """
+    Seçilen indikatörler için hesaplanması gereken indikatörleri belirler.
+    
+    Bağımlılıklar (ör. FVG + BOS Kombosu için FVG ve BOS) eklenir ve sonuç
+    ``INDICATOR_DEPENDENCIES`` sırasıyla döndürülür. Bilinmeyen isimler yok sayılır.
+    
+    Args:
+        selected_indicators (list, optional): Seçilen indikatörler. None ise tüm indikatörler.
+    
+    Returns:
+        list: Hesaplanacak indikatörlerin sıralı listesi
+    """
+    if selected_indicators is None:
+        return list(INDICATOR_DEPENDENCIES)
+    
+    required = set()
+    pending = [name for name in selected_indicators if name in INDICATOR_DEPENDENCIES]
+    while pending:
+        name = pending.pop()
+        if name not in required:
+            required.add(name)
+            pending.extend(INDICATOR_DEPENDENCIES[name])
+    
+    return [name for name in INDICATOR_DEPENDENCIES if name in required]
+
+def _decimal_places(values: np.ndarray, max_decimals: int) -> Optional[int]:
+    """
+    Değerlerin üzerinde durduğu ondalık ızgaranın basamak sayısı (tick = 10**-basamak).
+    
+    Returns:
+        int: Tüm değerlerin tam katı olduğu en küçük basamak sayısı; ızgarada değilse None
+    """
+    values = values[np.isfinite(values)]
+    for decimals in range(max_decimals + 1):
+        # Metinden çözülen ondalık değerler ızgaradan yalnızca birkaç ulp uzaktadır
+        scaled = values * 10.0 ** decimals
+        if np.all(np.abs(scaled - np.rint(scaled)) <= 1e-13 * np.maximum(np.abs(scaled), 1.0)):
+            return decimals
+    return None
+
+def compact_frame(df: pd.DataFrame, max_decimals: int = 8) -> pd.DataFrame:
+    """
+    DataFrame'i daha az bellek kullanan tiplere dönüştürür.
+    
+    - Borsadan gelen ve ondalık ızgarada duran float64 sütunlar (fiyat, hacim), float32'deki yuvarlama
+      hatası yarım tick'in altında kalıyorsa float32 olur; aşan sütunlar (ör. 8 basamaklı büyük
+      hacimler) float64 kalır. float32 göreli hatası ~6e-8 olduğundan göreli toleranslı bir kontrol
+      hiçbir sütunu elemez; ölçüt bu yüzden tick'e göredir.
+    - Izgarada durmayan (hesaplanmış indikatör) float64 sütunlar koşulsuz float32 olur
+      (~7 anlamlı basamak)
+    - Tamsayı sütunlar sığdıkları en küçük tipe indirilir (sinyal kodları ve FVG sayaçları int8)
+    - BOS bayrakları bool olur
+    - object sütunlar sayıya, sayıya çevrilemiyorsa kategoriye dönüştürülür
+    
+    Args:
+        df (pandas.DataFrame): Mum ve indikatör verileri
+        max_decimals (int): Izgara aranacak en fazla ondalık basamak (Binance değerleri 8 basamaklıdır)
+    
+    Returns:
+        pandas.DataFrame: Aynı sütun ve indeksle kompakt kopya
+    """
+    columns = {}
+    for column in df.columns:
+        values = df[column]
+        
+        if column in ('bullish_bos', 'bearish_bos'):
+            values = values.fillna(False).astype(bool)
+        elif values.dtype == object:
+            try:
+                values = pd.to_numeric(values)
+            except (ValueError, TypeError):
+                values = values.astype('category')
+        
+        if pd.api.types.is_integer_dtype(values.dtype):
+            values = pd.to_numeric(values, downcast='integer')
+        elif values.dtype == np.float64:
+            original = values.to_numpy()
+            compact = values.astype(np.float32)
+            decimals = _decimal_places(original, max_decimals)
+            if decimals is None:
+                values = compact
+            else:
+                # float32 değeri tick'e yuvarlandığında özgün değer geri elde edilmeli
+                tick = 10.0 ** -decimals
+                error = np.abs(compact.to_numpy(dtype=np.float64) - original)
+                if not np.any(error[np.isfinite(original)] >= tick / 2):
+                    values = compact
+        
+        columns[column] = values
+    
+    return pd.DataFrame(columns, index=df.index)
+
+def frame_memory_usage(frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Sembol başına DataFrame bellek kullanımını hesaplar.
+    
+    Args:
+        frames (dict): Sembol -> DataFrame
+    
+    Returns:
+        pandas.DataFrame: Sembol indeksli satır/sütun sayısı, toplam bayt ve mum başına bayt
+    """
+    report = []
+    for symbol, df in frames.items():
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        report.append({
+            'symbol': symbol,
+            'rows': len(df),
+            'columns': len(df.columns),
+            'bytes': size,
+            'bytes_per_row': size / len(df) if len(df) else 0.0
+        })
+    
+    return pd.DataFrame(report, columns=['symbol', 'rows', 'columns', 'bytes', 'bytes_per_row']).set_index('symbol')
+
 # Loglama ayarları
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class TechnicalIndicators:
-    def __init__(self, df):
+    def __init__(self, df, compact=False):
         """
         Teknik indikatörleri hesaplamak için sınıf.
         
         Args:
             df (pandas.DataFrame): OHLCV verileri içeren DataFrame
+            compact (bool): True ise ``add_all_indicators`` sonucu ``compact_frame`` ile küçültülür.
+                Hesaplamalar her durumda float64 ile yapılır.
         """
         self.df = df.copy()
+        self.compact = compact
         
         # DataFrame'in gerekli sütunları içerdiğinden emin ol
         required_columns = ['open', 'high', 'low', 'close', 'volume']
@@ -164,25 +407,12 @@ class TechnicalIndicators:
     def add_fvg(self):
         """Fair Value Gap (FVG) bölgelerini tespit eder ve DataFrame'e ekler."""
         try:
-            # FVG'leri bul
-            bullish_fvg, bearish_fvg = find_fair_value_gaps(self.df)
-            
-            # FVG bilgilerini DataFrame'e ekle
-            self.df['bullish_fvg_count'] = 0
-            self.df['bearish_fvg_count'] = 0
+            # Mum başına FVG bayraklarını bul
+            bullish, bearish = fair_value_gap_flags(self.df)
             
-            # Son 5 mum içindeki FVG sayısını hesapla
-            for i in range(len(self.df)):
-                # Son 5 mum içindeki timestamp'leri al
-                recent_timestamps = self.df['timestamp'].iloc[max(0, i-5):i+1]
-                
-                # Bu zaman aralığındaki bullish FVG'leri say
-                bullish_count = len(bullish_fvg[bullish_fvg['timestamp'].isin(recent_timestamps)])
-                self.df.loc[self.df.index[i], 'bullish_fvg_count'] = bullish_count
-                
-                # Bu zaman aralığındaki bearish FVG'leri say
-                bearish_count = len(bearish_fvg[bearish_fvg['timestamp'].isin(recent_timestamps)])
-                self.df.loc[self.df.index[i], 'bearish_fvg_count'] = bearish_count
+            # Son 6 mum (mevcut mum dahil) içindeki FVG sayısını hesapla
+            self.df['bullish_fvg_count'] = rolling_event_count(bullish, 6)
+            self.df['bearish_fvg_count'] = rolling_event_count(bearish, 6)
             
             return self.df
         except Exception as e:
@@ -192,21 +422,12 @@ class TechnicalIndicators:
     def add_bos(self, window=10):
         """Break of Structure (BOS) noktalarını tespit eder ve DataFrame'e ekler."""
         try:
-            # BOS noktalarını bul
-            bos_points = find_break_of_structure(self.df, window)
+            # BOS bayraklarını rolling dizilerden doğrudan hesapla
+            bullish, bearish = break_of_structure_flags(self.df, window)
             
             # BOS bilgilerini DataFrame'e ekle
-            self.df['bullish_bos'] = False
-            self.df['bearish_bos'] = False
-            
-            # BOS noktalarını işaretle
-            for _, row in bos_points.iterrows():
-                idx = self.df[self.df['timestamp'] == row['timestamp']].index
-                if len(idx) > 0:
-                    if row['type'] == 'bullish':
-                        self.df.loc[idx[0], 'bullish_bos'] = True
-                    elif row['type'] == 'bearish':
-                        self.df.loc[idx[0], 'bearish_bos'] = True
+            self.df['bullish_bos'] = bullish
+            self.df['bearish_bos'] = bearish
             
             return self.df
         except Exception as e:
@@ -219,58 +440,61 @@ class TechnicalIndicators:
         
         Args:
             selected_indicators (list, optional): Eklenecek indikatörlerin listesi. None ise tüm indikatörler eklenir.
+                Bağımlılıklar ``plan_indicators`` ile otomatik olarak eklenir.
         
         Returns:
             pandas.DataFrame: İndikatörleri eklenmiş DataFrame
         """
         try:
-            if selected_indicators is None:
-                selected_indicators = ["rsi", "macd", "bollinger", "ema", "stochastic", "volume", "vwap", "vwema", "fvg", "bos", "fvg_bos_combo"]
+            # Seçilenler ve bağımlılıkları dışındaki indikatörler hesaplanmaz
+            plan = plan_indicators(selected_indicators)
             
             # RSI
-            if "rsi" in selected_indicators:
+            if "rsi" in plan:
                 self.add_rsi()
             
             # MACD
-            if "macd" in selected_indicators:
+            if "macd" in plan:
                 self.add_macd()
             
             # Bollinger Bands
-            if "bollinger" in selected_indicators:
+            if "bollinger" in plan:
                 self.add_bollinger_bands()
             
             # EMA
-            if "ema" in selected_indicators:
+            if "ema" in plan:
                 self.add_ema()
             
             # Stochastic
-            if "stochastic" in selected_indicators:
+            if "stochastic" in plan:
                 self.add_stochastic()
             
             # VWAP
-            if "vwap" in selected_indicators:
+            if "vwap" in plan:
                 self.add_vwap()
                 
             # VWEMA
-            if "vwema" in selected_indicators:
+            if "vwema" in plan:
                 self.add_vwema()
             
             # Smart Money Concepts göstergeleri
             # Fair Value Gap (FVG)
-            if "fvg" in selected_indicators:
+            if "fvg" in plan:
                 self.add_fvg()
                 
             # Break of Structure (BOS)
-            if "bos" in selected_indicators:
+            if "bos" in plan:
                 self.add_bos()
             
-            # FVG + BOS Kombosu için ayrıca bir şey yapmaya gerek yok,
-            # çünkü bu sinyal add_signal_columns() içinde hesaplanıyor
-            # ve her iki gösterge de eklendiğinde otomatik olarak oluşuyor
+            # FVG + BOS Kombosu ayrı bir hesaplama gerektirmez; plan FVG ve BOS'u
+            # içerdiği için sinyal add_signal_columns() içinde oluşur
             
             # Sinyal sütunlarını ekle
             self.add_signal_columns()
             
+            if self.compact:
+                self.df = compact_frame(self.df)
+            
             return self.df
         except Exception as e:
             logger.error(f"Tüm indikatörler eklenirken hata oluştu: {e}")
@@ -422,9 +646,9 @@ class TechnicalIndicators:
     def add_vwema(self, short_period=5, long_period=20):
         """Volume Weighted Exponential Moving Average indikatörlerini ekler."""
         try:
-            # VWEMA hesapla
-            self.df[f'vwema_{short_period}'] = calculate_vwema(self.df, short_period)
-            self.df[f'vwema_{long_period}'] = calculate_vwema(self.df, long_period)
+            # VWEMA hesapla (her iki periyot tek geçişte)
+            vwemas = calculate_vwemas(self.df, [short_period, long_period])
+            self.df[vwemas.columns] = vwemas
             
             return self.df
         except Exception as e:
@@ -434,61 +658,75 @@ class TechnicalIndicators:
     def add_signal_columns(self):
         """Sinyal sütunlarını ekler."""
         try:
+            # Hesaplanmamış indikatörlerin sinyali nötr (0) kabul edilir
+            columns = self.df.columns
+            
             # RSI sinyalleri
             self.df['rsi_signal'] = 0
-            self.df.loc[self.df['rsi'] < 30, 'rsi_signal'] = 1  # Aşırı satım - Alış sinyali
-            self.df.loc[self.df['rsi'] > 70, 'rsi_signal'] = -1  # Aşırı alım - Satış sinyali
+            if 'rsi' in columns:
+                self.df.loc[self.df['rsi'] < 30, 'rsi_signal'] = 1  # Aşırı satım - Alış sinyali
+                self.df.loc[self.df['rsi'] > 70, 'rsi_signal'] = -1  # Aşırı alım - Satış sinyali
             
             # MACD sinyalleri
-            self.df['macd_signal_value'] = self.df['macd_signal']
-            self.df['macd_diff'] = self.df['macd'] - self.df['macd_signal_value']
-            self.df['macd_signal'] = 0
-            self.df.loc[self.df['macd'] > self.df['macd_signal_value'], 'macd_signal'] = 1  # MACD, sinyal çizgisinin üzerinde - Alış sinyali
-            self.df.loc[self.df['macd'] < self.df['macd_signal_value'], 'macd_signal'] = -1  # MACD, sinyal çizgisinin altında - Satış sinyali
+            if 'macd' in columns and 'macd_signal' in columns:
+                self.df['macd_signal_value'] = self.df['macd_signal']
+                self.df['macd_diff'] = self.df['macd'] - self.df['macd_signal_value']
+                self.df['macd_signal'] = 0
+                self.df.loc[self.df['macd'] > self.df['macd_signal_value'], 'macd_signal'] = 1  # MACD, sinyal çizgisinin üzerinde - Alış sinyali
+                self.df.loc[self.df['macd'] < self.df['macd_signal_value'], 'macd_signal'] = -1  # MACD, sinyal çizgisinin altında - Satış sinyali
+            else:
+                self.df['macd_signal'] = 0
             
             # Bollinger Bands sinyalleri
             self.df['bb_signal'] = 0
-            self.df.loc[self.df['close'] < self.df['bb_low'], 'bb_signal'] = 1  # Fiyat alt bandın altında - Alış sinyali
-            self.df.loc[self.df['close'] > self.df['bb_high'], 'bb_signal'] = -1  # Fiyat üst bandın üstünde - Satış sinyali
+            if 'bb_low' in columns and 'bb_high' in columns:
+                self.df.loc[self.df['close'] < self.df['bb_low'], 'bb_signal'] = 1  # Fiyat alt bandın altında - Alış sinyali
+                self.df.loc[self.df['close'] > self.df['bb_high'], 'bb_signal'] = -1  # Fiyat üst bandın üstünde - Satış sinyali
             
             # EMA çapraz sinyalleri (9 ve 21)
             self.df['ema_cross_signal'] = 0
-            self.df.loc[(self.df['ema_9'] > self.df['ema_21']) & (self.df['ema_9'].shift(1) <= self.df['ema_21'].shift(1)), 'ema_cross_signal'] = 1  # Altın çapraz - Alış sinyali
-            self.df.loc[(self.df['ema_9'] < self.df['ema_21']) & (self.df['ema_9'].shift(1) >= self.df['ema_21'].shift(1)), 'ema_cross_signal'] = -1  # Ölüm çaprazı - Satış sinyali
+            if 'ema_9' in columns and 'ema_21' in columns:
+                self.df.loc[(self.df['ema_9'] > self.df['ema_21']) & (self.df['ema_9'].shift(1) <= self.df['ema_21'].shift(1)), 'ema_cross_signal'] = 1  # Altın çapraz - Alış sinyali
+                self.df.loc[(self.df['ema_9'] < self.df['ema_21']) & (self.df['ema_9'].shift(1) >= self.df['ema_21'].shift(1)), 'ema_cross_signal'] = -1  # Ölüm çaprazı - Satış sinyali
             
             # Stochastic sinyalleri
             self.df['stoch_signal'] = 0
-            self.df.loc[(self.df['stoch_k'] < 20) & (self.df['stoch_d'] < 20) & (self.df['stoch_k'] > self.df['stoch_d']), 'stoch_signal'] = 1  # Aşırı satım ve yukarı çapraz - Alış sinyali
-            self.df.loc[(self.df['stoch_k'] > 80) & (self.df['stoch_d'] > 80) & (self.df['stoch_k'] < self.df['stoch_d']), 'stoch_signal'] = -1  # Aşırı alım ve aşağı çapraz - Satış sinyali
+            if 'stoch_k' in columns and 'stoch_d' in columns:
+                self.df.loc[(self.df['stoch_k'] < 20) & (self.df['stoch_d'] < 20) & (self.df['stoch_k'] > self.df['stoch_d']), 'stoch_signal'] = 1  # Aşırı satım ve yukarı çapraz - Alış sinyali
+                self.df.loc[(self.df['stoch_k'] > 80) & (self.df['stoch_d'] > 80) & (self.df['stoch_k'] < self.df['stoch_d']), 'stoch_signal'] = -1  # Aşırı alım ve aşağı çapraz - Satış sinyali
             
             # VWEMA çapraz sinyalleri (5 ve 20)
-            if 'vwema_5' in self.df.columns and 'vwema_20' in self.df.columns:
-                self.df['vwema_cross_signal'] = 0
+            self.df['vwema_cross_signal'] = 0
+            if 'vwema_5' in columns and 'vwema_20' in columns:
                 self.df.loc[(self.df['vwema_5'] > self.df['vwema_20']) & (self.df['vwema_5'].shift(1) <= self.df['vwema_20'].shift(1)), 'vwema_cross_signal'] = 1  # Altın çapraz - Alış sinyali
                 self.df.loc[(self.df['vwema_5'] < self.df['vwema_20']) & (self.df['vwema_5'].shift(1) >= self.df['vwema_20'].shift(1)), 'vwema_cross_signal'] = -1  # Ölüm çaprazı - Satış sinyali
-            else:
-                self.df['vwema_cross_signal'] = 0
+            
+            has_fvg = 'bullish_fvg_count' in columns and 'bearish_fvg_count' in columns
+            has_bos = 'bullish_bos' in columns and 'bearish_bos' in columns
             
             # FVG sinyalleri
             self.df['fvg_signal'] = 0
-            # Bullish FVG sayısı bearish'ten fazlaysa alış sinyali
-            self.df.loc[self.df['bullish_fvg_count'] > self.df['bearish_fvg_count'], 'fvg_signal'] = 1
-            # Bearish FVG sayısı bullish'ten fazlaysa satış sinyali
-            self.df.loc[self.df['bearish_fvg_count'] > self.df['bullish_fvg_count'], 'fvg_signal'] = -1
+            if has_fvg:
+                # Bullish FVG sayısı bearish'ten fazlaysa alış sinyali
+                self.df.loc[self.df['bullish_fvg_count'] > self.df['bearish_fvg_count'], 'fvg_signal'] = 1
+                # Bearish FVG sayısı bullish'ten fazlaysa satış sinyali
+                self.df.loc[self.df['bearish_fvg_count'] > self.df['bullish_fvg_count'], 'fvg_signal'] = -1
             
             # BOS sinyalleri
             self.df['bos_signal'] = 0
-            # Bullish BOS varsa alış sinyali
-            self.df.loc[self.df['bullish_bos'] == True, 'bos_signal'] = 1
-            # Bearish BOS varsa satış sinyali
-            self.df.loc[self.df['bearish_bos'] == True, 'bos_signal'] = -1
+            if has_bos:
+                # Bullish BOS varsa alış sinyali
+                self.df.loc[self.df['bullish_bos'] == True, 'bos_signal'] = 1
+                # Bearish BOS varsa satış sinyali
+                self.df.loc[self.df['bearish_bos'] == True, 'bos_signal'] = -1
             
             # FVG + BOS Kombo sinyali
             self.df['fvg_bos_combo_signal'] = 0
-            # Bullish FVG ve Bullish BOS birlikte varsa güçlü alış sinyali
-            self.df.loc[(self.df['bullish_fvg_count'] > 0) & (self.df['bullish_bos'] == True), 'fvg_bos_combo_signal'] = 2
-            # Bearish FVG ve Bearish BOS birlikte varsa güçlü satış sinyali
-            self.df.loc[(self.df['bearish_fvg_count'] > 0) & (self.df['bearish_bos'] == True), 'fvg_bos_combo_signal'] = -2
+            if has_fvg and has_bos:
+                # Bullish FVG ve Bullish BOS birlikte varsa güçlü alış sinyali
+                self.df.loc[(self.df['bullish_fvg_count'] > 0) & (self.df['bullish_bos'] == True), 'fvg_bos_combo_signal'] = 2
+                # Bearish FVG ve Bearish BOS birlikte varsa güçlü satış sinyali
+                self.df.loc[(self.df['bearish_fvg_count'] > 0) & (self.df['bearish_bos'] == True), 'fvg_bos_combo_signal'] = -2
             
             # Genel sinyal (tüm sinyallerin toplamı)
             self.df['overall_signal'] = (
@@ -0,0 +1,117 @@
+import itertools
+import json
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # orjson isteğe bağlıdır; yoksa standart json kullanılır
+    orjson = None
+
+# Binance kline satırındaki alan sırası (son alan 'ignore' kullanılmaz)
+KLINE_FIELDS = (
+    'open_time', 'open', 'high', 'low', 'close', 'volume',
+    'close_time', 'quote_asset_volume', 'number_of_trades',
+    'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume'
+)
+
+INT_FIELDS = ('open_time', 'close_time', 'number_of_trades')
+
+# get_klines DataFrame sütunları
+KLINE_COLUMNS = ('timestamp',) + KLINE_FIELDS[1:]
+
+
+def _loads(payload):
+    return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+
+def _matrix_to_columns(matrix):
+    columns = {}
+    for position, field in enumerate(KLINE_FIELDS):
+        if field in INT_FIELDS:
+            columns[field] = matrix[:, position].astype(np.int64)
+        else:
+            columns[field] = np.ascontiguousarray(matrix[:, position])
+    return columns
+
+
+def decode_klines(payload):
+    """
+    Ham ``/api/v3/klines`` JSON yanıtını tipli NumPy sütunlarına çözer.
+
+    Kline alanlarının tümü sayı veya sayısal metin olduğu için tırnaklar kaldırılarak yük tek
+    geçişte sayılara çözülür ve doğrudan float64 matrise aktarılır; ara metin nesneleri oluşmaz.
+    Zaman damgaları ve işlem sayıları float64'te tam olarak temsil edilebilir (< 2**53).
+
+    Args:
+        payload (bytes): Yanıt gövdesi
+
+    Returns:
+        dict: Alan adı -> numpy.ndarray (``KLINE_FIELDS``; zaman ve sayı alanları int64)
+    """
+    rows = _loads(payload.replace(b'"', b''))
+    return rows_to_columns(rows)
+
+
+def rows_to_columns(rows):
+    """
+    Kline satırlarını (API listeleri veya depo satırları) tipli NumPy sütunlarına dönüştürür.
+
+    Args:
+        rows (list): Her biri en az ``KLINE_FIELDS`` kadar alan içeren satırlar
+
+    Returns:
+        dict: Alan adı -> numpy.ndarray
+    """
+    count = len(rows)
+    width = len(KLINE_FIELDS)
+    if not count:
+        return _matrix_to_columns(np.empty((0, width), dtype=np.float64))
+
+    try:
+        values = itertools.chain.from_iterable(row[:width] for row in rows)
+        matrix = np.fromiter(values, dtype=np.float64, count=count * width).reshape(count, width)
+    except (TypeError, ValueError):
+        # Metin alanlı satırlar (ör. python-binance çıktısı)
+        matrix = np.array([row[:width] for row in rows], dtype=object).astype(np.float64)
+    return _matrix_to_columns(matrix)
+
+
+def _to_datetime(milliseconds):
+    # pd.to_datetime(unit='ms') ile aynı sonuç; doğrudan datetime64[ns] dizisi üretir
+    return milliseconds.astype('datetime64[ms]').astype('datetime64[ns]')
+
+
+def columns_length(columns):
+    """Sütun sözlüğündeki mum sayısı."""
+    return len(columns['open_time'])
+
+
+def columns_to_dataframe(columns):
+    """
+    Tipli kline sütunlarından ``get_klines`` DataFrame'ini oluşturur.
+
+    Returns:
+        pandas.DataFrame: timestamp, OHLCV ve diğer kline sütunları
+    """
+    data = {'timestamp': _to_datetime(columns['open_time'])}
+    for field in KLINE_FIELDS[1:]:
+        if field == 'close_time':
+            data[field] = _to_datetime(columns[field])
+        else:
+            data[field] = columns[field]
+    return pd.DataFrame(data)
+
+
+def klines_to_dataframe(klines):
+    """
+    Ham kline satırlarını ``get_klines`` DataFrame formatına dönüştürür.
+
+    Args:
+        klines (list): ``Client.get_klines`` çıktısı veya depo satırları
+
+    Returns:
+        pandas.DataFrame: OHLCV ve diğer kline sütunları
+    """
+    return columns_to_dataframe(rows_to_columns(klines))
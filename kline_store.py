@@ -0,0 +1,279 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from kline_decoder import KLINE_FIELDS, rows_to_columns, columns_length
+
+# Loglama ayarları
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Sabit uzunluklu zaman aralıkları (milisaniye). '1M' değişken uzunlukta olduğu için depolanmaz.
+INTERVAL_MS = {
+    '1m': 60_000,
+    '3m': 3 * 60_000,
+    '5m': 5 * 60_000,
+    '15m': 15 * 60_000,
+    '30m': 30 * 60_000,
+    '1h': 3_600_000,
+    '2h': 2 * 3_600_000,
+    '4h': 4 * 3_600_000,
+    '6h': 6 * 3_600_000,
+    '8h': 8 * 3_600_000,
+    '12h': 12 * 3_600_000,
+    '1d': 86_400_000,
+    '3d': 3 * 86_400_000,
+    '1w': 7 * 86_400_000,
+}
+
+# Tek kline isteğinde alınabilecek en fazla mum sayısı
+MAX_KLINES_PER_REQUEST = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS klines (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    open_time INTEGER NOT NULL,
+    open REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    close REAL NOT NULL,
+    volume REAL NOT NULL,
+    close_time INTEGER NOT NULL,
+    quote_asset_volume REAL NOT NULL,
+    number_of_trades INTEGER NOT NULL,
+    taker_buy_base_asset_volume REAL NOT NULL,
+    taker_buy_quote_asset_volume REAL NOT NULL,
+    PRIMARY KEY (symbol, interval, open_time)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS kline_history (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    first_open_time INTEGER NOT NULL,
+    PRIMARY KEY (symbol, interval)
+);
+
+CREATE TABLE IF NOT EXISTS kline_gaps (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    start_time INTEGER NOT NULL,
+    end_time INTEGER NOT NULL,
+    PRIMARY KEY (symbol, interval, start_time)
+);
+"""
+
+
+class KlineStore:
+    """
+    Sembol ve zaman aralığına göre anahtarlanmış, SQLite tabanlı yerel mum deposu.
+
+    Kapanmış mumlar değişmediği için yalnızca son kayıtlı mumdan sonrası ağdan alınır; son
+    kayıtlı mum (henüz kapanmamış olabilir) her senkronizasyonda yeniden yazılır. İstenen
+    pencere içindeki boşluklar ve eksik eski mumlar ayrıca tamamlanır; alındığı halde boş kalan
+    aralıklar (borsa kesintileri) ``kline_gaps`` tablosuna yazılır ve tekrar istenmez. Sembol ve
+    zaman aralığı başına en yeni ``max_candles`` mum tutulur, daha eskileri silinir.
+
+    Depo thread'ler arasında paylaşılabilir; tüm veritabanı erişimi tek bir kilitle yapılır.
+    """
+
+    def __init__(self, path, max_candles=None):
+        """
+        Args:
+            path (str): SQLite dosya yolu (``':memory:'`` bellek içi depo oluşturur)
+            max_candles (int, optional): Sembol/zaman aralığı başına tutulacak en fazla mum
+                (istenen ``limit`` daha büyükse o kullanılır). None ise sınırsız
+        """
+        self.path = path
+        self.max_candles = max_candles
+        directory = os.path.dirname(path)
+        if directory and path != ':memory:':
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            if path != ':memory:':
+                self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def save(self, symbol, interval, klines):
+        """
+        Kline sütunlarını depoya yazar; aynı açılış zamanlı satırların üzerine yazar.
+
+        Args:
+            symbol (str): Sembol
+            interval (str): Zaman aralığı
+            klines (dict): Alan adı -> numpy.ndarray (bkz. ``kline_decoder.decode_klines``)
+        """
+        count = columns_length(klines)
+        if not count:
+            return
+
+        rows = zip(
+            [symbol] * count, [interval] * count,
+            *(klines[field].tolist() for field in KLINE_FIELDS)
+        )
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO klines (symbol, interval, {', '.join(KLINE_FIELDS)}) "
+                f"VALUES ({', '.join('?' * (len(KLINE_FIELDS) + 2))})",
+                rows
+            )
+
+    def load(self, symbol, interval, limit=500):
+        """
+        Son ``limit`` mumu eskiden yeniye sıralı olarak döndürür.
+
+        Returns:
+            dict: Alan adı -> numpy.ndarray
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(KLINE_FIELDS)} FROM klines WHERE symbol = ? AND interval = ? "
+                "ORDER BY open_time DESC LIMIT ?",
+                (symbol, interval, limit)
+            ).fetchall()
+        rows.reverse()
+        return rows_to_columns(rows)
+
+    def _open_times(self, symbol, interval, limit):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT open_time FROM klines WHERE symbol = ? AND interval = ? "
+                "ORDER BY open_time DESC LIMIT ?",
+                (symbol, interval, limit)
+            ).fetchall()
+        return [row[0] for row in reversed(rows)]
+
+    def _first_open_time(self, symbol, interval):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT first_open_time FROM kline_history WHERE symbol = ? AND interval = ?",
+                (symbol, interval)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set_first_open_time(self, symbol, interval, open_time):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kline_history (symbol, interval, first_open_time) VALUES (?, ?, ?)",
+                (symbol, interval, open_time)
+            )
+
+    def _is_known_gap(self, symbol, interval, start_time, end_time):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM kline_gaps WHERE symbol = ? AND interval = ? "
+                "AND start_time <= ? AND end_time >= ? LIMIT 1",
+                (symbol, interval, start_time, end_time)
+            ).fetchone()
+        return row is not None
+
+    def _add_gap(self, symbol, interval, start_time, end_time):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kline_gaps (symbol, interval, start_time, end_time) VALUES (?, ?, ?, ?)",
+                (symbol, interval, start_time, end_time)
+            )
+
+    def prune(self, symbol, interval, keep):
+        """
+        Sembol ve zaman aralığı için en yeni ``keep`` mum dışındaki kayıtları siler.
+
+        Args:
+            symbol (str): Sembol
+            interval (str): Zaman aralığı
+            keep (int): Tutulacak mum sayısı
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT open_time FROM klines WHERE symbol = ? AND interval = ? "
+                "ORDER BY open_time DESC LIMIT 1 OFFSET ?",
+                (symbol, interval, keep - 1)
+            ).fetchone()
+            if row is None:
+                return
+            self._conn.execute(
+                "DELETE FROM klines WHERE symbol = ? AND interval = ? AND open_time < ?",
+                (symbol, interval, row[0])
+            )
+            self._conn.execute(
+                "DELETE FROM kline_gaps WHERE symbol = ? AND interval = ? AND end_time < ?",
+                (symbol, interval, row[0])
+            )
+
+    def sync(self, fetch, symbol, interval, limit=500):
+        """
+        Depoyu ağdaki verilerle senkronize eder ve son ``limit`` mumu döndürür.
+
+        Depo güncelse tek bir küçük istek (son kayıtlı mumdan itibaren) yeterlidir. Depo boşsa
+        veya son kayıttan bu yana ``limit`` kadar mum geçmişse son ``limit`` mum baştan alınır.
+
+        Args:
+            fetch (callable): ``Client.get_klines`` parametrelerini (symbol, interval, limit,
+                startTime, endTime) alan ve kline sütunları döndüren fonksiyon
+            symbol (str): Sembol
+            interval (str): Zaman aralığı (``INTERVAL_MS`` içinde olmalıdır)
+            limit (int): Döndürülecek mum sayısı
+
+        Returns:
+            dict: Eskiden yeniye sıralı kline sütunları
+        """
+        step = INTERVAL_MS[interval]
+        open_times = self._open_times(symbol, interval, 1)
+        now = int(time.time() * 1000)
+
+        if not open_times or (now - open_times[-1]) // step >= limit:
+            # Boş veya çok eski depo: son 'limit' mumu doğrudan al
+            klines = fetch(symbol=symbol, interval=interval, limit=limit)
+            self.save(symbol, interval, klines)
+            if 0 < columns_length(klines) < limit:
+                self._set_first_open_time(symbol, interval, int(klines['open_time'][0]))
+        else:
+            # Son kayıtlı mumdan itibaren yeni mumları al (son mum güncellenmiş olabilir)
+            klines = fetch(symbol=symbol, interval=interval, startTime=open_times[-1],
+                           limit=MAX_KLINES_PER_REQUEST)
+            self.save(symbol, interval, klines)
+
+        self._backfill(fetch, symbol, interval, limit, step)
+        if self.max_candles:
+            self.prune(symbol, interval, max(self.max_candles, limit))
+        return self.load(symbol, interval, limit)
+
+    def _backfill(self, fetch, symbol, interval, limit, step):
+        """İstenen pencere içindeki boşlukları ve eksik eski mumları tamamlar."""
+        open_times = self._open_times(symbol, interval, limit)
+        if not open_times:
+            return
+
+        # Ardışık mumlar arasındaki boşluklar (daha önce alınıp boş kalanlar atlanır)
+        for previous, current in zip(open_times, open_times[1:]):
+            start_time, end_time = previous + step, current - 1
+            if current - previous <= step or self._is_known_gap(symbol, interval, start_time, end_time):
+                continue
+
+            logger.info(f"{symbol} {interval} için eksik mumlar tamamlanıyor.")
+            klines = fetch(symbol=symbol, interval=interval, startTime=start_time,
+                           endTime=end_time, limit=MAX_KLINES_PER_REQUEST)
+            self.save(symbol, interval, klines)
+            if columns_length(klines) < MAX_KLINES_PER_REQUEST:
+                # Aralığın tamamı alındı; kalan boşluklar borsada da yok
+                self._add_gap(symbol, interval, start_time, end_time)
+
+        # Pencerenin başındaki eksik mumlar (sembolün ilk mumuna ulaşılmadıysa)
+        open_times = self._open_times(symbol, interval, limit)
+        missing = limit - len(open_times)
+        first_open_time = self._first_open_time(symbol, interval)
+        if missing > 0 and (first_open_time is None or open_times[0] > first_open_time):
+            klines = fetch(symbol=symbol, interval=interval, endTime=open_times[0] - 1, limit=missing)
+            self.save(symbol, interval, klines)
+            if columns_length(klines) < missing:
+                first = klines['open_time'][0] if columns_length(klines) else open_times[0]
+                self._set_first_open_time(symbol, interval, int(first))
@@ -0,0 +1,415 @@
+import json
+import logging
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import websocket
+
+from config import BINANCE_WS_URL
+from incremental_indicators import IncrementalIndicators, select_indicators
+
+# Loglama ayarları
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Bağlantı koptuğunda yeniden bağlanmadan önce beklenecek süre (saniye)
+RECONNECT_DELAY = 5
+
+# Bu süre boyunca okunmayan akışlar kapatılır (saniye)
+STREAM_IDLE_TIMEOUT = 300
+
+FLOAT_COLUMNS = (
+    'open', 'high', 'low', 'close', 'volume',
+    'quote_asset_volume', 'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume'
+)
+
+
+class KlineRingBuffer:
+    """
+    Sabit kapasiteli, sütun tabanlı mum halkası.
+
+    Satırlar ``Client.get_klines`` alan sırasıyla eklenir. Son mumla aynı açılış zamanına sahip
+    satır son mumun üzerine yazılır (kapanmamış mum güncellemesi), daha yeni satır ise en eski
+    mumun yerine geçer.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._open_time = np.zeros(capacity, dtype=np.int64)
+        self._close_time = np.zeros(capacity, dtype=np.int64)
+        self._number_of_trades = np.zeros(capacity, dtype=np.int64)
+        self._floats = np.zeros((len(FLOAT_COLUMNS), capacity), dtype=np.float64)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def last_open_time(self):
+        """Son mumun açılış zamanı (milisaniye), halka boşsa None."""
+        if not self._size:
+            return None
+        return int(self._open_time[(self._start + self._size - 1) % self.capacity])
+
+    def grow(self, capacity):
+        """
+        Kapasiteyi mevcut mumları koruyarak büyütür (daha küçük kapasite yok sayılır).
+
+        Args:
+            capacity (int): Yeni kapasite
+        """
+        if capacity <= self.capacity:
+            return
+
+        index = (self._start + np.arange(self._size)) % self.capacity
+        size = self._size
+        open_time = np.zeros(capacity, dtype=np.int64)
+        close_time = np.zeros(capacity, dtype=np.int64)
+        number_of_trades = np.zeros(capacity, dtype=np.int64)
+        floats = np.zeros((len(FLOAT_COLUMNS), capacity), dtype=np.float64)
+        open_time[:size] = self._open_time[index]
+        close_time[:size] = self._close_time[index]
+        number_of_trades[:size] = self._number_of_trades[index]
+        floats[:, :size] = self._floats[:, index]
+
+        self.capacity = capacity
+        self._open_time = open_time
+        self._close_time = close_time
+        self._number_of_trades = number_of_trades
+        self._floats = floats
+        self._start = 0
+
+    def push(self, row):
+        """
+        Tek bir mumu ekler veya son mumu günceller.
+
+        Args:
+            row (tuple): (open_time, open, high, low, close, volume, close_time, quote_asset_volume,
+                number_of_trades, taker_buy_base_asset_volume, taker_buy_quote_asset_volume)
+
+        Returns:
+            bool: Halka değiştiyse True (son mumdan eski satırlar yok sayılır)
+        """
+        last_open_time = self.last_open_time
+        if last_open_time is not None and row[0] < last_open_time:
+            return False
+
+        if last_open_time is not None and row[0] == last_open_time:
+            slot = (self._start + self._size - 1) % self.capacity
+        elif self._size < self.capacity:
+            slot = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self.capacity
+
+        self._open_time[slot] = row[0]
+        self._floats[:, slot] = (row[1], row[2], row[3], row[4], row[5], row[7], row[9], row[10])
+        self._close_time[slot] = row[6]
+        self._number_of_trades[slot] = row[8]
+        return True
+
+    def load_frame(self, df):
+        """
+        Halkayı ``get_klines`` DataFrame'i ile yeniden doldurur.
+
+        DataFrame'deki son mumdan daha yeni olan mevcut mumlar korunur.
+        """
+        newer = self.to_frame()
+        seed = df.tail(self.capacity)
+        open_time = seed['timestamp'].to_numpy('datetime64[ms]').astype(np.int64)
+        if len(open_time):
+            newer = newer[newer['timestamp'] > seed['timestamp'].iloc[-1]]
+
+        size = len(seed)
+        self._start = 0
+        self._size = size
+        self._open_time[:size] = open_time
+        self._close_time[:size] = seed['close_time'].to_numpy('datetime64[ms]').astype(np.int64)
+        self._number_of_trades[:size] = seed['number_of_trades'].to_numpy(dtype=np.int64)
+        for i, column in enumerate(FLOAT_COLUMNS):
+            self._floats[i, :size] = seed[column].to_numpy(dtype=np.float64)
+
+        for row in newer.itertuples(index=False):
+            self.push((
+                int(row.timestamp.value // 1_000_000), row.open, row.high, row.low, row.close, row.volume,
+                int(row.close_time.value // 1_000_000), row.quote_asset_volume, row.number_of_trades,
+                row.taker_buy_base_asset_volume, row.taker_buy_quote_asset_volume
+            ))
+
+    def to_frame(self):
+        """
+        Halkadaki mumları eskiden yeniye sıralı olarak döndürür.
+
+        Returns:
+            pandas.DataFrame: ``get_klines`` ile aynı sütunlar
+        """
+        index = (self._start + np.arange(self._size)) % self.capacity
+        floats = dict(zip(FLOAT_COLUMNS, self._floats[:, index]))
+        return pd.DataFrame({
+            'timestamp': pd.to_datetime(self._open_time[index], unit='ms'),
+            **{column: floats[column] for column in ('open', 'high', 'low', 'close', 'volume')},
+            'close_time': pd.to_datetime(self._close_time[index], unit='ms'),
+            'quote_asset_volume': floats['quote_asset_volume'],
+            'number_of_trades': self._number_of_trades[index],
+            'taker_buy_base_asset_volume': floats['taker_buy_base_asset_volume'],
+            'taker_buy_quote_asset_volume': floats['taker_buy_quote_asset_volume'],
+        })
+
+
+def _candle(row):
+    """Halka satırını ``KlineRingBuffer.to_frame`` sütunlarıyla aynı mum sözlüğüne çevirir."""
+    return {
+        'timestamp': pd.Timestamp(row[0], unit='ms'),
+        'open': row[1],
+        'high': row[2],
+        'low': row[3],
+        'close': row[4],
+        'volume': row[5],
+        'close_time': pd.Timestamp(row[6], unit='ms'),
+        'quote_asset_volume': row[7],
+        'number_of_trades': row[8],
+        'taker_buy_base_asset_volume': row[9],
+        'taker_buy_quote_asset_volume': row[10],
+    }
+
+
+class KlineStream:
+    """
+    ``<symbol>@kline_<interval>`` WebSocket akışını arka planda dinleyen tüketici.
+
+    Başlangıçta ve her yeniden bağlantıda ``seed`` ile (REST) geçmiş mumlar alınır, ardından
+    akıştan gelen her mesaj halkaya yazılır. Okuyucular ``snapshot`` ile güncel mumları,
+    ``indicator_frame`` ile indikatörleri eklenmiş mumları alır, ``wait_for_update`` ile yeni
+    mesajları bekler. İndikatörler ilk okumada halkadan bir kez hesaplanır, sonra her mesajda
+    ``IncrementalIndicators`` ile mum başına sabit sürede güncellenir.
+    """
+
+    def __init__(self, symbol, interval, capacity, seed=None, url=BINANCE_WS_URL):
+        """
+        Args:
+            symbol (str): Sembol
+            interval (str): Zaman aralığı
+            capacity (int): Halkada tutulacak mum sayısı
+            seed (callable): ``get_klines`` formatında DataFrame döndüren fonksiyon
+            url (str): WebSocket temel adresi (ör. yerel test sunucusu: ws://127.0.0.1:9000)
+        """
+        self.symbol = symbol.upper()
+        self.interval = interval
+        self.url = url.rstrip('/')
+        self.buffer = KlineRingBuffer(capacity)
+        self.version = 0
+        self.last_message = None
+        self.last_access = time.monotonic()
+        self._seed = seed
+        self._indicators = None
+        # Geçmiş mumlar yüklenirken (ilk açılış veya büyütme) temizlenir; okuyucular bekler
+        self.seeded = threading.Event()
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._connected_once = False
+        self._thread = None
+        self._ws = None
+
+    @property
+    def stream_name(self):
+        return f"{self.symbol.lower()}@kline_{self.interval}"
+
+    def start(self):
+        """Geçmiş mumları yükler ve dinleyici thread'ini başlatır."""
+        try:
+            self._resync()
+        finally:
+            self.seeded.set()
+        self._thread = threading.Thread(target=self._run, name=f"kline-stream-{self.stream_name}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Akışı kapatır."""
+        self._stopped.set()
+        if self._ws is not None:
+            self._ws.close()
+
+    def ensure_capacity(self, capacity, seed=None):
+        """
+        Halkayı en az ``capacity`` mum tutacak şekilde yerinde büyütür ve eksik geçmişi yükler.
+
+        Akış nesnesi değişmediği için onu izleyen diğer oturumlar çalışmaya devam eder.
+
+        Args:
+            capacity (int): Gereken en az mum sayısı
+            seed (callable, optional): Daha uzun geçmişi döndüren ``get_klines`` fonksiyonu;
+                sonraki yeniden bağlantılarda da kullanılır
+        """
+        with self._condition:
+            if self.buffer.capacity >= capacity:
+                return
+            self.buffer.grow(capacity)
+            self._indicators = None
+            if seed is not None:
+                self._seed = seed
+            self.seeded.clear()
+        try:
+            self._resync()
+        finally:
+            self.seeded.set()
+
+    def _resync(self):
+        """Bağlantı dışında kalan mumları REST ile tamamlar."""
+        if self._seed is None:
+            return
+        try:
+            df = self._seed()
+        except Exception as e:
+            logger.error(f"{self.stream_name} için geçmiş mumlar alınamadı: {e}")
+            return
+        if df is None or df.empty:
+            return
+
+        with self._condition:
+            self.buffer.load_frame(df)
+            # Geçmiş değişti; indikatörler bir sonraki okumada halkadan yeniden kurulur
+            self._indicators = None
+            self.version += 1
+            self._condition.notify_all()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._ws = websocket.WebSocketApp(
+                f"{self.url}/ws/{self.stream_name}",
+                on_open=self._on_open,
+                on_message=self._on_message,
+                on_error=self._on_error
+            )
+            self._ws.run_forever(ping_interval=20, ping_timeout=10)
+            if self._stopped.is_set():
+                break
+            logger.warning(f"{self.stream_name} bağlantısı koptu, {RECONNECT_DELAY} saniye sonra yeniden bağlanılacak.")
+            self._stopped.wait(RECONNECT_DELAY)
+
+    def _on_open(self, ws):
+        if self._connected_once:
+            self._resync()
+        self._connected_once = True
+
+    def _on_message(self, ws, message):
+        try:
+            payload = json.loads(message)
+            kline = payload.get('data', payload)['k']
+            row = (
+                int(kline['t']), float(kline['o']), float(kline['h']), float(kline['l']), float(kline['c']),
+                float(kline['v']), int(kline['T']), float(kline['q']), int(kline['n']),
+                float(kline['V']), float(kline['Q'])
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error(f"{self.stream_name} mesajı çözümlenemedi: {e}")
+            return
+
+        with self._condition:
+            if self.buffer.push(row):
+                if self._indicators is not None:
+                    self._indicators.update(_candle(row))
+                self.version += 1
+                self.last_message = time.time()
+                self._condition.notify_all()
+
+    def _on_error(self, ws, error):
+        logger.error(f"{self.stream_name} akışında hata: {error}")
+
+    def snapshot(self):
+        """
+        Halkadaki güncel mumları döndürür.
+
+        Returns:
+            pandas.DataFrame: ``get_klines`` ile aynı sütunlar
+        """
+        with self._condition:
+            self.last_access = time.monotonic()
+            return self.buffer.to_frame()
+
+    def indicator_frame(self, selected_indicators=None):
+        """
+        Halkadaki mumları indikatörleriyle birlikte döndürür.
+
+        Args:
+            selected_indicators (list, optional): Seçilen indikatörler (bkz. ``select_indicators``)
+
+        Returns:
+            pandas.DataFrame: ``add_all_indicators(selected_indicators)`` ile aynı sütunlar
+        """
+        with self._condition:
+            self.last_access = time.monotonic()
+            if self._indicators is None:
+                self._indicators = IncrementalIndicators.from_dataframe(
+                    self.buffer.to_frame(), max_rows=self.buffer.capacity
+                )
+            frame = self._indicators.to_dataframe()
+            params = self._indicators.params
+        return select_indicators(frame, selected_indicators, params)
+
+    def wait_for_update(self, version, timeout=None):
+        """
+        Halka ``version`` sürümünden farklı olana kadar (en fazla ``timeout`` saniye) bekler.
+
+        Returns:
+            int: Güncel sürüm
+        """
+        with self._condition:
+            self.last_access = time.monotonic()
+            self._condition.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+
+# Süreç genelinde paylaşılan akışlar: (sembol, zaman aralığı) -> KlineStream
+_streams = {}
+_streams_lock = threading.Lock()
+
+
+def get_kline_stream(symbol, interval, capacity, seed=None):
+    """
+    Paylaşılan kline akışını döndürür, yoksa başlatır.
+
+    Aynı sembol ve zaman aralığı için tüm oturumlar tek bir WebSocket bağlantısı kullanır. Daha fazla
+    mum isteyen bir oturum için mevcut akışın halkası yerinde büyütülür.
+    ``STREAM_IDLE_TIMEOUT`` süresince okunmayan akışlar kapatılır.
+
+    Akış paylaşılan kilit altında yalnızca kaydedilir; geçmiş mumların REST ile yüklenmesi kilit
+    bırakıldıktan sonra yapılır. Böylece uzun bir yükleme diğer akışları açan oturumları bekletmez;
+    aynı akışı isteyen oturumlar yalnızca yükleme bitene kadar (``seeded``) bekler.
+
+    Args:
+        symbol (str): Sembol
+        interval (str): Zaman aralığı
+        capacity (int): Gereken en az mum sayısı
+        seed (callable): ``get_klines`` formatında DataFrame döndüren fonksiyon
+
+    Returns:
+        KlineStream: Çalışan akış
+    """
+    key = (symbol.upper(), interval)
+    now = time.monotonic()
+    with _streams_lock:
+        for idle_key, idle_stream in list(_streams.items()):
+            if idle_key != key and now - idle_stream.last_access > STREAM_IDLE_TIMEOUT:
+                idle_stream.stop()
+                del _streams[idle_key]
+
+        stream = _streams.get(key)
+        created = stream is None
+        if created:
+            stream = KlineStream(symbol, interval, capacity, seed=seed)
+            _streams[key] = stream
+        stream.last_access = now
+
+    if created:
+        stream.start()
+    elif stream.buffer.capacity < capacity:
+        # Akış değiştirilmez; diğer oturumların izlediği nesne yerinde büyütülür
+        stream.ensure_capacity(capacity, seed)
+
+    stream.seeded.wait()
+    return stream
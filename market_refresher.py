@@ -0,0 +1,325 @@
+import logging
+import threading
+import time
+
+from config import (
+    MARKET_REFRESH_MAX_AGE, MARKET_REFRESH_CLOSE_DELAY, TICKER_REFRESH_SECONDS,
+    MARKET_REFRESH_IDLE_TIMEOUT
+)
+from binance_api import get_binance_api
+from indicator_cache import get_indicator_cache, indicator_key
+from kline_store import INTERVAL_MS
+
+# Loglama ayarları
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Arka planda tutulan en yüksek hacimli sembol sayısı (tarayıcının kullandığı en büyük liste)
+TOP_SYMBOLS_LIMIT = 50
+
+
+class MarketSnapshot:
+    """Bir (sembol, zaman aralığı, limit, indikatörler) aboneliğinin en son hesaplanan verisi."""
+
+    __slots__ = ('frame', 'updated_at', 'close_time')
+
+    def __init__(self, frame, updated_at, close_time):
+        """
+        Args:
+            frame (pandas.DataFrame): İndikatörleri eklenmiş mum verileri
+            updated_at (float): Yenilenme zamanı (epoch saniye)
+            close_time (pandas.Timestamp): Son mumun kapanış zamanı
+        """
+        self.frame = frame
+        self.updated_at = updated_at
+        self.close_time = close_time
+
+
+class _Feed:
+    """Bir (sembol, zaman aralığı, limit) için tek seferde alınan mumlar ve ona bağlı abonelikler."""
+
+    __slots__ = ('symbol', 'interval', 'limit', 'frame', 'next_due', 'subscriptions', 'loading')
+
+    def __init__(self, symbol, interval, limit):
+        self.symbol = symbol
+        self.interval = interval
+        self.limit = limit
+        self.frame = None
+        self.next_due = 0.0
+        self.subscriptions = {}
+        # İlk mumlar bir oturum tarafından alınırken True; diğer oturumlar yeniden almak yerine bekler
+        self.loading = False
+
+
+class _Subscription:
+    __slots__ = ('indicators', 'snapshot', 'last_access')
+
+    def __init__(self, indicators):
+        self.indicators = indicators
+        self.snapshot = None
+        self.last_access = time.monotonic()
+
+
+def next_refresh_time(interval, now=None):
+    """
+    Bir sonraki yenileme zamanını (epoch saniye) hesaplar.
+
+    Yenileme, mum kapanışından ``MARKET_REFRESH_CLOSE_DELAY`` saniye sonraya hizalanır; kapanmamış
+    mumun fiyatı da güncel kalsın diye en geç ``MARKET_REFRESH_MAX_AGE`` saniye sonra yapılır.
+    Değişken uzunluktaki aralıklar ('1M') yalnızca ``MARKET_REFRESH_MAX_AGE`` ile yenilenir.
+
+    Args:
+        interval (str): Zaman aralığı
+        now (float, optional): Şimdiki zaman (epoch saniye)
+
+    Returns:
+        float: Yenileme zamanı (epoch saniye)
+    """
+    now = time.time() if now is None else now
+    latest = now + MARKET_REFRESH_MAX_AGE
+    step = INTERVAL_MS.get(interval)
+    if step is None:
+        return latest
+
+    now_ms = int(now * 1000)
+    next_close = (now_ms // step + 1) * step / 1000 + MARKET_REFRESH_CLOSE_DELAY
+    return min(next_close, latest)
+
+
+class MarketDataRefresher:
+    """
+    Piyasa verilerini Streamlit betiğinden bağımsız olarak arka planda yenileyen zamanlayıcı.
+
+    En yüksek hacimli semboller ``TICKER_REFRESH_SECONDS`` aralıklarla, izlenen (sembol, zaman
+    aralığı) mumları ve indikatörleri ise mum kapanışlarına hizalı olarak tek bir thread'de
+    yenilenir. Mumlar (sembol, zaman aralığı, limit) başına bir kez alınır ve farklı indikatör
+    seçimli tüm aboneliklere dağıtılır. Arayüz yalnızca en son anlık görüntüleri okur; yalnızca ilk
+    kez istenen bir abonelik için veri çağıran thread'de bir kez hesaplanır.
+    ``MARKET_REFRESH_IDLE_TIMEOUT`` süresince okunmayan abonelikler bırakılır.
+    """
+
+    def __init__(self, binance_api=None):
+        """
+        Args:
+            binance_api (BinanceAPI, optional): Veri kaynağı; verilmezse paylaşılan
+                ``get_binance_api()`` nesnesi kullanılır
+        """
+        self._binance_api = binance_api
+        self.refresh_count = 0
+        self.error_count = 0
+        self._feeds = {}
+        self._top_symbols = None
+        self._top_symbols_due = 0.0
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def binance_api(self):
+        # Bağlantı kurulamadıysa paylaşılan nesne saklanmaz; her çağrıda yeniden denenir
+        return self._binance_api if self._binance_api is not None else get_binance_api()
+
+    def start(self):
+        """Zamanlayıcı thread'ini başlatır."""
+        self._thread = threading.Thread(target=self._run, name="market-data-refresher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Zamanlayıcıyı durdurur."""
+        self._stopped.set()
+        with self._condition:
+            self._condition.notify_all()
+
+    def get_top_symbols(self, limit=10):
+        """
+        En yüksek hacimli sembollerin son anlık görüntüsünü döndürür.
+
+        Args:
+            limit (int): Sembol sayısı (en fazla ``TOP_SYMBOLS_LIMIT``)
+
+        Returns:
+            list: ``get_top_symbols_live`` formatında sözlükler
+        """
+        with self._condition:
+            top_symbols = self._top_symbols
+        if top_symbols is None:
+            top_symbols = self._refresh_top_symbols()
+        return top_symbols[:limit]
+
+    def get_snapshot(self, symbol, interval, limit, indicators):
+        """
+        Mum ve indikatör verilerinin son anlık görüntüsünü döndürür; aboneliği yoksa oluşturur.
+
+        Args:
+            symbol (str): Sembol
+            interval (str): Zaman aralığı
+            limit (int): Mum sayısı
+            indicators (list): Hesaplanacak indikatörler
+
+        Returns:
+            MarketSnapshot: Son anlık görüntü (veri alınamadıysa None)
+        """
+        indicators = indicator_key(indicators)
+        with self._condition:
+            feed = self._feeds.get((symbol, interval, limit))
+            if feed is None:
+                feed = _Feed(symbol, interval, limit)
+                self._feeds[(symbol, interval, limit)] = feed
+            subscription = feed.subscriptions.get(indicators)
+            if subscription is None:
+                subscription = _Subscription(indicators)
+                feed.subscriptions[indicators] = subscription
+            subscription.last_access = time.monotonic()
+
+            # Aynı beslemeyi ilk kez açan başka bir oturum varsa onun isteği beklenir
+            waited = False
+            while feed.loading:
+                waited = True
+                self._condition.wait()
+
+            snapshot = subscription.snapshot
+            frame = feed.frame
+            load = snapshot is None and frame is None and not waited
+            if load:
+                feed.loading = True
+
+        if snapshot is None:
+            # İlk istek: mumlar henüz yoksa alınır, varsa yalnızca indikatörler hesaplanır.
+            # Beklenen istek başarısız olduysa mumlar hemen yeniden istenmez, None döner
+            if load:
+                try:
+                    self._refresh(feed)
+                finally:
+                    with self._condition:
+                        feed.loading = False
+                        self._condition.notify_all()
+            elif frame is not None:
+                self._compute(feed, subscription, frame)
+            with self._condition:
+                snapshot = subscription.snapshot
+                self._condition.notify_all()
+        return snapshot
+
+    def stats(self):
+        """Abonelik, yenileme ve indikatör önbelleği sayaçları."""
+        with self._condition:
+            stats = {
+                'feeds': len(self._feeds),
+                'subscriptions': sum(len(feed.subscriptions) for feed in self._feeds.values()),
+                'refresh_count': self.refresh_count,
+                'error_count': self.error_count,
+            }
+        stats['indicator_cache'] = get_indicator_cache().stats()
+        return stats
+
+    def _refresh_top_symbols(self):
+        top_symbols = self.binance_api.get_top_symbols_live(limit=TOP_SYMBOLS_LIMIT)
+        with self._condition:
+            if top_symbols or self._top_symbols is None:
+                self._top_symbols = top_symbols
+            self._top_symbols_due = time.time() + TICKER_REFRESH_SECONDS
+            return self._top_symbols
+
+    def _refresh(self, feed):
+        """Mumları bir kez alır ve bağlı tüm aboneliklerin indikatörlerini hesaplar."""
+        try:
+            df = self.binance_api.get_klines(symbol=feed.symbol, interval=feed.interval, limit=feed.limit)
+            if df.empty:
+                raise ValueError("boş mum verisi")
+        except Exception as e:
+            logger.error(f"{feed.symbol} {feed.interval} verileri yenilenemedi: {e}")
+            with self._condition:
+                self.error_count += 1
+                feed.next_due = next_refresh_time(feed.interval)
+            return
+
+        with self._condition:
+            feed.frame = df
+            subscriptions = list(feed.subscriptions.values())
+            self.refresh_count += 1
+
+        for subscription in subscriptions:
+            self._compute(feed, subscription, df)
+
+        with self._condition:
+            feed.next_due = next_refresh_time(feed.interval)
+
+    def _compute(self, feed, subscription, df):
+        """Aboneliğin indikatörlerini verilen mumlardan hesaplar."""
+        try:
+            frame = get_indicator_cache().get_frame(
+                df, feed.symbol, feed.interval, feed.limit, subscription.indicators
+            )
+            snapshot = MarketSnapshot(frame, time.time(), df['close_time'].iloc[-1])
+            with self._condition:
+                subscription.snapshot = snapshot
+        except Exception as e:
+            logger.error(f"{feed.symbol} {feed.interval} indikatörleri hesaplanamadı: {e}")
+            with self._condition:
+                self.error_count += 1
+
+    def _due_work(self):
+        """Zamanı gelen mum beslemelerini döndürür; boşta kalan abonelikleri bırakır."""
+        now = time.time()
+        idle_since = time.monotonic() - MARKET_REFRESH_IDLE_TIMEOUT
+        with self._condition:
+            for key, feed in list(self._feeds.items()):
+                for indicators, subscription in list(feed.subscriptions.items()):
+                    if subscription.last_access < idle_since:
+                        del feed.subscriptions[indicators]
+                if not feed.subscriptions:
+                    del self._feeds[key]
+
+            active = [feed for feed in self._feeds.values() if feed.frame is not None]
+            due = [feed for feed in active if feed.next_due <= now]
+            refresh_top = self._top_symbols is not None and self._top_symbols_due <= now
+
+            pending = [feed.next_due for feed in active]
+            if self._top_symbols is not None:
+                pending.append(self._top_symbols_due)
+            wake_at = min(pending, default=now + TICKER_REFRESH_SECONDS)
+        return due, refresh_top, wake_at
+
+    def _run(self):
+        while not self._stopped.is_set():
+            due, refresh_top, wake_at = self._due_work()
+
+            if refresh_top:
+                self._refresh_top_symbols()
+                cache = get_indicator_cache().stats()
+                logger.info(
+                    f"İndikatör önbelleği: {cache['entries']} kayıt, {cache['bytes'] / 1024 ** 2:.1f} MB, "
+                    f"{cache['hits']} isabet / {cache['misses']} ıska (%{cache['hit_rate'] * 100:.0f}), "
+                    f"{cache['evictions']} çıkarma"
+                )
+            for feed in due:
+                if self._stopped.is_set():
+                    return
+                self._refresh(feed)
+
+            if not due and not refresh_top:
+                with self._condition:
+                    self._condition.wait(max(wake_at - time.time(), 0.1))
+
+
+# Süreç genelinde paylaşılan zamanlayıcı
+_refresher = None
+_refresher_lock = threading.Lock()
+
+
+def get_market_refresher():
+    """
+    Paylaşılan ``MarketDataRefresher`` nesnesini döndürür, yoksa başlatır.
+
+    Zamanlayıcı süreç başına bir kez başlatılır ve tüm oturumlar aynı anlık görüntüleri okur.
+    Veri kaynağı olarak paylaşılan ``get_binance_api()`` nesnesi kullanılır.
+
+    Returns:
+        MarketDataRefresher: Çalışan zamanlayıcı
+    """
+    global _refresher
+    with _refresher_lock:
+        if _refresher is None:
+            _refresher = MarketDataRefresher().start()
+        return _refresher
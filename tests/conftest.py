@@ -0,0 +1,47 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kline_decoder import columns_to_dataframe, decode_klines  # noqa: E402
+
+# Ham ``/api/v3/klines`` yanıtı biçiminde 360 adet 1m mum: fiyatlar tick'e (0.00001) yuvarlı,
+# işlem olmayan dakikalarda düz (O=H=L=C, hacim 0) mumlar ve eşit tepe/dipler içerir
+SAMPLE_KLINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'klines_1m_sample.json')
+
+
+@pytest.fixture
+def make_klines():
+    """Sabit tohumlu, ``get_klines`` formatında sentetik mum verisi üreten fabrika."""
+    def factory(seed=0, count=300, freq='h'):
+        rng = np.random.default_rng(seed)
+        close = 100 * np.cumprod(1 + rng.normal(0, 0.02, count))
+        open_ = np.r_[close[0], close[:-1]]
+        high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.02, count))
+        low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.02, count))
+        timestamp = pd.date_range('2024-01-01', periods=count, freq=freq)
+        return pd.DataFrame({
+            'timestamp': timestamp,
+            'open': open_,
+            'high': high,
+            'low': low,
+            'close': close,
+            'volume': rng.uniform(1, 100, count),
+            'close_time': timestamp + pd.tseries.frequencies.to_offset(freq) - pd.Timedelta('1ms'),
+            'quote_asset_volume': rng.uniform(1, 1e4, count),
+            'number_of_trades': rng.integers(1, 1000, count),
+            'taker_buy_base_asset_volume': rng.uniform(1, 50, count),
+            'taker_buy_quote_asset_volume': rng.uniform(1, 5e3, count),
+        })
+    return factory
+
+
+@pytest.fixture
+def sample_klines():
+    """``tests/data/klines_1m_sample.json`` dosyasını ``get_klines`` formatında yükler."""
+    with open(SAMPLE_KLINES_PATH, 'rb') as f:
+        return columns_to_dataframe(decode_klines(f.read()))
@@ -0,0 +1,21 @@
+from batch_indicators import BatchIndicators, get_batch_signals
+from indicators import TechnicalIndicators, get_signals
+
+
+def test_batch_signals_match_get_signals(make_klines):
+    frames = {f"SYM{seed}": make_klines(seed) for seed in range(30)}
+
+    batch = get_batch_signals(frames)
+
+    assert set(batch) == set(frames)
+    for symbol, df in frames.items():
+        assert batch[symbol] == get_signals(TechnicalIndicators(df).add_all_indicators()), symbol
+
+
+def test_batch_signal_types(make_klines):
+    frames = {'BTCUSDT': make_klines(1)}
+
+    signals = BatchIndicators.from_frames(frames)[0].get_signals()['BTCUSDT']
+
+    assert all(type(entry['signal']) is int for entry in signals.values())
+    assert '.' not in signals['fvg']['value']
@@ -0,0 +1,114 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import binance_api
+from binance_api import BinanceAPI, _Client, rate_limiter
+
+STEP = 3_600_000
+
+
+class FakeBinanceHandler(BaseHTTPRequestHandler):
+    """``/api/v3/ping`` ve ``/api/v3/klines`` uç noktalarını gecikmeli ve ara sıra 429 ile yanıtlar."""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.request_count += 1
+            number = server.request_count
+
+        if self.path.startswith('/api/v3/ping'):
+            return self._send(200, b'{}')
+
+        time.sleep(server.latency)
+        if number % server.reject_every == 0:
+            # Her 10 istekten biri: istek limiti aşıldı
+            with server.lock:
+                server.rejected += 1
+            return self._send(429, b'{"code": -1003, "msg": "Too many requests"}',
+                              {'Retry-After': str(server.retry_after)})
+
+        with server.lock:
+            server.klines_served += 1
+        rows = [
+            [i * STEP, "1.0", "2.0", "0.5", "1.5", "10.0", i * STEP + STEP - 1, "15.0", 3, "5.0", "7.5", "0"]
+            for i in range(5)
+        ]
+        self._send(200, json.dumps(rows).encode())
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_binance(monkeypatch):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeBinanceHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.request_count = 0
+    server.klines_served = 0
+    server.rejected = 0
+    server.latency = 0.1
+    server.reject_every = 10
+    server.retry_after = 0.05
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setattr(_Client, 'API_URL', f"http://127.0.0.1:{server.server_address[1]}/api")
+    monkeypatch.setattr(binance_api, 'REQUEST_BACKOFF_BASE', 0.01)
+    monkeypatch.setattr(binance_api, 'get_kline_store', lambda: None)
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_iter_klines_against_fake_server(fake_binance):
+    api = BinanceAPI()
+    symbols = [f"SYM{i}USDT" for i in range(40)]
+    before = rate_limiter.stats()
+
+    started = time.monotonic()
+    results = dict(api.iter_klines(symbols, interval='1h', limit=5, max_workers=8))
+    elapsed = time.monotonic() - started
+
+    after = rate_limiter.stats()
+    assert set(results) == set(symbols)
+    assert all(len(df) == 5 for df in results.values())
+    assert fake_binance.rejected > 0
+    # Her 429 yanıtı tekrar denendi ve Retry-After süresince istekler bekletildi
+    assert after['retry_count'] - before['retry_count'] == fake_binance.rejected
+    assert after['wait_count'] > before['wait_count']
+    # Sıralı çalıştırma yalnızca gecikmeyle 40 * 0.1 = 4 saniye sürer
+    assert elapsed < len(symbols) * fake_binance.latency / 2
+
+
+def test_iter_klines_cancels_pending_requests_on_close(fake_binance):
+    fake_binance.latency = 0.2
+    fake_binance.reject_every = 10 ** 9
+    api = BinanceAPI()
+    symbols = [f"SYM{i}USDT" for i in range(40)]
+
+    scan = api.iter_klines(symbols, interval='1h', limit=5, max_workers=4)
+    next(scan)
+    started = time.monotonic()
+    scan.close()
+    closed_in = time.monotonic() - started
+
+    time.sleep(0.5)
+    assert closed_in < 0.1
+    # Kapatma anında çalışan istekler dışında yeni istek gönderilmedi
+    assert fake_binance.klines_served <= 8
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from config import CHART_MAX_EVENTS
+from downsampling import lttb_indices
+from indicators import TechnicalIndicators
+from utils import create_candlestick_chart
+
+
+@pytest.mark.parametrize("count,threshold", [(10_000, 1_000), (10, 4), (5, 3), (7, 6), (1_001, 1_000)])
+def test_lttb_indices_keep_endpoints_in_order(count, threshold):
+    y = np.random.default_rng(1).normal(size=count).cumsum()
+    indices = lttb_indices(y, threshold)
+
+    assert len(indices) == threshold
+    assert indices[0] == 0 and indices[-1] == count - 1
+    assert (np.diff(indices) > 0).all()
+
+
+def test_lttb_indices_pick_bucket_extremes():
+    # Her kovada tek bir sıçrama: seçilen nokta sıçramanın kendisi olmalı
+    y = np.zeros(101)
+    spikes = np.arange(5, 100, 10)
+    y[spikes] = 1.0
+    indices = lttb_indices(y, 12)
+    assert set(spikes) <= set(indices)
+
+
+def test_high_density_chart_bounds_event_overlays(make_klines):
+    df = make_klines(count=5_000, freq='min')
+    frame = TechnicalIndicators(df).add_all_indicators(['fvg', 'bos'])
+    assert (frame['bullish_fvg_count'] > 0).sum() > CHART_MAX_EVENTS
+
+    fig = create_candlestick_chart(frame, 'BTCUSDT', ['fvg', 'bos'], high_density=True, interval='1m')
+    markers = [trace for trace in fig.data if 'markers' in (getattr(trace, 'mode', None) or '')]
+    assert markers and all(trace.type == 'scattergl' for trace in markers)
+    assert all(len(trace.x) <= CHART_MAX_EVENTS for trace in markers)
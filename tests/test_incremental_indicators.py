@@ -0,0 +1,71 @@
+import pandas as pd
+import pytest
+
+from incremental_indicators import IncrementalIndicators, select_indicators
+from indicators import TechnicalIndicators
+
+
+def test_matches_add_all_indicators(make_klines):
+    df = make_klines(seed=3, count=300)
+
+    expected = TechnicalIndicators(df.copy()).add_all_indicators()
+    result = IncrementalIndicators.from_dataframe(df).to_dataframe()
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False, rtol=1e-9)
+
+
+def test_matches_add_all_indicators_on_sample_klines(sample_klines):
+    # Düz mumlarda (high == low) Stochastic/Bollinger paydaları sıfır olur
+    expected = TechnicalIndicators(sample_klines.copy()).add_all_indicators()
+    result = IncrementalIndicators.from_dataframe(sample_klines).to_dataframe()
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False, rtol=1e-9)
+
+
+@pytest.mark.parametrize('selected', [
+    ['rsi'],
+    ['macd', 'volume'],
+    ['bollinger', 'ema', 'vwap'],
+    ['fvg', 'bos'],
+    ['fvg_bos_combo'],
+    ['stochastic', 'vwema', 'fvg'],
+])
+def test_select_indicators_matches_subset(make_klines, selected):
+    df = make_klines(seed=4, count=200)
+
+    expected = TechnicalIndicators(df.copy()).add_all_indicators(selected)
+    result = select_indicators(IncrementalIndicators.from_dataframe(df).to_dataframe(), selected)
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False, check_like=True, rtol=1e-9)
+
+
+def test_max_rows_keeps_recent_window(make_klines):
+    df = make_klines(seed=5, count=300)
+    unbounded = IncrementalIndicators.from_dataframe(df)
+    bounded = IncrementalIndicators.from_dataframe(df, max_rows=50)
+
+    # Kapanmamış son mumun güncellemesi sınır dolduktan sonra da doğru uygulanmalı
+    update = dict(df.iloc[-1])
+    update['close'] *= 1.01
+    update['high'] = max(update['high'], update['close'])
+    unbounded.update(update)
+    bounded.update(update)
+
+    assert len(bounded) == 50
+    pd.testing.assert_frame_equal(
+        bounded.to_dataframe(), unbounded.to_dataframe().tail(50).reset_index(drop=True)
+    )
+
+
+def test_select_indicators_uses_engine_periods(make_klines):
+    df = make_klines(seed=6, count=120)
+    engine = IncrementalIndicators.from_dataframe(df, ema_periods=(7, 14, 30), vwema_periods=(3, 10))
+    frame = engine.to_dataframe()
+
+    result = select_indicators(frame, ['ema'], engine.params)
+    assert {'ema_7', 'ema_14', 'ema_30'} <= set(result.columns)
+    assert not {'vwema_3', 'vwema_10', 'rsi'} & set(result.columns)
+    assert (result['vwema_cross_signal'] == 0).all()
+    pd.testing.assert_series_equal(
+        result['overall_signal'], frame['ema_cross_signal'], check_names=False, check_dtype=False
+    )
@@ -0,0 +1,43 @@
+from indicator_cache import IndicatorCache
+
+
+def test_indicator_order_hits_same_entry(make_klines):
+    df = make_klines(seed=10, count=200)
+    cache = IndicatorCache(max_bytes=10 ** 8)
+
+    first = cache.get_frame(df, 'BTCUSDT', '1h', 200, ['rsi', 'ema', 'macd'])
+    second = cache.get_frame(df, 'BTCUSDT', '1h', 200, ['macd', 'rsi', 'ema', 'rsi'])
+
+    assert first is second
+    assert cache.stats()['entries'] == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_forming_candle_update_misses(make_klines):
+    df = make_klines(seed=11, count=200)
+    cache = IndicatorCache(max_bytes=10 ** 8)
+    updated = df.copy()
+    updated.loc[updated.index[-1], 'close'] *= 1.001
+
+    first = cache.get_frame(df, 'BTCUSDT', '1h', 200, ['rsi'])
+    second = cache.get_frame(updated, 'BTCUSDT', '1h', 200, ['rsi'])
+
+    assert first is not second
+    assert cache.misses == 2
+
+
+def test_evicts_least_recently_used_by_bytes(make_klines):
+    frames = [make_klines(seed=seed, count=200) for seed in range(3)]
+    probe = IndicatorCache(max_bytes=10 ** 8)
+    probe.get_frame(frames[0], 'S0', '1h', 200, ['rsi'])
+    cache = IndicatorCache(max_bytes=probe.total_bytes * 2 + 1)
+
+    cache.get_frame(frames[0], 'S0', '1h', 200, ['rsi'])
+    cache.get_frame(frames[1], 'S1', '1h', 200, ['rsi'])
+    cache.get_frame(frames[0], 'S0', '1h', 200, ['rsi'])
+    cache.get_frame(frames[2], 'S2', '1h', 200, ['rsi'])
+
+    assert cache.evictions == 1
+    assert cache.stats()['entries'] == 2
+    cache.get_frame(frames[0], 'S0', '1h', 200, ['rsi'])
+    assert cache.hits == 2
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import TechnicalIndicators, compact_frame, rolling_event_count
+
+
+def fvg_counts_before(df):
+    """Önceki ``add_fvg``: boşluklar satır satır bulunur, son 6 mumdaki zaman damgaları ``isin`` ile sayılır."""
+    high = df['high'].tolist()
+    low = df['low'].tolist()
+    bullish, bearish = set(), set()
+    for i in range(1, len(df) - 1):
+        if high[i - 1] < low[i + 1]:
+            bullish.add(df['timestamp'].iloc[i])
+        if low[i - 1] > high[i + 1]:
+            bearish.add(df['timestamp'].iloc[i])
+
+    bullish_counts, bearish_counts = [], []
+    for i in range(len(df)):
+        recent = df['timestamp'].iloc[max(0, i - 5):i + 1]
+        bullish_counts.append(int(recent.isin(bullish).sum()))
+        bearish_counts.append(int(recent.isin(bearish).sum()))
+    return bullish_counts, bearish_counts
+
+
+def fvg_counts_after(df):
+    result = TechnicalIndicators(df.copy()).add_fvg()
+    return result['bullish_fvg_count'].tolist(), result['bearish_fvg_count'].tolist()
+
+
+@pytest.mark.parametrize('count', [1, 2, 3, 5, 6, 7, 300])
+def test_fvg_counts_match_row_loop(make_klines, count):
+    df = make_klines(seed=count, count=count)
+
+    assert fvg_counts_after(df) == fvg_counts_before(df)
+
+
+def test_fvg_counts_match_row_loop_with_leading_nan(make_klines):
+    df = make_klines(seed=7, count=120)
+    df.loc[:9, ['open', 'high', 'low', 'close']] = np.nan
+
+    assert fvg_counts_after(df) == fvg_counts_before(df)
+
+
+def test_fvg_counts_detect_gaps(make_klines):
+    # Sentetik verinin sayımları gerçekten boşluk içermeli (karşılaştırma boş olmasın)
+    bullish, bearish = fvg_counts_before(make_klines(seed=300, count=300))
+
+    assert max(bullish) > 0 and max(bearish) > 0
+
+
+def test_fvg_counts_match_row_loop_on_sample_klines(sample_klines):
+    high = sample_klines['high'].to_numpy()
+    low = sample_klines['low'].to_numpy()
+    # Örnek veri sınır durumlarını içermeli: düz mumlar ve boşluk oluşturmayan eşit tepe/dipler
+    assert (high == low).any()
+    assert (high[:-2] == low[2:]).any() and (low[:-2] == high[2:]).any()
+
+    bullish, bearish = fvg_counts_before(sample_klines)
+    assert max(bullish) > 0 and max(bearish) > 0
+    assert fvg_counts_after(sample_klines) == (bullish, bearish)
+
+
+@pytest.mark.parametrize('window', [1, 3, 6, 10, 20])
+def test_rolling_event_count(window):
+    flags = np.array([1, 0, 1, 1, 0, 0, 0, 1, 1, 0, 1], dtype=bool)
+
+    expected = [int(flags[max(0, i - window + 1):i + 1].sum()) for i in range(len(flags))]
+
+    assert rolling_event_count(flags, window).tolist() == expected
+
+
+def test_compact_frame_keeps_prices_on_tick(sample_klines):
+    frame = TechnicalIndicators(sample_klines.copy()).add_all_indicators()
+    compact = compact_frame(frame)
+
+    # Tick'e (0.00001) yuvarlı fiyatlar float32'de de aynı tick değerine geri döner
+    for column in ('open', 'high', 'low', 'close', 'volume'):
+        assert compact[column].dtype == np.float32
+        np.testing.assert_array_equal(np.round(compact[column].to_numpy(dtype=np.float64), 5), frame[column])
+    assert compact['rsi'].dtype == np.float32
+
+
+def test_compact_frame_keeps_float64_when_float32_loses_ticks():
+    df = pd.DataFrame({
+        'close': [65432.17, 99999.99, 12345.67],
+        'volume': [12345.12345678, 0.5, 3.1],
+        'rsi': [55.123456789, 1 / 3, 2 / 3],
+    })
+    compact = compact_frame(df)
+
+    assert compact['close'].dtype == np.float32
+    # 8 basamaklı hacim float32'de yarım tick'ten fazla kayar
+    assert compact['volume'].dtype == np.float64
+    np.testing.assert_array_equal(compact['volume'], df['volume'])
+    assert compact['rsi'].dtype == np.float32
@@ -0,0 +1,54 @@
+import time
+
+from kline_decoder import rows_to_columns
+from kline_store import KlineStore
+
+STEP = 60_000
+
+
+class FakeExchange:
+    """``Client.get_klines`` parametrelerini anlayan, 10 dakikalık kesinti içeren 1m mum kaynağı."""
+
+    def __init__(self, count=600, outage=(300, 310)):
+        now = int(time.time() * 1000) // STEP * STEP
+        self.open_times = [
+            now - (count - 1 - i) * STEP for i in range(count) if not outage[0] <= i < outage[1]
+        ]
+        self.requests = []
+
+    def __call__(self, symbol, interval, limit, startTime=None, endTime=None):
+        self.requests.append((startTime, endTime, limit))
+        times = [t for t in self.open_times
+                 if (startTime is None or t >= startTime) and (endTime is None or t <= endTime)]
+        times = times[:limit] if startTime is not None else times[-limit:]
+        return rows_to_columns([
+            (t, 1.0, 2.0, 0.5, 1.5, 10.0, t + STEP - 1, 15.0, 3, 5.0, 7.5) for t in times
+        ])
+
+
+def test_outage_is_fetched_once():
+    exchange = FakeExchange()
+    store = KlineStore(':memory:')
+
+    store.sync(exchange, 'BTCUSDT', '1m', limit=500)
+
+    # Kesinti ilk senkronizasyonda bir kez denenir; sıcak senkronizasyon tek küçük istek yapar
+    for _ in range(3):
+        before = len(exchange.requests)
+        store.sync(exchange, 'BTCUSDT', '1m', limit=500)
+        assert len(exchange.requests) == before + 1
+        assert exchange.requests[-1][0] is not None
+
+
+def test_prune_keeps_newest_candles():
+    exchange = FakeExchange(count=600, outage=(0, 0))
+    store = KlineStore(':memory:', max_candles=200)
+
+    klines = store.sync(exchange, 'BTCUSDT', '1m', limit=100)
+    store.sync(exchange, 'BTCUSDT', '1m', limit=300)
+
+    assert len(klines['open_time']) == 100
+    assert len(store.load('BTCUSDT', '1m', limit=1000)['open_time']) == 300
+    store.prune('BTCUSDT', '1m', 200)
+    stored = store.load('BTCUSDT', '1m', limit=1000)['open_time']
+    assert stored.tolist() == exchange.open_times[-200:]
@@ -0,0 +1,212 @@
+import base64
+import hashlib
+import json
+import socket
+import struct
+import threading
+import time
+
+import pandas as pd
+
+import kline_stream
+
+from incremental_indicators import IncrementalIndicators, select_indicators
+from kline_stream import KlineRingBuffer, KlineStream
+
+
+def kline_row(minute, close):
+    open_time = 1_700_000_000_000 + minute * 60_000
+    return (open_time, close, close + 1, close - 1, close, 10.0, open_time + 59_999, 100.0, 5, 4.0, 40.0)
+
+
+def test_grow_keeps_candles_in_order():
+    buffer = KlineRingBuffer(3)
+    for minute in range(5):
+        buffer.push(kline_row(minute, 100.0 + minute))
+    before = buffer.to_frame()
+
+    buffer.grow(6)
+    for minute in range(5, 8):
+        buffer.push(kline_row(minute, 100.0 + minute))
+
+    frame = buffer.to_frame()
+    pd.testing.assert_frame_equal(frame.head(3), before)
+    assert frame['close'].tolist() == [102.0, 103.0, 104.0, 105.0, 106.0, 107.0]
+    assert buffer.capacity == 6
+
+
+def test_ensure_capacity_reseeds_same_stream():
+    short = KlineRingBuffer(10)
+    long = KlineRingBuffer(10)
+    for minute in range(10):
+        long.push(kline_row(minute, 100.0 + minute))
+        if minute >= 7:
+            short.push(kline_row(minute, 100.0 + minute))
+    stream = KlineStream('BTCUSDT', '1m', 3, seed=short.to_frame)
+    stream._resync()
+    version = stream.version
+
+    stream.ensure_capacity(10, seed=long.to_frame)
+
+    assert stream.buffer.capacity == 10
+    assert stream.version > version
+    assert stream.snapshot()['close'].tolist() == [100.0 + minute for minute in range(10)]
+
+
+def test_indicator_frame_updates_incrementally(make_klines):
+    df = make_klines(seed=6, count=120, freq='min')
+    stream = KlineStream('BTCUSDT', '1m', 100, seed=lambda: df.iloc[:110])
+    stream._resync()
+    stream.indicator_frame()
+
+    for candle in df.iloc[110:].itertuples(index=False):
+        open_time = candle.timestamp.value // 1_000_000
+        stream._on_message(None, json.dumps({'k': {
+            't': open_time, 'o': candle.open, 'h': candle.high, 'l': candle.low, 'c': candle.close,
+            'v': candle.volume, 'T': open_time + 59_999, 'q': candle.quote_asset_volume,
+            'n': int(candle.number_of_trades), 'V': candle.taker_buy_base_asset_volume,
+            'Q': candle.taker_buy_quote_asset_volume
+        }}))
+
+    frame = stream.indicator_frame(['rsi', 'ema'])
+
+    # Halka 10..109 mumlarıyla doldu; sonradan düşen mumlar indikatör durumunda kalır
+    expected = IncrementalIndicators.from_dataframe(df.iloc[10:]).to_dataframe().tail(100).reset_index(drop=True)
+    pd.testing.assert_frame_equal(frame, select_indicators(expected, ['rsi', 'ema']), check_dtype=False)
+    assert 'macd' not in frame.columns
+
+
+class LocalWebSocketServer:
+    """
+    Testler için yalnızca standart kütüphaneyle yazılmış küçük WebSocket sunucusu.
+
+    Her bağlantıda el sıkışmadan sonra ``scripts`` listesindeki sıradaki mesajları metin çerçevesi
+    olarak gönderir; ``close`` True ise bağlantıyı kapatır (istemci yeniden bağlanmalıdır).
+    """
+
+    def __init__(self, scripts):
+        self.scripts = list(scripts)
+        self.paths = []
+        self._server = socket.create_server(('127.0.0.1', 0))
+        self._clients = []
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self):
+        return f"ws://127.0.0.1:{self._server.getsockname()[1]}"
+
+    def _serve(self):
+        while True:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return
+            self._clients.append(client)
+            request = b''
+            while b'\r\n\r\n' not in request:
+                request += client.recv(4096)
+            lines = request.decode().split('\r\n')
+            self.paths.append(lines[0].split()[1])
+            key = next(line.split(':', 1)[1].strip() for line in lines if line.lower().startswith('sec-websocket-key'))
+            accept = base64.b64encode(
+                hashlib.sha1((key + '258EAFA5-E914-47DA-95CA-C5AB0DC85B11').encode()).digest()
+            ).decode()
+            client.sendall(
+                'HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n'
+                f'Sec-WebSocket-Accept: {accept}\r\n\r\n'.encode()
+            )
+
+            messages, close = self.scripts.pop(0) if self.scripts else ([], False)
+            for message in messages:
+                payload = message.encode()
+                client.sendall(bytes([0x81, len(payload)]) + payload if len(payload) < 126
+                               else bytes([0x81, 126]) + struct.pack('!H', len(payload)) + payload)
+            if close:
+                # Kapanış çerçevesi gönderilir ve istemcinin yanıtı beklenir
+                client.sendall(bytes([0x88, 0]))
+                client.settimeout(1)
+                try:
+                    client.recv(1024)
+                except OSError:
+                    pass
+                client.close()
+
+    def stop(self):
+        self._server.close()
+        for client in self._clients:
+            client.close()
+
+
+def kline_message(minute, close):
+    row = kline_row(minute, close)
+    return json.dumps({'e': 'kline', 'k': {
+        't': row[0], 'o': str(row[1]), 'h': str(row[2]), 'l': str(row[3]), 'c': str(row[4]),
+        'v': str(row[5]), 'T': row[6], 'q': str(row[7]), 'n': row[8], 'V': str(row[9]), 'Q': str(row[10])
+    }})
+
+
+def test_stream_against_local_websocket_server(monkeypatch):
+    monkeypatch.setattr(kline_stream, 'RECONNECT_DELAY', 0.1)
+    history = KlineRingBuffer(10)
+    for minute in range(5):
+        history.push(kline_row(minute, 100.0 + minute))
+    seeds = []
+
+    def seed():
+        seeds.append(time.monotonic())
+        return history.to_frame()
+
+    # İlk bağlantı bir mum gönderip kapanır; ikinci bağlantı (yeniden bağlanma) bir mum daha gönderir
+    server = LocalWebSocketServer([
+        ([kline_message(5, 105.0)], True),
+        ([kline_message(6, 106.0)], False),
+    ])
+    stream = KlineStream('BTCUSDT', '1m', 10, seed=seed, url=server.url).start()
+    try:
+        version = stream.version
+        deadline = time.monotonic() + 5
+        while len(stream.snapshot()) < 7 and time.monotonic() < deadline:
+            version = stream.wait_for_update(version, timeout=0.5)
+
+        closes = stream.snapshot()['close'].tolist()
+    finally:
+        server.stop()
+        stream.stop()
+
+    assert server.paths[:2] == ['/ws/btcusdt@kline_1m'] * 2
+    # Başlangıçta ve yeniden bağlantıda REST ile tamamlandı; akış mumları korundu
+    assert len(seeds) == 2
+    assert closes == [100.0, 101.0, 102.0, 103.0, 104.0, 105.0, 106.0]
+    assert stream.last_message is not None
+
+
+def test_seeding_does_not_block_other_streams(monkeypatch):
+    monkeypatch.setattr(KlineStream, '_run', lambda self: None)
+    monkeypatch.setattr(kline_stream, '_streams', {})
+    release = threading.Event()
+    history = KlineRingBuffer(10)
+    history.push(kline_row(0, 100.0))
+
+    def slow_seed():
+        release.wait(5)
+        return history.to_frame()
+
+    opened = []
+    slow = threading.Thread(target=lambda: opened.append(
+        kline_stream.get_kline_stream('AAAUSDT', '1m', 10, seed=slow_seed)
+    ))
+    slow.start()
+    try:
+        started = time.monotonic()
+        other = kline_stream.get_kline_stream('BBBUSDT', '1m', 10, seed=history.to_frame)
+        assert time.monotonic() - started < 1
+        assert len(other.snapshot()) == 1
+        assert not opened
+    finally:
+        release.set()
+        slow.join(5)
+
+    # Aynı akışı isteyen oturum, yükleme bitince aynı nesneyi alır
+    assert kline_stream.get_kline_stream('AAAUSDT', '1m', 10) is opened[0]
+    assert len(opened[0].snapshot()) == 1
@@ -0,0 +1,74 @@
+import threading
+import time
+
+from market_refresher import MarketDataRefresher
+
+
+class RecordingAPI:
+    """``get_klines`` çağrılarını sayan veri kaynağı."""
+
+    def __init__(self, df):
+        self.df = df
+        self.calls = []
+
+    def get_klines(self, symbol, interval, limit):
+        self.calls.append((symbol, interval, limit))
+        return self.df.tail(limit).reset_index(drop=True)
+
+
+class SlowAPI(RecordingAPI):
+    """İlk isteği bekleten veri kaynağı (eşzamanlı ilk açılışları yakalamak için)."""
+
+    def get_klines(self, symbol, interval, limit):
+        time.sleep(0.2)
+        return super().get_klines(symbol, interval, limit)
+
+
+def test_klines_fetched_once_per_feed(make_klines):
+    api = RecordingAPI(make_klines(seed=8, count=200))
+    refresher = MarketDataRefresher(api)
+
+    rsi = refresher.get_snapshot('BTCUSDT', '1h', 150, ['rsi'])
+    macd = refresher.get_snapshot('BTCUSDT', '1h', 150, ['macd', 'volume'])
+
+    assert api.calls == [('BTCUSDT', '1h', 150)]
+    assert 'rsi' in rsi.frame.columns and 'macd' not in rsi.frame.columns
+    assert 'macd' in macd.frame.columns
+
+    # Zamanlayıcı turu: mumlar bir kez alınır, iki aboneliğe de dağıtılır
+    refresher._refresh(refresher._feeds[('BTCUSDT', '1h', 150)])
+
+    assert api.calls == [('BTCUSDT', '1h', 150)] * 2
+    assert refresher.stats()['feeds'] == 1
+    assert refresher.stats()['subscriptions'] == 2
+
+
+def test_indicator_order_shares_subscription(make_klines):
+    api = RecordingAPI(make_klines(seed=9, count=200))
+    refresher = MarketDataRefresher(api)
+
+    first = refresher.get_snapshot('ETHUSDT', '1h', 150, ['rsi', 'macd'])
+    second = refresher.get_snapshot('ETHUSDT', '1h', 150, ['macd', 'rsi', 'macd'])
+
+    assert first is second
+    assert refresher.stats()['subscriptions'] == 1
+
+
+def test_concurrent_first_requests_share_one_fetch(make_klines):
+    api = SlowAPI(make_klines(seed=10, count=200))
+    refresher = MarketDataRefresher(api)
+    snapshots = {}
+
+    def open_feed(indicators):
+        snapshots[indicators[0]] = refresher.get_snapshot('BNBUSDT', '1h', 150, indicators)
+
+    threads = [threading.Thread(target=open_feed, args=(indicators,)) for indicators in (['rsi'], ['macd'])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert api.calls == [('BNBUSDT', '1h', 150)]
+    assert 'rsi' in snapshots['rsi'].frame.columns
+    assert 'macd' in snapshots['macd'].frame.columns
+    assert not refresher._feeds[('BNBUSDT', '1h', 150)].loading
@@ -0,0 +1,211 @@
+import json
+import logging
+import threading
+import time
+
+import numpy as np
+import websocket
+
+from config import BINANCE_WS_URL
+
+# Loglama ayarları
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Tüm sembollerin 24 saatlik istatistik akışı
+TICKER_STREAM_NAME = '!ticker@arr'
+
+# Bağlantı koptuğunda yeniden bağlanmadan önce beklenecek süre (saniye)
+RECONNECT_DELAY = 5
+
+
+class TickerTable:
+    """
+    Sembollerin son fiyat, 24 saatlik değişim ve hacim bilgilerini tutan sütun tabanlı tablo.
+
+    Her sembolün sabit bir satırı vardır; güncellemeler yalnızca ilgili hücrelerin üzerine yazar.
+    """
+
+    def __init__(self, quote_asset='USDT', capacity=1024):
+        self.quote_asset = quote_asset
+        self.symbols = []
+        self._rows = {}
+        self.last_price = np.zeros(capacity, dtype=np.float64)
+        self.price_change_percent = np.zeros(capacity, dtype=np.float64)
+        self.quote_volume = np.zeros(capacity, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def _row(self, symbol):
+        row = self._rows.get(symbol)
+        if row is None:
+            row = len(self.symbols)
+            if row == len(self.last_price):
+                self.last_price = np.resize(self.last_price, 2 * row)
+                self.price_change_percent = np.resize(self.price_change_percent, 2 * row)
+                self.quote_volume = np.resize(self.quote_volume, 2 * row)
+            self.symbols.append(symbol)
+            self._rows[symbol] = row
+        return row
+
+    def update(self, symbol, last_price, price_change_percent, quote_volume):
+        """Sembolün satırını günceller (farklı kote varlıklı semboller yok sayılır)."""
+        if not symbol.endswith(self.quote_asset):
+            return
+        row = self._row(symbol)
+        self.last_price[row] = last_price
+        self.price_change_percent[row] = price_change_percent
+        self.quote_volume[row] = quote_volume
+
+    def top_by_volume(self, limit=10):
+        """
+        Hacme göre en yüksek ``limit`` sembolü döndürür.
+
+        Returns:
+            list: ``get_top_symbols_by_volume`` ile aynı anahtarlara sahip sözlükler
+        """
+        size = len(self.symbols)
+        if not size or limit <= 0:
+            return []
+
+        volume = self.quote_volume[:size]
+        if limit < size:
+            # O(N) seçim + yalnızca seçilen k satırın sıralanması
+            index = np.argpartition(volume, size - limit)[size - limit:]
+        else:
+            index = np.arange(size)
+        index = index[np.argsort(volume[index], kind='stable')[::-1]]
+
+        return [
+            {
+                'symbol': self.symbols[i],
+                'lastPrice': float(self.last_price[i]),
+                'priceChangePercent': float(self.price_change_percent[i]),
+                'quoteVolume': float(self.quote_volume[i]),
+            }
+            for i in index
+        ]
+
+
+class TickerFeed:
+    """
+    ``!ticker@arr`` akışını arka planda dinleyen ve ``TickerTable``'ı güncel tutan tüketici.
+
+    Akış yalnızca son saniyede değişen sembolleri gönderdiği için tablo başlangıçta ve her yeniden
+    bağlantıda ``seed`` ile (REST) doldurulur.
+    """
+
+    def __init__(self, seed=None, quote_asset='USDT', url=BINANCE_WS_URL):
+        """
+        Args:
+            seed (callable): 24 saatlik ticker sözlüklerinin listesini döndüren fonksiyon
+            quote_asset (str): Tabloda tutulacak kote varlık
+            url (str): WebSocket temel adresi
+        """
+        self.url = url.rstrip('/')
+        self.table = TickerTable(quote_asset)
+        self.last_message = None
+        self._seed = seed
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._connected_once = False
+        self._thread = None
+        self._ws = None
+
+    def start(self):
+        """Tabloyu doldurur ve dinleyici thread'ini başlatır."""
+        self._resync()
+        self._thread = threading.Thread(target=self._run, name="ticker-feed", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Akışı kapatır."""
+        self._stopped.set()
+        if self._ws is not None:
+            self._ws.close()
+
+    def _resync(self):
+        if self._seed is None:
+            return
+        try:
+            tickers = self._seed()
+        except Exception as e:
+            logger.error(f"Ticker tablosu doldurulamadı: {e}")
+            return
+
+        with self._lock:
+            for ticker in tickers or []:
+                try:
+                    self.table.update(
+                        ticker['symbol'], float(ticker['lastPrice']),
+                        float(ticker['priceChangePercent']), float(ticker['quoteVolume'])
+                    )
+                except (KeyError, TypeError, ValueError):
+                    continue
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._ws = websocket.WebSocketApp(
+                f"{self.url}/ws/{TICKER_STREAM_NAME}",
+                on_open=self._on_open,
+                on_message=self._on_message,
+                on_error=self._on_error
+            )
+            self._ws.run_forever(ping_interval=20, ping_timeout=10)
+            if self._stopped.is_set():
+                break
+            logger.warning(f"{TICKER_STREAM_NAME} bağlantısı koptu, {RECONNECT_DELAY} saniye sonra yeniden bağlanılacak.")
+            self._stopped.wait(RECONNECT_DELAY)
+
+    def _on_open(self, ws):
+        if self._connected_once:
+            self._resync()
+        self._connected_once = True
+
+    def _on_message(self, ws, message):
+        try:
+            payload = json.loads(message)
+            tickers = payload.get('data', []) if isinstance(payload, dict) else payload
+        except ValueError as e:
+            logger.error(f"{TICKER_STREAM_NAME} mesajı çözümlenemedi: {e}")
+            return
+
+        with self._lock:
+            for ticker in tickers:
+                try:
+                    self.table.update(ticker['s'], float(ticker['c']), float(ticker['P']), float(ticker['q']))
+                except (KeyError, TypeError, ValueError):
+                    continue
+            self.last_message = time.time()
+
+    def _on_error(self, ws, error):
+        logger.error(f"{TICKER_STREAM_NAME} akışında hata: {error}")
+
+    def top_by_volume(self, limit=10):
+        """Hacme göre en yüksek ``limit`` sembolü döndürür (bkz. ``TickerTable.top_by_volume``)."""
+        with self._lock:
+            return self.table.top_by_volume(limit)
+
+
+# Süreç genelinde paylaşılan ticker akışı
+_ticker_feed = None
+_ticker_feed_lock = threading.Lock()
+
+
+def get_ticker_feed(seed=None):
+    """
+    Paylaşılan ``!ticker@arr`` akışını döndürür, yoksa başlatır.
+
+    Args:
+        seed (callable): İlk açılışta ve yeniden bağlantılarda tabloyu dolduracak fonksiyon
+
+    Returns:
+        TickerFeed: Çalışan akış
+    """
+    global _ticker_feed
+    with _ticker_feed_lock:
+        if _ticker_feed is None:
+            _ticker_feed = TickerFeed(seed=seed).start()
+        return _ticker_feed
@@ -3,12 +3,34 @@ import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
+from config import (
+    CHART_HIGH_DENSITY_THRESHOLD, CHART_MAX_POINTS, CHART_FULL_RESOLUTION_CANDLES, CHART_VISIBLE_CANDLES,
+    CHART_MAX_EVENTS, CHART_AXIS_MODE
+)
+from downsampling import downsample_ohlc, recent_window_indices
+from kline_store import INTERVAL_MS
+
 # Loglama ayarları
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Grafik izlerinin veri özellikleri; önbellekteki grafik yenilenirken yalnızca bunlar değiştirilir
+TRACE_DATA_KEYS = ('x', 'y', 'open', 'high', 'low', 'close', 'hovertext', 'marker_color')
+
+# Zaman ekseni modları: 'date' kesintisiz tarih ekseni (7/24 piyasalar, rangebreak yok),
+# 'index' mum sırası ekseni (etiketler tarih; çok sayıda mumda ucuz kaydırma/yakınlaştırma)
+AXIS_MODES = ('date', 'index')
+
+# 'index' modunda eksende gösterilecek tarih etiketi sayısı
+INDEX_AXIS_TICKS = 8
+
+# Yön kodlarını (0: düşüş, 1: yükseliş) çubuk renklerine eşleyen renk skalası
+UP_DOWN_COLORSCALE = [[0, 'red'], [1, 'green']]
+
 def format_number(number, precision=2):
     """
     Sayıları okunabilir formatta biçimlendirir.
@@ -39,529 +61,740 @@ def format_number(number, precision=2):
         logger.error(f"Sayı biçimlendirilirken hata oluştu: {e}")
         return str(number)
 
-def create_candlestick_chart(df, symbol, selected_indicators=None):
+def _rectangles(x0, y0, x1, y1, fillcolor, line):
     """
-    Mum grafiği oluşturur.
+    Dikdörtgenleri tek bir dolgulu çokgen izinin özelliklerinde toplar.
+    
+    Her dikdörtgen beş köşe noktası ve bir NaN ayırıcıdan oluşur; ``fill='toself'`` her parçayı
+    ayrı bir kapalı alan olarak doldurur. Olay başına ``add_shape`` çağrısı ve layout güncellemesi
+    yapılmaz.
+    
+    Returns:
+        dict: ``go.Scatter`` özellikleri
+    """
+    x0, x1 = np.asarray(x0), np.asarray(x1)
+    y0, y1 = np.asarray(y0, dtype=np.float64), np.asarray(y1, dtype=np.float64)
+    gap = np.full(len(y0), np.nan)
+    return dict(
+        x=np.column_stack([x0, x1, x1, x0, x0, x0]).ravel(),
+        y=np.column_stack([y0, y0, y1, y1, y0, gap]).ravel(),
+        mode='lines',
+        fill='toself',
+        fillcolor=fillcolor,
+        line=line,
+        hoverinfo='skip',
+        showlegend=False
+    )
+
+def _segments(x0, y0, x1, y1, line):
+    """
+    Doğru parçalarını NaN ayırıcılarla tek bir çizgi izinin özelliklerinde toplar.
+    
+    Returns:
+        dict: ``go.Scatter`` özellikleri
+    """
+    x0, x1 = np.asarray(x0), np.asarray(x1)
+    y0, y1 = np.asarray(y0, dtype=np.float64), np.asarray(y1, dtype=np.float64)
+    gap = np.full(len(y0), np.nan)
+    return dict(
+        x=np.column_stack([x0, x1, x1]).ravel(),
+        y=np.column_stack([y0, y1, gap]).ravel(),
+        mode='lines',
+        line=line,
+        hoverinfo='skip',
+        showlegend=False
+    )
+
+def candle_styles(candles, df):
+    """
+    Grafikteki mum başına stil dizilerini vektörel olarak üretir.
+    
+    Renkler yön kodu (1: yükseliş, 0: düşüş) olarak tutulur ve çubuklarda ``UP_DOWN_COLORSCALE`` ile
+    yeşil/kırmızıya eşlenir; sayısal diziler renk metinlerine göre çok daha hızlı doğrulanır ve
+    daha küçük serileştirilir.
     
     Args:
-        df (pd.DataFrame): Veri çerçevesi
-        symbol (str): Sembol
-        selected_indicators (list, optional): Seçilen indikatörler
+        candles (pd.DataFrame): Çizilecek mumlar (yüksek yoğunluk modunda seyreltilmiş)
+        df (pd.DataFrame): İndikatörleri içeren veri çerçevesi
     
     Returns:
-        plotly.graph_objects.Figure: Mum grafiği
+        dict: ``direction`` (mum yönleri) ve MACD sütunları varsa ``macd_hist`` ile
+            ``macd_hist_direction`` dizileri
     """
-    try:
-        if selected_indicators is None:
-            selected_indicators = []
-        
-        # Subplot sayısını belirle
-        subplot_count = 1  # Ana grafik için
-        
-        if "volume" in selected_indicators:
-            subplot_count += 1
-        
-        if "rsi" in selected_indicators:
-            subplot_count += 1
-        
-        if "macd" in selected_indicators:
-            subplot_count += 1
-        
-        # Subplot yüksekliklerini belirle - Ana grafik için daha fazla alan ayır
-        row_heights = [0.7]  # Ana grafik için daha büyük oran (0.6'dan 0.7'ye)
+    styles = {
+        'direction': np.where(candles['close'].to_numpy() >= candles['open'].to_numpy(), 1, 0).astype(np.int8)
+    }
+    
+    if 'macd' in df.columns and 'macd_signal' in df.columns:
+        histogram = df['macd'].to_numpy(dtype=np.float64) - df['macd_signal'].to_numpy(dtype=np.float64)
+        styles['macd_hist'] = histogram
+        styles['macd_hist_direction'] = np.where(histogram >= 0, 1, 0).astype(np.int8)
+    
+    return styles
+
+def _interval_milliseconds(timestamps, interval=None):
+    """Mum süresi (milisaniye): zaman aralığından, bilinmiyorsa mumlar arasındaki ortanca farktan."""
+    if interval in INTERVAL_MS:
+        return INTERVAL_MS[interval]
+    if len(timestamps) > 1:
+        return float(np.median(np.diff(timestamps)) / np.timedelta64(1, 'ms'))
+    return INTERVAL_MS['1h']
+
+def _chart_traces(df, selected_indicators, high_density, interval=None, axis_mode='date'):
+    """
+    Grafiğin izlerini hazırlar.
+    
+    Returns:
+        tuple: (izler, x ekseni ayarları); izler (satır, iz tipi, özellikler) demetleridir ve
+            özellikler veri dizilerini (``TRACE_DATA_KEYS``) ve görünüm ayarlarını içerir
+    """
+    if high_density:
+        # Yalnızca görünür aralığı gönder; mumlar ve seriler nokta bütçesine seyreltilir
+        if CHART_VISIBLE_CANDLES > 0:
+            df = df.tail(CHART_VISIBLE_CANDLES).reset_index(drop=True)
+        candles = downsample_ohlc(df, CHART_MAX_POINTS, CHART_FULL_RESOLUTION_CANDLES)
+        scatter = go.Scattergl
+    else:
+        candles = df
+        scatter = go.Scatter
+    
+    timestamps = df['timestamp'].to_numpy()
+    
+    if axis_mode == 'index':
+        # x değerleri mum sırasıdır; olay genişlikleri mum cinsindendir
+        def to_x(values):
+            return np.searchsorted(timestamps, np.asarray(values))
         
-        if "volume" in selected_indicators:
-            row_heights.append(0.1)  # Hacim grafiği için
+        def span(candles_count):
+            return candles_count
         
-        if "rsi" in selected_indicators:
-            row_heights.append(0.15)  # RSI grafiği için küçültüldü (0.2'den 0.15'e)
+        tick_positions = np.unique(np.linspace(0, len(df) - 1, INDEX_AXIS_TICKS).astype(np.int64))
+        xaxis = dict(
+            type='linear',
+            tickmode='array',
+            tickvals=tick_positions,
+            ticktext=pd.DatetimeIndex(timestamps[tick_positions]).strftime('%Y-%m-%d %H:%M').tolist()
+        )
+    else:
+        # Kesintisiz tarih ekseni; olay genişlikleri seçilen zaman aralığına göre ölçeklenir
+        step = _interval_milliseconds(timestamps, interval)
         
-        if "macd" in selected_indicators:
-            row_heights.append(0.15)  # MACD grafiği için küçültüldü (0.2'den 0.15'e)
+        def to_x(values):
+            return np.asarray(values)
         
-        # Subplot düzenini oluştur
-        fig = make_subplots(
-            rows=subplot_count,
-            cols=1,
-            shared_xaxes=True,
-            vertical_spacing=0.01,  # Dikey boşluğu azalt (0.02'den 0.01'e)
-            row_heights=row_heights,
-            subplot_titles=["Fiyat"] + (["Hacim"] if "volume" in selected_indicators else []) + (["RSI"] if "rsi" in selected_indicators else []) + (["MACD"] if "macd" in selected_indicators else [])
-        )
+        def span(candles_count):
+            return np.timedelta64(int(round(step * candles_count)), 'ms')
         
-        # Mum grafiği ekle - Daha belirgin ve görünür ayarlarla
-        fig.add_trace(
-            go.Candlestick(
-                x=df['timestamp'],
-                open=df['open'],
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                name="Fiyat",
-                increasing=dict(
-                    line=dict(color='#00ff00', width=1.5),  # Yeşil yükseliş mumları
-                    fillcolor='rgba(0, 255, 0, 0.8)'
-                ),
-                decreasing=dict(
-                    line=dict(color='#ff0000', width=1.5),  # Kırmızı düşüş mumları
-                    fillcolor='rgba(255, 0, 0, 0.8)'
-                ),
-                line=dict(width=1.5),
-                whiskerwidth=0.8,
-                visible=True
+        xaxis = dict(type='date')
+    
+    xs = to_x(timestamps)
+    
+    # 'index' modunda mum tarihleri fare imleci bilgisinde gösterilir
+    candle_dates = (
+        pd.DatetimeIndex(candles['timestamp']).strftime('%Y-%m-%d %H:%M').to_numpy()
+        if axis_mode == 'index' else None
+    )
+    
+    def sample(values):
+        """Serinin gönderilecek noktalarının indeksleri (yüksek yoğunluk modu dışında tümü)."""
+        if not high_density:
+            return slice(None)
+        return recent_window_indices(values, CHART_MAX_POINTS, CHART_FULL_RESOLUTION_CANDLES)
+    
+    def points(values):
+        """Çizgi serisinin gönderilecek x/y noktaları."""
+        values = np.asarray(values, dtype=np.float64)
+        index = sample(values)
+        return dict(x=xs[index], y=values[index])
+    
+    def events(mask):
+        """Çizilecek olay satırları (yüksek yoğunluk modunda en son ``CHART_MAX_EVENTS`` olay)."""
+        rows = df[mask]
+        return rows.tail(CHART_MAX_EVENTS) if high_density else rows
+    
+    # Mum başına stil dizileri
+    styles = candle_styles(candles, df)
+    
+    traces = []
+    
+    # Mum grafiği ekle - Daha belirgin ve görünür ayarlarla
+    traces.append((
+        1, go.Candlestick, dict(
+            x=to_x(candles['timestamp']),
+            hovertext=candle_dates,
+            open=candles['open'],
+            high=candles['high'],
+            low=candles['low'],
+            close=candles['close'],
+            name="Fiyat",
+            increasing=dict(
+                line=dict(color='#00ff00', width=1.5),  # Yeşil yükseliş mumları
+                fillcolor='rgba(0, 255, 0, 0.8)'
+            ),
+            decreasing=dict(
+                line=dict(color='#ff0000', width=1.5),  # Kırmızı düşüş mumları
+                fillcolor='rgba(255, 0, 0, 0.8)'
             ),
-            row=1, col=1
+            line=dict(width=1.5),
+            whiskerwidth=0.8,
+            visible=True
         )
+    ))
+    
+    # Bollinger Bands
+    if "bollinger" in selected_indicators and 'bb_high' in df.columns and 'bb_mid' in df.columns and 'bb_low' in df.columns:
+        traces.append((
+            1, scatter, dict(
+                **points(df['bb_high']),
+                line=dict(color='rgba(250, 0, 0, 0.7)', width=1),
+                name="BB Üst"
+            )
+        ))
         
-        # Bollinger Bands
-        if "bollinger" in selected_indicators and 'bb_high' in df.columns and 'bb_mid' in df.columns and 'bb_low' in df.columns:
-            fig.add_trace(
-                go.Scatter(
-                    x=df['timestamp'],
-                    y=df['bb_high'],
-                    line=dict(color='rgba(250, 0, 0, 0.7)', width=1),
-                    name="BB Üst"
-                ),
-                row=1, col=1
+        traces.append((
+            1, scatter, dict(
+                **points(df['bb_mid']),
+                line=dict(color='rgba(0, 0, 250, 0.7)', width=1),
+                name="BB Orta"
             )
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=df['timestamp'],
-                    y=df['bb_mid'],
-                    line=dict(color='rgba(0, 0, 250, 0.7)', width=1),
-                    name="BB Orta"
-                ),
-                row=1, col=1
+        ))
+        
+        traces.append((
+            1, scatter, dict(
+                **points(df['bb_low']),
+                line=dict(color='rgba(0, 250, 0, 0.7)', width=1),
+                name="BB Alt"
             )
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=df['timestamp'],
-                    y=df['bb_low'],
-                    line=dict(color='rgba(0, 250, 0, 0.7)', width=1),
-                    name="BB Alt"
-                ),
-                row=1, col=1
+        ))
+    
+    # EMA
+    if "ema" in selected_indicators:
+        if 'ema_9' in df.columns:
+            traces.append((
+                1, scatter, dict(
+                    **points(df['ema_9']),
+                    line=dict(color='rgba(255, 165, 0, 0.7)', width=1.5),
+                    name="EMA 9"
+                )
+            ))
+        
+        if 'ema_21' in df.columns:
+            traces.append((
+                1, scatter, dict(
+                    **points(df['ema_21']),
+                    line=dict(color='rgba(148, 0, 211, 0.7)', width=1.5),
+                    name="EMA 21"
+                )
+            ))
+        
+        if 'ema_50' in df.columns:
+            traces.append((
+                1, scatter, dict(
+                    **points(df['ema_50']),
+                    line=dict(color='rgba(255, 0, 255, 0.7)', width=1.5),
+                    name="EMA 50"
+                )
+            ))
+    
+    # VWAP
+    if "vwap" in selected_indicators and 'vwap' in df.columns:
+        traces.append((
+            1, scatter, dict(
+                **points(df['vwap']),
+                line=dict(color='rgba(255, 0, 255, 0.7)', width=1.5, dash='dot'),
+                name="VWAP"
             )
+        ))
+    
+    # VWEMA
+    if "vwema" in selected_indicators:
+        if 'vwema_5' in df.columns:
+            traces.append((
+                1, scatter, dict(
+                    **points(df['vwema_5']),
+                    line=dict(color='rgba(0, 255, 255, 0.7)', width=1.5),
+                    name="VWEMA 5"
+                )
+            ))
         
-        # EMA
-        if "ema" in selected_indicators:
-            if 'ema_9' in df.columns:
-                fig.add_trace(
-                    go.Scatter(
-                        x=df['timestamp'],
-                        y=df['ema_9'],
-                        line=dict(color='rgba(255, 165, 0, 0.7)', width=1.5),
-                        name="EMA 9"
-                    ),
-                    row=1, col=1
+        if 'vwema_20' in df.columns:
+            traces.append((
+                1, scatter, dict(
+                    **points(df['vwema_20']),
+                    line=dict(color='rgba(255, 255, 0, 0.7)', width=1.5),
+                    name="VWEMA 20"
                 )
-            
-            if 'ema_21' in df.columns:
-                fig.add_trace(
-                    go.Scatter(
-                        x=df['timestamp'],
-                        y=df['ema_21'],
-                        line=dict(color='rgba(148, 0, 211, 0.7)', width=1.5),
-                        name="EMA 21"
-                    ),
-                    row=1, col=1
+            ))
+    
+    # Fair Value Gap (FVG) gösterimi - Daha düzgün çizim
+    if "fvg" in selected_indicators and 'bullish_fvg_count' in df.columns and 'bearish_fvg_count' in df.columns:
+        # Bullish FVG için dikdörtgen alanlar
+        bullish_fvg_df = events(df['bullish_fvg_count'] > 0)
+        if not bullish_fvg_df.empty:
+            # Tüm alanlar tek bir dolgulu çokgen izi olarak çizilir
+            traces.append((
+                1, go.Scatter, _rectangles(
+                    x0=to_x(bullish_fvg_df['timestamp']),
+                    y0=bullish_fvg_df['low'],
+                    x1=to_x(bullish_fvg_df['timestamp']) + span(0.5),
+                    y1=bullish_fvg_df['high'],
+                    fillcolor="rgba(0, 255, 0, 0.2)",
+                    line=dict(color="rgba(0, 255, 0, 0.6)", width=1)
                 )
+            ))
             
-            if 'ema_50' in df.columns:
-                fig.add_trace(
-                    go.Scatter(
-                        x=df['timestamp'],
-                        y=df['ema_50'],
-                        line=dict(color='rgba(255, 0, 255, 0.7)', width=1.5),
-                        name="EMA 50"
+            # Bullish FVG işaretleri
+            traces.append((
+                1, scatter, dict(
+                    x=to_x(bullish_fvg_df['timestamp']),
+                    y=bullish_fvg_df['high'] + (bullish_fvg_df['high'] * 0.003),
+                    mode='markers',
+                    marker=dict(
+                        symbol='triangle-up',
+                        size=12,
+                        color='rgba(0, 255, 0, 1)',
+                        line=dict(width=2, color='rgba(0, 255, 0, 1)')
                     ),
-                    row=1, col=1
+                    name="Bullish FVG",
+                    hovertemplate="<b>Bullish FVG</b><br>Tarih: %{x}<br>Fiyat: %{y}<extra></extra>"
                 )
+            ))
         
-        # VWAP
-        if "vwap" in selected_indicators and 'vwap' in df.columns:
-            fig.add_trace(
-                go.Scatter(
-                    x=df['timestamp'],
-                    y=df['vwap'],
-                    line=dict(color='rgba(255, 0, 255, 0.7)', width=1.5, dash='dot'),
-                    name="VWAP"
-                ),
-                row=1, col=1
-            )
-        
-        # VWEMA
-        if "vwema" in selected_indicators:
-            if 'vwema_5' in df.columns:
-                fig.add_trace(
-                    go.Scatter(
-                        x=df['timestamp'],
-                        y=df['vwema_5'],
-                        line=dict(color='rgba(0, 255, 255, 0.7)', width=1.5),
-                        name="VWEMA 5"
-                    ),
-                    row=1, col=1
+        # Bearish FVG için dikdörtgen alanlar
+        bearish_fvg_df = events(df['bearish_fvg_count'] > 0)
+        if not bearish_fvg_df.empty:
+            # Tüm alanlar tek bir dolgulu çokgen izi olarak çizilir
+            traces.append((
+                1, go.Scatter, _rectangles(
+                    x0=to_x(bearish_fvg_df['timestamp']),
+                    y0=bearish_fvg_df['low'],
+                    x1=to_x(bearish_fvg_df['timestamp']) + span(0.5),
+                    y1=bearish_fvg_df['high'],
+                    fillcolor="rgba(255, 0, 0, 0.2)",
+                    line=dict(color="rgba(255, 0, 0, 0.6)", width=1)
                 )
+            ))
             
-            if 'vwema_20' in df.columns:
-                fig.add_trace(
-                    go.Scatter(
-                        x=df['timestamp'],
-                        y=df['vwema_20'],
-                        line=dict(color='rgba(255, 255, 0, 0.7)', width=1.5),
-                        name="VWEMA 20"
+            # Bearish FVG işaretleri
+            traces.append((
+                1, scatter, dict(
+                    x=to_x(bearish_fvg_df['timestamp']),
+                    y=bearish_fvg_df['low'] - (bearish_fvg_df['low'] * 0.003),
+                    mode='markers',
+                    marker=dict(
+                        symbol='triangle-down',
+                        size=12,
+                        color='rgba(255, 0, 0, 1)',
+                        line=dict(width=2, color='rgba(255, 0, 0, 1)')
                     ),
-                    row=1, col=1
+                    name="Bearish FVG",
+                    hovertemplate="<b>Bearish FVG</b><br>Tarih: %{x}<br>Fiyat: %{y}<extra></extra>"
                 )
-        
-        # Fair Value Gap (FVG) gösterimi - Daha düzgün çizim
-        if "fvg" in selected_indicators and 'bullish_fvg_count' in df.columns and 'bearish_fvg_count' in df.columns:
-            # Bullish FVG için dikdörtgen alanlar
-            bullish_fvg_df = df[df['bullish_fvg_count'] > 0]
-            if not bullish_fvg_df.empty:
-                for _, row in bullish_fvg_df.iterrows():
-                    # FVG alanını dikdörtgen olarak çiz
-                    fig.add_shape(
-                        type="rect",
-                        x0=row['timestamp'],
-                        y0=row['low'],
-                        x1=row['timestamp'] + pd.Timedelta(minutes=30),  # 30 dakika genişlik
-                        y1=row['high'],
-                        fillcolor="rgba(0, 255, 0, 0.2)",
-                        line=dict(color="rgba(0, 255, 0, 0.6)", width=1),
-                        row=1, col=1
-                    )
-                
-                # Bullish FVG işaretleri
-                fig.add_trace(
-                    go.Scatter(
-                        x=bullish_fvg_df['timestamp'],
-                        y=bullish_fvg_df['high'] + (bullish_fvg_df['high'] * 0.003),
-                        mode='markers',
-                        marker=dict(
-                            symbol='triangle-up',
-                            size=12,
-                            color='rgba(0, 255, 0, 1)',
-                            line=dict(width=2, color='rgba(0, 255, 0, 1)')
-                        ),
-                        name="Bullish FVG",
-                        hovertemplate="<b>Bullish FVG</b><br>Tarih: %{x}<br>Fiyat: %{y}<extra></extra>"
-                    ),
-                    row=1, col=1
+            ))
+    
+    # Break of Structure (BOS) gösterimi - Daha düzgün çizim
+    if "bos" in selected_indicators and 'bullish_bos' in df.columns and 'bearish_bos' in df.columns:
+        # Bullish BOS için çizgiler ve işaretler
+        bullish_bos_df = events(df['bullish_bos'] == True)
+        if not bullish_bos_df.empty:
+            # Tüm seviyeler tek bir çizgi izi olarak çizilir
+            traces.append((
+                1, go.Scatter, _segments(
+                    x0=to_x(bullish_bos_df['timestamp']) - span(2),
+                    y0=bullish_bos_df['high'],
+                    x1=to_x(bullish_bos_df['timestamp']) + span(2),
+                    y1=bullish_bos_df['high'],
+                    line=dict(color="rgba(0, 255, 0, 0.7)", width=2, dash="dash")
                 )
+            ))
             
-            # Bearish FVG için dikdörtgen alanlar
-            bearish_fvg_df = df[df['bearish_fvg_count'] > 0]
-            if not bearish_fvg_df.empty:
-                for _, row in bearish_fvg_df.iterrows():
-                    # FVG alanını dikdörtgen olarak çiz
-                    fig.add_shape(
-                        type="rect",
-                        x0=row['timestamp'],
-                        y0=row['low'],
-                        x1=row['timestamp'] + pd.Timedelta(minutes=30),  # 30 dakika genişlik
-                        y1=row['high'],
-                        fillcolor="rgba(255, 0, 0, 0.2)",
-                        line=dict(color="rgba(255, 0, 0, 0.6)", width=1),
-                        row=1, col=1
-                    )
-                
-                # Bearish FVG işaretleri
-                fig.add_trace(
-                    go.Scatter(
-                        x=bearish_fvg_df['timestamp'],
-                        y=bearish_fvg_df['low'] - (bearish_fvg_df['low'] * 0.003),
-                        mode='markers',
-                        marker=dict(
-                            symbol='triangle-down',
-                            size=12,
-                            color='rgba(255, 0, 0, 1)',
-                            line=dict(width=2, color='rgba(255, 0, 0, 1)')
-                        ),
-                        name="Bearish FVG",
-                        hovertemplate="<b>Bearish FVG</b><br>Tarih: %{x}<br>Fiyat: %{y}<extra></extra>"
+            # Bullish BOS işaretleri
+            traces.append((
+                1, scatter, dict(
+                    x=to_x(bullish_bos_df['timestamp']),
+                    y=bullish_bos_df['high'] + (bullish_bos_df['high'] * 0.005),
+                    mode='markers+text',
+                    marker=dict(
+                        symbol='arrow-up',
+                        size=15,
+                        color='rgba(0, 255, 0, 1)',
+                        line=dict(width=2, color='rgba(0, 255, 0, 1)')
                     ),
-                    row=1, col=1
+                    text="BOS↑",
+                    textposition="top center",
+                    textfont=dict(size=10, color="green"),
+                    name="Bullish BOS",
+                    hovertemplate="<b>Bullish BOS</b><br>Tarih: %{x}<br>Seviye: %{y}<extra></extra>"
                 )
+            ))
         
-        # Break of Structure (BOS) gösterimi - Daha düzgün çizim
-        if "bos" in selected_indicators and 'bullish_bos' in df.columns and 'bearish_bos' in df.columns:
-            # Bullish BOS için çizgiler ve işaretler
-            bullish_bos_df = df[df['bullish_bos'] == True]
-            if not bullish_bos_df.empty:
-                for _, row in bullish_bos_df.iterrows():
-                    # BOS seviyesini yatay çizgi olarak çiz
-                    fig.add_shape(
-                        type="line",
-                        x0=row['timestamp'] - pd.Timedelta(hours=2),
-                        y0=row['high'],
-                        x1=row['timestamp'] + pd.Timedelta(hours=2),
-                        y1=row['high'],
-                        line=dict(color="rgba(0, 255, 0, 0.7)", width=2, dash="dash"),
-                        row=1, col=1
-                    )
-                
-                # Bullish BOS işaretleri
-                fig.add_trace(
-                    go.Scatter(
-                        x=bullish_bos_df['timestamp'],
-                        y=bullish_bos_df['high'] + (bullish_bos_df['high'] * 0.005),
-                        mode='markers+text',
-                        marker=dict(
-                            symbol='arrow-up',
-                            size=15,
-                            color='rgba(0, 255, 0, 1)',
-                            line=dict(width=2, color='rgba(0, 255, 0, 1)')
-                        ),
-                        text="BOS↑",
-                        textposition="top center",
-                        textfont=dict(size=10, color="green"),
-                        name="Bullish BOS",
-                        hovertemplate="<b>Bullish BOS</b><br>Tarih: %{x}<br>Seviye: %{y}<extra></extra>"
+        # Bearish BOS için çizgiler ve işaretler
+        bearish_bos_df = events(df['bearish_bos'] == True)
+        if not bearish_bos_df.empty:
+            # Tüm seviyeler tek bir çizgi izi olarak çizilir
+            traces.append((
+                1, go.Scatter, _segments(
+                    x0=to_x(bearish_bos_df['timestamp']) - span(2),
+                    y0=bearish_bos_df['low'],
+                    x1=to_x(bearish_bos_df['timestamp']) + span(2),
+                    y1=bearish_bos_df['low'],
+                    line=dict(color="rgba(255, 0, 0, 0.7)", width=2, dash="dash")
+                )
+            ))
+            
+            # Bearish BOS işaretleri
+            traces.append((
+                1, scatter, dict(
+                    x=to_x(bearish_bos_df['timestamp']),
+                    y=bearish_bos_df['low'] - (bearish_bos_df['low'] * 0.005),
+                    mode='markers+text',
+                    marker=dict(
+                        symbol='arrow-down',
+                        size=15,
+                        color='rgba(255, 0, 0, 1)',
+                        line=dict(width=2, color='rgba(255, 0, 0, 1)')
                     ),
-                    row=1, col=1
+                    text="BOS↓",
+                    textposition="bottom center",
+                    textfont=dict(size=10, color="red"),
+                    name="Bearish BOS",
+                    hovertemplate="<b>Bearish BOS</b><br>Tarih: %{x}<br>Seviye: %{y}<extra></extra>"
+                )
+            ))
+    
+    # FVG + BOS Kombosu gösterimi - Daha düzgün çizim
+    if "fvg_bos_combo" in selected_indicators and 'fvg_bos_combo_signal' in df.columns:
+        # Bullish Kombo için özel işaret ve alan
+        bullish_combo_df = events(df['fvg_bos_combo_signal'] == 2)
+        if not bullish_combo_df.empty:
+            # Tüm alanlar tek bir dolgulu çokgen izi olarak çizilir
+            traces.append((
+                1, go.Scatter, _rectangles(
+                    x0=to_x(bullish_combo_df['timestamp']) - span(0.25),
+                    y0=bullish_combo_df['low'],
+                    x1=to_x(bullish_combo_df['timestamp']) + span(0.75),
+                    y1=bullish_combo_df['high'],
+                    fillcolor="rgba(0, 255, 0, 0.3)",
+                    line=dict(color="rgba(0, 255, 0, 0.8)", width=2)
                 )
+            ))
             
-            # Bearish BOS için çizgiler ve işaretler
-            bearish_bos_df = df[df['bearish_bos'] == True]
-            if not bearish_bos_df.empty:
-                for _, row in bearish_bos_df.iterrows():
-                    # BOS seviyesini yatay çizgi olarak çiz
-                    fig.add_shape(
-                        type="line",
-                        x0=row['timestamp'] - pd.Timedelta(hours=2),
-                        y0=row['low'],
-                        x1=row['timestamp'] + pd.Timedelta(hours=2),
-                        y1=row['low'],
-                        line=dict(color="rgba(255, 0, 0, 0.7)", width=2, dash="dash"),
-                        row=1, col=1
-                    )
-                
-                # Bearish BOS işaretleri
-                fig.add_trace(
-                    go.Scatter(
-                        x=bearish_bos_df['timestamp'],
-                        y=bearish_bos_df['low'] - (bearish_bos_df['low'] * 0.005),
-                        mode='markers+text',
-                        marker=dict(
-                            symbol='arrow-down',
-                            size=15,
-                            color='rgba(255, 0, 0, 1)',
-                            line=dict(width=2, color='rgba(255, 0, 0, 1)')
-                        ),
-                        text="BOS↓",
-                        textposition="bottom center",
-                        textfont=dict(size=10, color="red"),
-                        name="Bearish BOS",
-                        hovertemplate="<b>Bearish BOS</b><br>Tarih: %{x}<br>Seviye: %{y}<extra></extra>"
+            # Bullish Kombo işaretleri
+            traces.append((
+                1, scatter, dict(
+                    x=to_x(bullish_combo_df['timestamp']),
+                    y=bullish_combo_df['high'] + (bullish_combo_df['high'] * 0.008),
+                    mode='markers',
+                    marker=dict(
+                        symbol='star',
+                        size=18,
+                        color='rgba(0, 255, 0, 1)',
+                        line=dict(width=3, color='rgba(0, 255, 0, 1)')
                     ),
-                    row=1, col=1
+                    name="Bullish FVG+BOS Kombo",
+                    hovertemplate="<b>🔥 Bullish FVG+BOS Kombo</b><br>Tarih: %{x}<br>Fiyat: %{y}<extra></extra>"
                 )
+            ))
         
-        # FVG + BOS Kombosu gösterimi - Daha düzgün çizim
-        if "fvg_bos_combo" in selected_indicators and 'fvg_bos_combo_signal' in df.columns:
-            # Bullish Kombo için özel işaret ve alan
-            bullish_combo_df = df[df['fvg_bos_combo_signal'] == 2]
-            if not bullish_combo_df.empty:
-                for _, row in bullish_combo_df.iterrows():
-                    # Kombo alanını vurgula
-                    fig.add_shape(
-                        type="rect",
-                        x0=row['timestamp'] - pd.Timedelta(minutes=15),
-                        y0=row['low'],
-                        x1=row['timestamp'] + pd.Timedelta(minutes=45),
-                        y1=row['high'],
-                        fillcolor="rgba(0, 255, 0, 0.3)",
-                        line=dict(color="rgba(0, 255, 0, 0.8)", width=2),
-                        row=1, col=1
-                    )
-                
-                # Bullish Kombo işaretleri
-                fig.add_trace(
-                    go.Scatter(
-                        x=bullish_combo_df['timestamp'],
-                        y=bullish_combo_df['high'] + (bullish_combo_df['high'] * 0.008),
-                        mode='markers',
-                        marker=dict(
-                            symbol='star',
-                            size=18,
-                            color='rgba(0, 255, 0, 1)',
-                            line=dict(width=3, color='rgba(0, 255, 0, 1)')
-                        ),
-                        name="Bullish FVG+BOS Kombo",
-                        hovertemplate="<b>🔥 Bullish FVG+BOS Kombo</b><br>Tarih: %{x}<br>Fiyat: %{y}<extra></extra>"
-                    ),
-                    row=1, col=1
+        # Bearish Kombo için özel işaret ve alan
+        bearish_combo_df = events(df['fvg_bos_combo_signal'] == -2)
+        if not bearish_combo_df.empty:
+            # Tüm alanlar tek bir dolgulu çokgen izi olarak çizilir
+            traces.append((
+                1, go.Scatter, _rectangles(
+                    x0=to_x(bearish_combo_df['timestamp']) - span(0.25),
+                    y0=bearish_combo_df['low'],
+                    x1=to_x(bearish_combo_df['timestamp']) + span(0.75),
+                    y1=bearish_combo_df['high'],
+                    fillcolor="rgba(255, 0, 0, 0.3)",
+                    line=dict(color="rgba(255, 0, 0, 0.8)", width=2)
                 )
+            ))
             
-            # Bearish Kombo için özel işaret ve alan
-            bearish_combo_df = df[df['fvg_bos_combo_signal'] == -2]
-            if not bearish_combo_df.empty:
-                for _, row in bearish_combo_df.iterrows():
-                    # Kombo alanını vurgula
-                    fig.add_shape(
-                        type="rect",
-                        x0=row['timestamp'] - pd.Timedelta(minutes=15),
-                        y0=row['low'],
-                        x1=row['timestamp'] + pd.Timedelta(minutes=45),
-                        y1=row['high'],
-                        fillcolor="rgba(255, 0, 0, 0.3)",
-                        line=dict(color="rgba(255, 0, 0, 0.8)", width=2),
-                        row=1, col=1
-                    )
-                
-                # Bearish Kombo işaretleri
-                fig.add_trace(
-                    go.Scatter(
-                        x=bearish_combo_df['timestamp'],
-                        y=bearish_combo_df['low'] - (bearish_combo_df['low'] * 0.008),
-                        mode='markers',
-                        marker=dict(
-                            symbol='star',
-                            size=18,
-                            color='rgba(255, 0, 0, 1)',
-                            line=dict(width=3, color='rgba(255, 0, 0, 1)')
-                        ),
-                        name="Bearish FVG+BOS Kombo",
-                        hovertemplate="<b>🔥 Bearish FVG+BOS Kombo</b><br>Tarih: %{x}<br>Fiyat: %{y}<extra></extra>"
+            # Bearish Kombo işaretleri
+            traces.append((
+                1, scatter, dict(
+                    x=to_x(bearish_combo_df['timestamp']),
+                    y=bearish_combo_df['low'] - (bearish_combo_df['low'] * 0.008),
+                    mode='markers',
+                    marker=dict(
+                        symbol='star',
+                        size=18,
+                        color='rgba(255, 0, 0, 1)',
+                        line=dict(width=3, color='rgba(255, 0, 0, 1)')
                     ),
-                    row=1, col=1
+                    name="Bearish FVG+BOS Kombo",
+                    hovertemplate="<b>🔥 Bearish FVG+BOS Kombo</b><br>Tarih: %{x}<br>Fiyat: %{y}<extra></extra>"
                 )
+            ))
+    
+    # Hacim grafiği
+    current_row = 1
+    
+    if "volume" in selected_indicators:
+        current_row += 1
         
-        # Hacim grafiği
-        current_row = 1
-        
-        if "volume" in selected_indicators:
-            current_row += 1
-            
-            # Hacim çubuklarının rengini belirle (yeşil: yükseliş, kırmızı: düşüş)
-            colors = ['green' if row['close'] >= row['open'] else 'red' for _, row in df.iterrows()]
-            
-            fig.add_trace(
-                go.Bar(
-                    x=df['timestamp'],
-                    y=df['volume'],
-                    marker_color=colors,
-                    name="Hacim"
-                ),
-                row=current_row, col=1
+        traces.append((
+            current_row, go.Bar, dict(
+                x=to_x(candles['timestamp']),
+                y=candles['volume'],
+                marker_color=styles['direction'],
+                marker_colorscale=UP_DOWN_COLORSCALE,
+                marker_cmin=0,
+                marker_cmax=1,
+                name="Hacim"
             )
+        ))
+    
+    # RSI grafiği
+    if "rsi" in selected_indicators and 'rsi' in df.columns:
+        current_row += 1
         
-        # RSI grafiği
-        if "rsi" in selected_indicators and 'rsi' in df.columns:
-            current_row += 1
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=df['timestamp'],
-                    y=df['rsi'],
-                    line=dict(color='blue', width=1),
-                    name="RSI"
-                ),
-                row=current_row, col=1
-            )
-            
-            # Aşırı alım/satım çizgileri
-            fig.add_trace(
-                go.Scatter(
-                    x=[df['timestamp'].iloc[0], df['timestamp'].iloc[-1]],
-                    y=[30, 30],
-                    line=dict(color='green', width=1, dash='dash'),
-                    name="Aşırı Satım"
-                ),
-                row=current_row, col=1
+        traces.append((
+            current_row, scatter, dict(
+                **points(df['rsi']),
+                line=dict(color='blue', width=1),
+                name="RSI"
             )
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=[df['timestamp'].iloc[0], df['timestamp'].iloc[-1]],
-                    y=[70, 70],
-                    line=dict(color='red', width=1, dash='dash'),
-                    name="Aşırı Alım"
-                ),
-                row=current_row, col=1
+        ))
+        
+        # Aşırı alım/satım çizgileri
+        traces.append((
+            current_row, go.Scatter, dict(
+                x=[xs[0], xs[-1]],
+                y=[30, 30],
+                line=dict(color='green', width=1, dash='dash'),
+                name="Aşırı Satım"
             )
+        ))
         
-        # MACD grafiği
-        if "macd" in selected_indicators and 'macd' in df.columns and 'macd_signal' in df.columns:
-            current_row += 1
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=df['timestamp'],
-                    y=df['macd'],
-                    line=dict(color='blue', width=1.5),
-                    name="MACD"
-                ),
-                row=current_row, col=1
+        traces.append((
+            current_row, go.Scatter, dict(
+                x=[xs[0], xs[-1]],
+                y=[70, 70],
+                line=dict(color='red', width=1, dash='dash'),
+                name="Aşırı Alım"
             )
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=df['timestamp'],
-                    y=df['macd_signal'],
-                    line=dict(color='red', width=1),
-                    name="Sinyal"
-                ),
-                row=current_row, col=1
+        ))
+    
+    # MACD grafiği
+    if "macd" in selected_indicators and 'macd' in df.columns and 'macd_signal' in df.columns:
+        current_row += 1
+        
+        traces.append((
+            current_row, scatter, dict(
+                **points(df['macd']),
+                line=dict(color='blue', width=1.5),
+                name="MACD"
             )
-            
-            # MACD histogramı
-            colors = ['green' if val >= 0 else 'red' for val in df['macd'] - df['macd_signal']]
-            
-            fig.add_trace(
-                go.Bar(
-                    x=df['timestamp'],
-                    y=df['macd'] - df['macd_signal'],
-                    marker_color=colors,
-                    name="MACD Hist"
-                ),
-                row=current_row, col=1
+        ))
+        
+        traces.append((
+            current_row, scatter, dict(
+                **points(df['macd_signal']),
+                line=dict(color='red', width=1),
+                name="Sinyal"
             )
+        ))
         
-        # Grafik düzenini ayarla - Daha büyük ve detaylı grafik için
-        fig.update_layout(
-            title=dict(
-                text=f"{symbol} Grafiği",
-                font=dict(size=20, color='white'),
-                x=0.5
-            ),
-            xaxis_title="Tarih",
-            yaxis_title="Fiyat",
-            template="plotly_dark",
-            xaxis_rangeslider_visible=False,
-            height=800,  # Grafik yüksekliğini daha da artır (700'den 800'e)
-            margin=dict(l=60, r=60, t=100, b=60),  # Kenar boşluklarını optimize et
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1,
-                font=dict(size=12)
-            ),
-            hovermode="x unified",  # Fare imleci aynı x değerindeki tüm noktaları göstersin
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white', size=12)
-        )
+        # MACD histogramı
+        index = sample(styles['macd_hist'])
         
-        # X ekseni formatını ayarla
-        fig.update_xaxes(
-            rangeslider_visible=False,
-            rangebreaks=[
-                dict(bounds=["sat", "mon"])  # Hafta sonlarını gizle
-            ]
-        )
+        traces.append((
+            current_row, go.Bar, dict(
+                x=xs[index],
+                y=styles['macd_hist'][index],
+                marker_color=styles['macd_hist_direction'][index],
+                marker_colorscale=UP_DOWN_COLORSCALE,
+                marker_cmin=0,
+                marker_cmax=1,
+                name="MACD Hist"
+            )
+        ))
+    
+    return traces, xaxis
+
+def _chart_figure(symbol, selected_indicators, traces, xaxis):
+    """
+    Alt grafik düzenini kurar ve izleri ekler.
+    
+    Returns:
+        plotly.graph_objects.Figure: Mum grafiği
+    """
+    # Subplot sayısını belirle
+    subplot_count = 1  # Ana grafik için
+    
+    if "volume" in selected_indicators:
+        subplot_count += 1
+    
+    if "rsi" in selected_indicators:
+        subplot_count += 1
+    
+    if "macd" in selected_indicators:
+        subplot_count += 1
+    
+    # Subplot yüksekliklerini belirle - Ana grafik için daha fazla alan ayır
+    row_heights = [0.7]  # Ana grafik için daha büyük oran (0.6'dan 0.7'ye)
+    
+    if "volume" in selected_indicators:
+        row_heights.append(0.1)  # Hacim grafiği için
+    
+    if "rsi" in selected_indicators:
+        row_heights.append(0.15)  # RSI grafiği için küçültüldü (0.2'den 0.15'e)
+    
+    if "macd" in selected_indicators:
+        row_heights.append(0.15)  # MACD grafiği için küçültüldü (0.2'den 0.15'e)
+    
+    # Subplot düzenini oluştur
+    fig = make_subplots(
+        rows=subplot_count,
+        cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.01,  # Dikey boşluğu azalt (0.02'den 0.01'e)
+        row_heights=row_heights,
+        subplot_titles=["Fiyat"] + (["Hacim"] if "volume" in selected_indicators else []) + (["RSI"] if "rsi" in selected_indicators else []) + (["MACD"] if "macd" in selected_indicators else [])
+    )
+    
+    for row, trace_type, properties in traces:
+        fig.add_trace(trace_type(**properties), row=row, col=1)
+    
+    # Grafik düzenini ayarla - Daha büyük ve detaylı grafik için
+    fig.update_layout(
+        title=dict(
+            text=f"{symbol} Grafiği",
+            font=dict(size=20, color='white'),
+            x=0.5
+        ),
+        uirevision=symbol,  # Veri yenilense de yakınlaştırma/kaydırma ve gösterge seçimleri korunur
+        xaxis_title="Tarih",
+        yaxis_title="Fiyat",
+        template="plotly_dark",
+        xaxis_rangeslider_visible=False,
+        height=800,  # Grafik yüksekliğini daha da artır (700'den 800'e)
+        margin=dict(l=60, r=60, t=100, b=60),  # Kenar boşluklarını optimize et
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            font=dict(size=12)
+        ),
+        hovermode="x unified",  # Fare imleci aynı x değerindeki tüm noktaları göstersin
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white', size=12)
+    )
+    
+    # X ekseni formatını ayarla (kripto piyasaları 7/24 açık olduğu için rangebreak kullanılmaz)
+    fig.update_xaxes(rangeslider_visible=False, **xaxis)
+    
+    return fig
+
+def create_candlestick_chart(df, symbol, selected_indicators=None, high_density=None, interval=None, axis_mode=None):
+    """
+    Mum grafiği oluşturur.
+    
+    Yüksek yoğunluk modunda çizgi serileri WebGL (``Scattergl``) ile çizilir; yalnızca son
+    ``CHART_VISIBLE_CANDLES`` mum gönderilir ve son ``CHART_FULL_RESOLUTION_CANDLES`` mumdan eski
+    kısım ``CHART_MAX_POINTS`` bütçesine seyreltilir (çizgiler LTTB, mumlar min/max kovaları ile).
+    FVG/BOS/kombo katmanlarında olay türü başına en son ``CHART_MAX_EVENTS`` olay çizilir.
+    
+    Args:
+        df (pd.DataFrame): Veri çerçevesi
+        symbol (str): Sembol
+        selected_indicators (list, optional): Seçilen indikatörler
+        high_density (bool, optional): Yüksek yoğunluk modu; None ise mum sayısı
+            ``CHART_HIGH_DENSITY_THRESHOLD`` değerini aşınca açılır
+        interval (str, optional): Zaman aralığı; FVG/BOS alan genişlikleri buna göre ölçeklenir
+            (verilmezse mumlar arasındaki süreden hesaplanır)
+        axis_mode (str, optional): Zaman ekseni modu (``AXIS_MODES``); None ise ``CHART_AXIS_MODE``
+    
+    Returns:
+        plotly.graph_objects.Figure: Mum grafiği
+    """
+    try:
+        if selected_indicators is None:
+            selected_indicators = []
         
-        return fig
+        if high_density is None:
+            high_density = len(df) > CHART_HIGH_DENSITY_THRESHOLD
+        
+        traces, xaxis = _chart_traces(df, selected_indicators, high_density, interval, axis_mode or CHART_AXIS_MODE)
+        return _chart_figure(symbol, selected_indicators, traces, xaxis)
     except Exception as e:
         logger.error(f"Mum grafiği oluşturulurken hata: {e}")
         # Boş bir grafik döndür
         return go.Figure()
 
+class ChartCache:
+    """
+    (sembol, zaman aralığı, indikatörler) anahtarlı mum grafiği iskeleti önbelleği.
+    
+    İlk çizimde grafik (alt grafikler, düzen ve izler) kurulur. Sonraki yenilemelerde iz yapısı
+    aynıysa yalnızca izlerin veri dizileri (``TRACE_DATA_KEYS``) yerinde değiştirilir; iz yapısı
+    değiştiyse (ör. ilk FVG olayı oluştu) grafik yeniden kurulur. Grafikler değiştirilebilir nesneler
+    olduğu için önbellek oturumlar arasında paylaşılmamalıdır.
+    """
+    
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self._figures = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get_chart(self, df, symbol, interval, selected_indicators=None, high_density=None, axis_mode=None):
+        """
+        Mum grafiğini önbellekteki iskeleti güncelleyerek veya yeniden kurarak döndürür.
+        
+        Args:
+            df (pd.DataFrame): Veri çerçevesi
+            symbol (str): Sembol
+            interval (str): Zaman aralığı
+            selected_indicators (list, optional): Seçilen indikatörler
+            high_density (bool, optional): Yüksek yoğunluk modu (bkz. ``create_candlestick_chart``)
+            axis_mode (str, optional): Zaman ekseni modu (bkz. ``create_candlestick_chart``)
+        
+        Returns:
+            plotly.graph_objects.Figure: Mum grafiği
+        """
+        try:
+            selected_indicators = list(selected_indicators or [])
+            if high_density is None:
+                high_density = len(df) > CHART_HIGH_DENSITY_THRESHOLD
+            
+            axis_mode = axis_mode or CHART_AXIS_MODE
+            
+            key = (symbol, interval, tuple(selected_indicators), high_density, axis_mode)
+            traces, xaxis = _chart_traces(df, selected_indicators, high_density, interval, axis_mode)
+            signature = tuple(
+                (row, trace_type, properties.get('name')) for row, trace_type, properties in traces
+            )
+            
+            with self._lock:
+                cached = self._figures.get(key)
+                if cached is not None and cached[0] == signature:
+                    self._figures.move_to_end(key)
+                    self.hits += 1
+                    fig = cached[1]
+                    with fig.batch_update():
+                        for trace, (_, _, properties) in zip(fig.data, traces):
+                            trace.update({name: properties[name] for name in TRACE_DATA_KEYS if name in properties})
+                        fig.update_xaxes(**xaxis)
+                    return fig
+                
+                self.misses += 1
+                fig = _chart_figure(symbol, selected_indicators, traces, xaxis)
+                self._figures[key] = (signature, fig)
+                self._figures.move_to_end(key)
+                while len(self._figures) > self.max_entries:
+                    self._figures.popitem(last=False)
+                return fig
+        except Exception as e:
+            logger.error(f"Mum grafiği güncellenirken hata: {e}")
+            return go.Figure()
+
 def get_time_periods():
     """
     Zaman periyotlarını döndürür.